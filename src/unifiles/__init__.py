@@ -15,12 +15,20 @@ from .exceptions import (
 
 # Excel 模块
 from .excel import (
+    available_excel_engines,
+    excel_to_sqlite,
+    fingerprint_excel,
     get_column_names,
     get_excel_info,
     get_sheet_info,
     get_sheet_names,
+    iter_excel_rows,
     read_excel,
+    read_excel_chunks,
+    read_excel_many,
+    read_excel_sheets,
     write_excel,
+    write_excel_rows,
 )
 
 # Word 模块
@@ -46,7 +54,10 @@ from .yaml import read_yaml, write_yaml, yaml_to_json
 from .sqlite import get_database_info, get_schema, get_tables, query
 
 # PDF 模块
-from .pdf import extract_tables, extract_text
+from .pdf import extract_pdf, extract_tables, extract_text, iter_pdf_pages
+
+# 磁盘缓存
+from .cache import clear_cache, configure_cache
 
 __all__ = [
     "__version__",
@@ -55,11 +66,19 @@ __all__ = [
     "FileReadError",
     "FileWriteError",
     "read_excel",
+    "iter_excel_rows",
+    "read_excel_chunks",
+    "read_excel_many",
+    "read_excel_sheets",
     "write_excel",
+    "write_excel_rows",
     "get_sheet_names",
     "get_column_names",
     "get_sheet_info",
     "get_excel_info",
+    "available_excel_engines",
+    "fingerprint_excel",
+    "excel_to_sqlite",
     "read_docx",
     "write_docx",
     "extract_images_docx",
@@ -80,4 +99,8 @@ __all__ = [
     "get_database_info",
     "extract_text",
     "extract_tables",
+    "extract_pdf",
+    "iter_pdf_pages",
+    "clear_cache",
+    "configure_cache",
 ]
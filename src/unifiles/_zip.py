@@ -0,0 +1,107 @@
+"""zip 容器（xlsx、docx）的压缩配置与条目复制。"""
+
+import zipfile
+from collections.abc import Iterator
+from typing import IO, Any
+
+# 压缩配置 -> (压缩方式, 压缩级别)；压缩级别 None 表示 zlib 的默认级别
+COMPRESSION_PROFILES: dict[str, tuple[int, int | None]] = {
+    "fastest": (zipfile.ZIP_DEFLATED, 1),
+    "default": (zipfile.ZIP_DEFLATED, None),
+    "smallest": (zipfile.ZIP_DEFLATED, 9),
+    "store": (zipfile.ZIP_STORED, None),
+}
+
+
+def zip_options(compression: str) -> dict[str, Any]:
+    """返回创建 ``zipfile.ZipFile`` 时使用的压缩参数。
+
+    Args:
+        compression: 压缩配置：``"fastest"``、``"default"``、``"smallest"`` 或 ``"store"``
+
+    Returns:
+        ``compression`` 与 ``compresslevel`` 关键字参数
+
+    Raises:
+        ValueError: 压缩配置无效
+    """
+    profile = COMPRESSION_PROFILES.get(compression)
+    if profile is None:
+        raise ValueError(
+            "compression 必须为 'fastest'、'default'、'smallest' 或 'store': "
+            f"{compression}"
+        )
+    return {"compression": profile[0], "compresslevel": profile[1]}
+
+
+# copy_raw 直接写入压缩数据时依赖的 ZipFile 内部属性
+_RAW_COPY_ATTRIBUTES = ("fp", "start_dir", "filelist", "NameToInfo", "_didModify")
+
+
+def copy_raw(
+    source: zipfile.ZipFile,
+    raw_source: IO[bytes],
+    info: zipfile.ZipInfo,
+    target: zipfile.ZipFile,
+) -> None:
+    """将 source 中的条目复制到 target，尽量按压缩后的原始字节复制，不解压也不重新压缩。
+
+    zipfile 没有复制原始数据的公开接口：这里按 ``ZipFile.open(..., "w")`` 的方式写入
+    本地文件头与压缩数据，并同步维护 target 的目录状态（``fp``、``start_dir``、
+    ``filelist``、``NameToInfo``、``_didModify``）。当前 Python 的 ZipFile 缺少这些属性
+    时，改为用公开接口解压后按原来的压缩方式重新写入，结果相同，只是更慢。
+
+    Args:
+        source: 源 zip 文件
+        raw_source: 以二进制方式打开的源 zip 文件，用于读取原始字节
+        info: 要复制的条目
+        target: 以写入模式打开、当前没有未关闭的写入流的 zip 文件
+    """
+    copied = zipfile.ZipInfo(info.filename, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.external_attr = info.external_attr
+    copied.create_system = info.create_system
+    if not all(hasattr(target, name) for name in _RAW_COPY_ATTRIBUTES):
+        target.writestr(copied, source.read(info))
+        return
+
+    copied.CRC = info.CRC
+    copied.compress_size = info.compress_size
+    copied.file_size = info.file_size
+    # 原条目的数据描述符不复制，大小与 CRC 直接写在本地文件头中
+    copied.flag_bits = info.flag_bits & ~0x08
+
+    fp: Any = target.fp
+    fp.seek(target.start_dir)
+    copied.header_offset = fp.tell()
+    fp.write(copied.FileHeader())
+    for block in raw_blocks(raw_source, info):
+        fp.write(block)
+    target.start_dir = fp.tell()
+    target.filelist.append(copied)
+    target.NameToInfo[copied.filename] = copied
+    target._didModify = True  # type: ignore[attr-defined]
+
+
+def raw_blocks(raw_source: IO[bytes], info: zipfile.ZipInfo) -> Iterator[bytes]:
+    """逐块产出 zip 条目压缩后的原始字节，不解压。
+
+    Args:
+        raw_source: 以二进制方式打开的 zip 文件
+        info: 条目信息
+
+    Yields:
+        压缩数据块
+    """
+    # 本地文件头中的文件名与扩展字段长度可能与中央目录不同，需从本地文件头读取
+    raw_source.seek(info.header_offset + 26)
+    name_length = int.from_bytes(raw_source.read(2), "little")
+    extra_length = int.from_bytes(raw_source.read(2), "little")
+    raw_source.seek(info.header_offset + 30 + name_length + extra_length)
+    remaining = info.compress_size
+    while remaining:
+        block = raw_source.read(min(remaining, 1024 * 1024))
+        if not block:
+            raise zipfile.BadZipFile(f"zip 条目数据不完整: {info.filename}")
+        yield block
+        remaining -= len(block)
@@ -0,0 +1,231 @@
+"""磁盘缓存模块。
+
+将解析结果保存在磁盘上的缓存目录中，同一个未修改的源文件再次读取时直接加载
+缓存，不再重新解析。缓存键包含源文件的绝对路径、大小、修改时间和内容哈希，
+源文件变化后旧条目不会再被命中，并随 LRU 淘汰清除。缓存总大小超过上限时，
+按最近使用时间淘汰最旧的条目。
+
+每个条目是一组 numpy 数组，以 ``.npz`` 格式保存，加载时不允许 pickle：缓存目录
+中的文件即使被他人篡改，也不会在加载时执行任意代码。
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, cast
+
+import numpy as np
+
+# 默认缓存总大小上限（字节）
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+# 进程内最多记住的源文件内容哈希数量
+MAX_CONTENT_HASHES = 256
+
+_options: dict[str, Any] = {"cache_dir": None, "max_size": DEFAULT_MAX_SIZE}
+_lock = threading.Lock()
+# (路径, 大小, 修改时间) -> 内容哈希，避免同一进程内重复计算未修改文件的哈希（LRU）
+_content_hashes: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+# 缓存条目文件的扩展名
+_SUFFIX = ".npz"
+
+
+def configure_cache(cache_dir: str | None = None, max_size: int | None = None) -> None:
+    """设置磁盘缓存的目录和大小上限。
+
+    只修改传入的参数，未传入（为 None）的参数保持当前设置。
+
+    Args:
+        cache_dir: 缓存目录，None 表示保持当前设置；空字符串表示恢复默认：使用
+            环境变量 ``UNIFILES_CACHE_DIR``，未设置时为 ``~/.cache/unifiles``。
+            缓存目录应只有当前用户可写，新建的目录权限为 0o700
+        max_size: 缓存总大小上限（字节），None 表示保持当前设置（默认 1 GiB）
+
+    Raises:
+        ValueError: max_size 无效
+
+    Example:
+        >>> configure_cache(cache_dir="/data/unifiles-cache", max_size=512 * 1024**2)
+        >>> df = read_excel("report.xlsx", cache=True)
+        >>> configure_cache(max_size=2 * 1024**3)  # 缓存目录保持不变
+    """
+    if max_size is not None and max_size < 0:
+        raise ValueError(f"max_size 必须为非负整数: {max_size}")
+    with _lock:
+        if cache_dir is not None:
+            _options["cache_dir"] = cache_dir or None
+        if max_size is not None:
+            _options["max_size"] = max_size
+
+
+def clear_cache() -> None:
+    """删除缓存目录中的全部缓存条目。"""
+    root = get_cache_dir()
+    if not root.exists():
+        return
+    with _lock:
+        for entry in root.glob(f"*/*{_SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+
+def get_cache_dir() -> Path:
+    """返回当前使用的缓存目录。
+
+    Returns:
+        缓存目录路径（可能尚未创建）
+    """
+    cache_dir = _options["cache_dir"] or os.environ.get("UNIFILES_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / ".cache" / "unifiles"
+
+
+def _content_hash(path: Path, size: int, mtime_ns: int) -> str:
+    key = (str(path), size, mtime_ns)
+    with _lock:
+        digest = _content_hashes.get(key)
+        if digest is not None:
+            _content_hashes.move_to_end(key)
+            return digest
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(block)
+    digest = hasher.hexdigest()
+    with _lock:
+        _content_hashes[key] = digest
+        while len(_content_hashes) > MAX_CONTENT_HASHES:
+            _content_hashes.popitem(last=False)
+    return digest
+
+
+def cache_key(file_path: str, *params: Any) -> str:
+    """由源文件与读取参数生成缓存键。
+
+    Args:
+        file_path: 源文件路径
+        *params: 影响解析结果的参数（使用 repr 参与哈希，应为简单值）
+
+    Returns:
+        缓存键（十六进制字符串）
+    """
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    content = _content_hash(path, stat.st_size, stat.st_mtime_ns)
+    source = repr((str(path), stat.st_size, stat.st_mtime_ns, content, params))
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def pack_strings(strings: list[str]) -> dict[str, np.ndarray]:
+    """将字符串列表编码为数组：全部字符串拼接后的 UTF-8 字节与每个字符串的终点。
+
+    Args:
+        strings: 字符串列表
+
+    Returns:
+        可由 ``unpack_strings`` 还原的数组（``"data"``、``"ends"``）
+    """
+    data = "".join(strings).encode("utf-8", "surrogatepass")
+    ends = np.cumsum([len(text) for text in strings], dtype=np.int64)
+    return {"data": np.frombuffer(data, dtype=np.uint8), "ends": ends}
+
+
+def unpack_strings(arrays: dict[str, np.ndarray]) -> list[str]:
+    """还原 ``pack_strings`` 编码的字符串列表。
+
+    Args:
+        arrays: ``pack_strings`` 的返回值
+
+    Returns:
+        字符串列表
+    """
+    text = arrays["data"].tobytes().decode("utf-8", "surrogatepass")
+    ends = arrays["ends"].tolist()
+    return [text[start:end] for start, end in zip([0, *ends], ends)]
+
+
+def load_entry(namespace: str, key: str) -> dict[str, np.ndarray] | None:
+    """读取缓存条目，命中时更新其最近使用时间。
+
+    Args:
+        namespace: 缓存命名空间（如 "excel"）
+        key: ``cache_key`` 生成的缓存键
+
+    Returns:
+        缓存的数组（名称 -> 数组），未命中或条目损坏时返回 None
+    """
+    entry = get_cache_dir() / namespace / f"{key}{_SUFFIX}"
+    try:
+        with np.load(entry, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        os.utime(entry)
+        return arrays
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # 条目损坏（如写入中断）时丢弃
+        entry.unlink(missing_ok=True)
+        return None
+
+
+def store_entry(namespace: str, key: str, arrays: dict[str, np.ndarray]) -> None:
+    """写入缓存条目，并在超过大小上限时淘汰最久未使用的条目。
+
+    写入失败（如目录无权限、磁盘已满）时静默跳过，不影响读取结果。
+
+    Args:
+        namespace: 缓存命名空间
+        key: ``cache_key`` 生成的缓存键
+        arrays: 要缓存的数组（名称 -> 数组，不能是 object 数组）
+    """
+    store_entries(namespace, {key: arrays})
+
+
+def store_entries(namespace: str, entries: dict[str, dict[str, np.ndarray]]) -> None:
+    """批量写入缓存条目，全部写入后只检查一次大小上限。
+
+    写入失败（如目录无权限、磁盘已满）时静默跳过，不影响读取结果。
+
+    Args:
+        namespace: 缓存命名空间
+        entries: 缓存键 -> 要缓存的数组（名称 -> 数组，不能是 object 数组）
+    """
+    for arrays in entries.values():
+        for name, array in arrays.items():
+            if array.dtype.hasobject:
+                raise TypeError(f"缓存条目不能包含 object 数组: {name}")
+    directory = get_cache_dir() / namespace
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        for key, arrays in entries.items():
+            # 先写入临时文件再原子替换，并发读取不会读到不完整的条目
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, **cast(dict[str, Any], arrays))
+                os.replace(temp_path, directory / f"{key}{_SUFFIX}")
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        _evict(_options["max_size"])
+    except OSError:
+        return
+
+
+def _evict(max_size: int) -> None:
+    with _lock:
+        entries = []
+        for entry in get_cache_dir().glob(f"*/*{_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
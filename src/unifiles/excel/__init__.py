@@ -0,0 +1,39 @@
+"""Excel 文件操作模块。
+
+提供 Excel 文件的读取、写入和查询功能。
+"""
+
+from .convert import excel_to_sqlite
+from .info import (
+    available_excel_engines,
+    fingerprint_excel,
+    get_column_names,
+    get_excel_info,
+    get_sheet_info,
+    get_sheet_names,
+)
+from .read import (
+    iter_excel_rows,
+    read_excel,
+    read_excel_chunks,
+    read_excel_many,
+    read_excel_sheets,
+)
+from .write import write_excel, write_excel_rows
+
+__all__ = [
+    "read_excel",
+    "iter_excel_rows",
+    "read_excel_chunks",
+    "read_excel_many",
+    "read_excel_sheets",
+    "write_excel",
+    "write_excel_rows",
+    "get_sheet_names",
+    "get_column_names",
+    "get_sheet_info",
+    "get_excel_info",
+    "available_excel_engines",
+    "fingerprint_excel",
+    "excel_to_sqlite",
+]
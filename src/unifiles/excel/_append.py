@@ -0,0 +1,414 @@
+"""向已有 xlsx 工作簿追加或替换工作表。
+
+未改动的部件（其他工作表、共享字符串表、图片等）按压缩后的原始字节复制到新的
+zip 文件中，不解压也不重新压缩；只生成目标工作表的 XML，并用 XML 解析器更新
+workbook.xml、工作簿关系文件、[Content_Types].xml 以及（需要日期格式时）
+styles.xml。耗时主要取决于新工作表的大小，而不是整个工作簿的大小。
+"""
+
+import datetime
+import os
+import posixpath
+import shutil
+import tempfile
+import zipfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import IO, Any, cast
+from xml.dom import minidom
+from xml.sax.saxutils import escape
+
+import pandas as pd
+from openpyxl.cell.cell import ERROR_CODES, ILLEGAL_CHARACTERS_RE
+from openpyxl.utils.cell import get_column_letter
+from openpyxl.utils.datetime import to_excel
+
+from .._zip import copy_raw, zip_options
+from ._common import check_sheet_names, frame_rows
+from ._xlsx import XlsxBook, rels_path
+
+_WORKSHEET_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+)
+_WORKSHEET_REL_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
+)
+_RELATIONSHIP_NAMESPACES = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "http://purl.oclc.org/ooxml/officeDocument/relationships",
+)
+# 新增单元格样式使用的内置数字格式：日期时间、日期、时间、时间间隔
+NUMBER_FORMATS = {"datetime": 22, "date": 14, "time": 21, "timedelta": 46}
+# 每次写入 zip 的行数
+_BATCH_ROWS = 1000
+
+
+def append_sheets(
+    file_path: str,
+    sheets: dict[str, pd.DataFrame],
+    replace: bool,
+    compression: str = "default",
+) -> None:
+    """向已有工作簿追加工作表，或替换同名工作表。
+
+    Args:
+        file_path: 已有的 xlsx/xlsm 文件路径（原子替换）
+        sheets: 工作表名称 -> DataFrame
+        replace: 同名工作表（不区分大小写）已存在时是否替换（保留原工作表的名称）；
+            为 False 时抛出 ValueError
+        compression: 新写入部件的 zip 压缩配置（复制的条目保持原来的压缩方式）
+
+    Raises:
+        ValueError: 工作表名称无效或重复，或工作表已存在（replace=False）
+    """
+    check_sheet_names(list(sheets))
+    with XlsxBook(file_path) as book:
+        existing = dict(book.sheets)
+        epoch = book.epoch
+        workbook_part = book.workbook_part
+        styles_part = book.styles_part
+    # Excel 的工作表名称不区分大小写：与已有工作表同名时使用已有的名称
+    existing_names = {name.lower(): name for name in existing}
+    renamed: dict[str, pd.DataFrame] = {}
+    for name, df in sheets.items():
+        if name.lower() in existing_names:
+            if not replace:
+                raise ValueError(f"工作表已存在: {name}")
+            name = existing_names[name.lower()]
+        renamed[name] = df
+    sheets = renamed
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".xlsx.tmp")
+    os.close(fd)
+    try:
+        with (
+            zipfile.ZipFile(file_path) as source,
+            open(file_path, "rb") as raw_source,
+            zipfile.ZipFile(temp_path, "w", **zip_options(compression)) as target,
+        ):
+            names = set(source.namelist())
+            workbook_rels = rels_path(workbook_part)
+            edits = _Manifests(
+                workbook=source.read(workbook_part),
+                rels=source.read(workbook_rels),
+                content_types=source.read("[Content_Types].xml"),
+                styles=source.read(styles_part) if styles_part else None,
+            )
+
+            # 规划每个工作表写入的部件
+            parts: dict[str, str] = {}
+            dropped: set[str] = set()
+            for name in sheets:
+                if name in existing:
+                    part = existing[name]
+                    # 旧工作表的关系（批注、绘图等）不再适用
+                    dropped.add(rels_path(part))
+                    # 计算链引用了旧工作表中的公式单元格，删除后由 Excel 重建
+                    dropped.update(edits.drop_calc_chain(workbook_part))
+                else:
+                    part = _new_sheet_part(workbook_part, names | set(parts.values()))
+                    edits.add_sheet(name, workbook_part, part)
+                parts[name] = part
+
+            styles = _StyleIds(edits)
+            rewritten = {
+                workbook_part,
+                workbook_rels,
+                "[Content_Types].xml",
+                *parts.values(),
+            }
+            if styles_part:
+                rewritten.add(styles_part)
+
+            for info in source.infolist():
+                if info.filename not in rewritten and info.filename not in dropped:
+                    copy_raw(source, raw_source, info, target)
+
+            for name, part in parts.items():
+                with target.open(part, "w", force_zip64=True) as stream:
+                    write_sheet_xml(
+                        stream, sheets[name], edits.namespace, epoch, styles
+                    )
+
+            target.writestr(workbook_part, edits.workbook)
+            target.writestr(workbook_rels, edits.rels)
+            target.writestr("[Content_Types].xml", edits.content_types)
+            if styles_part and edits.styles is not None:
+                target.writestr(styles_part, edits.styles)
+
+        shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+class _Manifests:
+    """用 XML 解析器编辑工作簿的清单文件。
+
+    使用 minidom 而不是 ElementTree：序列化时保留原有的命名空间前缀与声明（如
+    ``mc:Ignorable`` 引用的前缀），Excel 依赖这些声明。未修改的文件保持原始字节。
+    """
+
+    def __init__(
+        self,
+        workbook: bytes,
+        rels: bytes,
+        content_types: bytes,
+        styles: bytes | None,
+    ) -> None:
+        self._original = {
+            "workbook": workbook,
+            "rels": rels,
+            "content_types": content_types,
+            "styles": styles,
+        }
+        self._documents: dict[str, minidom.Document] = {}
+        self.namespace = self._root("workbook").namespaceURI or ""
+
+    def _root(self, name: str) -> minidom.Element:
+        """返回清单文件的根元素，首次访问时解析（styles.xml 只在需要时解析）。"""
+        document = self._documents.get(name)
+        if document is None:
+            raw = self._original[name]
+            if raw is None:
+                raise ValueError("工作簿缺少样式表，无法写入日期单元格")
+            document = self._documents[name] = minidom.parseString(raw)
+        return cast(minidom.Element, document.documentElement)
+
+    def _serialize(self, name: str) -> bytes | None:
+        document = self._documents.get(name)
+        if document is None:
+            return self._original[name]
+        return document.toxml(encoding="UTF-8")
+
+    @property
+    def workbook(self) -> bytes:
+        return cast(bytes, self._serialize("workbook"))
+
+    @property
+    def rels(self) -> bytes:
+        return cast(bytes, self._serialize("rels"))
+
+    @property
+    def content_types(self) -> bytes:
+        return cast(bytes, self._serialize("content_types"))
+
+    @property
+    def styles(self) -> bytes | None:
+        return self._serialize("styles")
+
+    def add_sheet(self, name: str, workbook_part: str, part: str) -> None:
+        rels = self._root("rels")
+        relationships = _children(rels, "Relationship")
+        rel_ids = {element.getAttribute("Id") for element in relationships}
+        number = len(rel_ids) + 1
+        while f"rId{number}" in rel_ids:
+            number += 1
+        rel_id = f"rId{number}"
+        rel_type = next(
+            (
+                element.getAttribute("Type")
+                for element in relationships
+                if element.getAttribute("Type").endswith("/worksheet")
+            ),
+            _WORKSHEET_REL_TYPE,
+        )
+        target = posixpath.relpath(part, posixpath.dirname(workbook_part))
+        _append_element(
+            rels, "Relationship", {"Id": rel_id, "Type": rel_type, "Target": target}
+        )
+
+        _append_element(
+            self._root("content_types"),
+            "Override",
+            {"PartName": f"/{part}", "ContentType": _WORKSHEET_CONTENT_TYPE},
+        )
+
+        workbook = self._root("workbook")
+        sheets = _children(workbook, "sheets")
+        if not sheets:
+            raise ValueError("清单文件缺少 sheets 元素")
+        sheet_ids = [
+            int(element.getAttribute("sheetId"))
+            for element in _children(sheets[0], "sheet")
+            if element.getAttribute("sheetId").isdigit()
+        ]
+        # 命名空间前缀可能只在其他 sheet 元素上局部声明，这里总是单独声明
+        _append_element(
+            sheets[0],
+            "sheet",
+            {
+                "xmlns:r": _relationship_namespace(workbook),
+                "name": name,
+                "sheetId": str(max(sheet_ids, default=0) + 1),
+                "r:id": rel_id,
+            },
+        )
+
+    def drop_calc_chain(self, workbook_part: str) -> set[str]:
+        rels = self._root("rels")
+        for element in _children(rels, "Relationship"):
+            if element.getAttribute("Type").endswith("/calcChain"):
+                break
+        else:
+            return set()
+        rels.removeChild(element)
+        target = element.getAttribute("Target")
+        if not target:
+            return set()
+        if target.startswith("/"):
+            part = target.lstrip("/")
+        else:
+            part = posixpath.normpath(
+                posixpath.join(posixpath.dirname(workbook_part), target)
+            )
+        content_types = self._root("content_types")
+        for override in _children(content_types, "Override"):
+            if override.getAttribute("PartName") == f"/{part}":
+                content_types.removeChild(override)
+        return {part}
+
+    def add_cell_style(self, number_format_id: int) -> int:
+        """在 cellXfs 末尾追加一个只设置数字格式的单元格样式，返回其索引。"""
+        cell_xfs = _children(self._root("styles"), "cellXfs")
+        if not cell_xfs:
+            raise ValueError("工作簿样式表缺少 cellXfs")
+        index = len(_children(cell_xfs[0], "xf"))
+        _append_element(
+            cell_xfs[0],
+            "xf",
+            {
+                "numFmtId": str(number_format_id),
+                "fontId": "0",
+                "fillId": "0",
+                "borderId": "0",
+                "xfId": "0",
+                "applyNumberFormat": "1",
+            },
+        )
+        cell_xfs[0].setAttribute("count", str(index + 1))
+        return index
+
+
+class _StyleIds:
+    """按需为日期、时间等类型的单元格追加样式。"""
+
+    def __init__(self, manifests: _Manifests) -> None:
+        self._manifests = manifests
+        self._ids: dict[str, int] = {}
+
+    def __getitem__(self, kind: str) -> int:
+        style = self._ids.get(kind)
+        if style is None:
+            style = self._ids[kind] = self._manifests.add_cell_style(
+                NUMBER_FORMATS[kind]
+            )
+        return style
+
+
+def _children(parent: minidom.Element, local: str) -> list[minidom.Element]:
+    """返回与 parent 命名空间相同、本地名为 local 的子元素。"""
+    return [
+        node
+        for node in parent.childNodes
+        if node.nodeType == node.ELEMENT_NODE
+        and node.localName == local
+        and node.namespaceURI == parent.namespaceURI
+    ]
+
+
+def _append_element(
+    parent: minidom.Element, local: str, attributes: dict[str, str]
+) -> None:
+    """在 parent 末尾追加与其命名空间、前缀相同的子元素。"""
+    prefix = f"{parent.prefix}:" if parent.prefix else ""
+    document = cast(minidom.Document, parent.ownerDocument)
+    element = document.createElementNS(parent.namespaceURI, prefix + local)
+    for name, value in attributes.items():
+        element.setAttribute(name, value)
+    parent.appendChild(element)
+
+
+def _relationship_namespace(workbook: minidom.Element) -> str:
+    """返回 workbook.xml 使用的关系命名空间（Transitional 或 Strict）。"""
+    # 命名空间可能声明在根元素上，也可能只声明在某个 sheet 元素上
+    declared = {
+        attribute.value
+        for element in [workbook, *workbook.getElementsByTagName("*")]
+        for attribute in element.attributes.values()
+    }
+    for namespace in _RELATIONSHIP_NAMESPACES:
+        if namespace in declared:
+            return namespace
+    return _RELATIONSHIP_NAMESPACES[0]
+
+
+def _new_sheet_part(workbook_part: str, used: set[str]) -> str:
+    directory = posixpath.join(posixpath.dirname(workbook_part), "worksheets")
+    index = 1
+    while posixpath.join(directory, f"sheet{index}.xml") in used:
+        index += 1
+    return posixpath.join(directory, f"sheet{index}.xml")
+
+
+def write_sheet_xml(
+    stream: IO[bytes],
+    df: pd.DataFrame,
+    namespace: str,
+    epoch: datetime.datetime,
+    styles: _StyleIds | Mapping[str, int],
+) -> None:
+    stream.write(
+        b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        + f'<worksheet xmlns="{namespace}"><sheetData>'.encode("utf-8")
+    )
+    letters = [get_column_letter(i + 1) for i in range(len(df.columns))]
+    batch: list[str] = []
+    for row_number, values in enumerate(frame_rows(df, header=True), start=1):
+        cells = "".join(
+            _cell_xml(f"{letter}{row_number}", value, epoch, styles)
+            for letter, value in zip(letters, values)
+            if value is not None
+        )
+        batch.append(f'<row r="{row_number}">{cells}</row>')
+        if len(batch) == _BATCH_ROWS:
+            stream.write("".join(batch).encode("utf-8"))
+            batch = []
+    batch.append("</sheetData></worksheet>")
+    stream.write("".join(batch).encode("utf-8"))
+
+
+def _cell_xml(
+    ref: str,
+    value: Any,
+    epoch: datetime.datetime,
+    styles: _StyleIds | Mapping[str, int],
+) -> str:
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        if isinstance(value, float) and not abs(value) < float("inf"):
+            return ""
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    if isinstance(value, datetime.datetime):
+        kind = "datetime"
+    elif isinstance(value, datetime.date):
+        kind = "date"
+    elif isinstance(value, datetime.time):
+        kind = "time"
+    elif isinstance(value, datetime.timedelta):
+        kind = "timedelta"
+    else:
+        text = str(value)
+        if ILLEGAL_CHARACTERS_RE.search(text):
+            raise ValueError(f"单元格 {ref} 包含 Excel 不允许的控制字符")
+        # 与 openpyxl 相同：以 "=" 开头的字符串写为公式，错误值写为错误单元格
+        if len(text) > 1 and text.startswith("="):
+            return f'<c r="{ref}"><f>{escape(text[1:])}</f><v></v></c>'
+        if text in ERROR_CODES:
+            return f'<c r="{ref}" t="e"><v>{escape(text)}</v></c>'
+        space = ' xml:space="preserve"' if text != text.strip() else ""
+        return f'<c r="{ref}" t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+    return f'<c r="{ref}" s="{styles[kind]}"><v>{to_excel(value, epoch)!r}</v></c>'
@@ -0,0 +1,511 @@
+"""Excel 模块内部共享的辅助函数。"""
+
+import datetime
+import json
+import zipfile
+from collections.abc import Generator, Hashable, Iterator
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from openpyxl.writer.excel import ExcelWriter
+from pandas.io.parsers import TextParser
+
+from ..cache import pack_strings, unpack_strings
+from .._zip import zip_options
+
+# frame_rows 每批转换的行数
+_FRAME_BATCH_ROWS = 10000
+# compact_frame 将字符串列转为 category 的阈值（不同取值数 / 非空值数）
+COMPACT_CATEGORY_RATIO = 0.5
+# 工作表名称中不允许出现的字符
+_INVALID_TITLE_CHARACTERS = set("[]:*?/\\")
+
+
+def df_preview_to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """将 DataFrame 转换为记录列表，缺失值统一为 None。
+
+    Args:
+        df: 要转换的 DataFrame
+
+    Returns:
+        记录列表，便于 JSON 序列化
+    """
+    df_obj = df.astype(object)
+    df_none = df_obj.where(pd.notna(df_obj), None)
+    return cast(list[dict[str, Any]], df_none.to_dict("records"))
+
+
+def resolve_sheet_name(sheet_names: list[str], sheet_name: str | int | None) -> str:
+    """将工作表名称或索引解析为实际的工作表名称。
+
+    Args:
+        sheet_names: 工作簿中的全部工作表名称
+        sheet_name: 工作表名称或索引，None 表示第一个工作表
+
+    Returns:
+        实际的工作表名称
+
+    Raises:
+        ValueError: 工作表不存在或索引超出范围
+    """
+    if sheet_name is None:
+        if not sheet_names:
+            raise ValueError("工作簿中没有工作表")
+        return sheet_names[0]
+    if isinstance(sheet_name, int):
+        if not 0 <= sheet_name < len(sheet_names):
+            raise ValueError(f"工作表索引超出范围: {sheet_name}")
+        return sheet_names[sheet_name]
+    if sheet_name not in sheet_names:
+        raise ValueError(f"工作表不存在: {sheet_name}")
+    return sheet_name
+
+
+def check_sheet_names(names: list[str]) -> None:
+    """检查工作表名称是否符合 Excel 的规则。
+
+    Raises:
+        ValueError: 名称为空、超过 31 个字符、含有不允许的字符或重复（不区分大小写）
+    """
+    seen: set[str] = set()
+    for name in names:
+        if (
+            not isinstance(name, str)
+            or not 1 <= len(name) <= 31
+            or _INVALID_TITLE_CHARACTERS & set(name)
+        ):
+            raise ValueError(f"工作表名称无效: {name}")
+        if name.lower() in seen:
+            raise ValueError(f"工作表名称重复: {name}")
+        seen.add(name.lower())
+
+
+def convert_cell(cell: Any) -> Any:
+    """按 pandas 读取 Excel 时的规则转换 openpyxl 单元格的值。
+
+    整数值的数字单元格转换为 int，错误单元格（如 #DIV/0!）与空单元格返回 None。
+
+    Args:
+        cell: openpyxl 单元格（只读模式下为 ReadOnlyCell）
+
+    Returns:
+        转换后的 Python 值
+    """
+    value = cell.value
+    if value is None or cell.data_type == TYPE_ERROR:
+        return None
+    if cell.data_type == TYPE_NUMERIC:
+        int_value = int(value)
+        if int_value == value:
+            return int_value
+        return float(value)
+    return value
+
+
+def trim_row(values: list[Any]) -> list[Any]:
+    """去除行尾的空值（与 pandas 的处理一致）。"""
+    end = len(values)
+    while end and values[end - 1] is None:
+        end -= 1
+    return values[:end]
+
+
+def header_names(values: list[Any]) -> list[Hashable]:
+    """按 pandas 的规则由表头行生成列名。
+
+    空白单元格命名为 ``Unnamed: i``，重复列名追加 ``.1``、``.2`` 等后缀。
+
+    Args:
+        values: 表头行的值（已转换、已去除行尾空值）
+
+    Returns:
+        列名列表
+    """
+    if not values:
+        return []
+    row = ["" if value is None else value for value in values]
+    frame = TextParser([row], header=0).read()
+    return list(frame.columns)
+
+
+def iter_sheet_values(worksheet: Any) -> Generator[list[Any], None, None]:
+    """逐行产出工作表中转换后的单元格值。
+
+    每行去除行尾空值；工作表末尾的空行会被丢弃，中间的空行以空列表产出，
+    与 pandas 读取 Excel 时的行为一致。内存占用只与连续空行的数量有关。
+
+    Args:
+        worksheet: openpyxl 工作表（通常为只读模式）
+
+    Yields:
+        每行的值列表
+    """
+    pending_empty = 0
+    for row in worksheet.iter_rows():
+        values = trim_row([convert_cell(cell) for cell in row])
+        if not values:
+            pending_empty += 1
+            continue
+        for _ in range(pending_empty):
+            yield []
+        pending_empty = 0
+        yield values
+
+
+def rows_to_frame(
+    rows: list[list[Any]], columns: list[Hashable], start: int = 0
+) -> pd.DataFrame:
+    """使用 read_excel 内部相同的解析器将行数据转换为 DataFrame。
+
+    Args:
+        rows: 行数据（会被就地补齐到列数，空值 None 替换为空字符串）
+        columns: 列名列表
+        start: 行索引的起始值
+
+    Returns:
+        转换后的 DataFrame，dtype 推断规则与 read_excel 一致
+    """
+    width = len(columns)
+    for values in rows:
+        values.extend([None] * (width - len(values)))
+        # pandas 将空单元格读为空字符串，再由解析器统一转换为 NaN
+        if None in values:
+            values[:] = ["" if value is None else value for value in values]
+    frame = TextParser(rows, names=columns, header=None, skip_blank_lines=False).read()
+    frame.index = pd.RangeIndex(start, start + len(frame))
+    return frame
+
+
+def pack_frame(df: pd.DataFrame) -> dict[str, Any]:
+    """将 DataFrame 打包为便于跨进程传输的结构。
+
+    字符串列编码为整数代码与去重后的取值（与 ``pd.factorize`` 相同），pickle 时只需
+    序列化一个整数数组和少量字符串对象，而不是逐个序列化每个单元格的 Python 对象；
+    其他列保持原样（数值数组本身即以连续内存序列化）。
+
+    Args:
+        df: 要打包的 DataFrame
+
+    Returns:
+        可由 ``unpack_frame`` 还原的字典
+    """
+    data: list[tuple[Any, ...]] = []
+    for _, series in df.items():
+        dtype = series.dtype
+        if is_string_column(series):
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            data.append(
+                ("codes", dtype, codes.astype(np.int32), np.asarray(uniques, object))
+            )
+        else:
+            data.append(("raw", series.array))
+    return {"columns": df.columns, "index": df.index, "data": data}
+
+
+def unpack_frame(packed: dict[str, Any]) -> pd.DataFrame:
+    """还原 ``pack_frame`` 打包的 DataFrame。
+
+    Args:
+        packed: ``pack_frame`` 的返回值
+
+    Returns:
+        与打包前相同的 DataFrame
+    """
+    arrays: list[Any] = []
+    for item in packed["data"]:
+        if item[0] == "codes":
+            _, dtype, codes, uniques = item
+            # 代码 -1（缺失值）取到末尾追加的缺失值
+            values = np.append(uniques, np.nan).take(codes)
+            arrays.append(pd.array(values, dtype=dtype) if dtype != object else values)
+        else:
+            arrays.append(item[1])
+    frame = pd.DataFrame(dict(enumerate(arrays)), index=packed["index"])
+    frame.columns = packed["columns"]
+    return frame
+
+
+def frame_to_arrays(df: pd.DataFrame) -> dict[str, np.ndarray] | None:
+    """将 DataFrame 编码为一组不含 Python 对象的数组（用于磁盘缓存）。
+
+    数值、布尔与日期时间列直接保存底层数组；字符串列与 ``pack_frame`` 相同，保存
+    整数代码与去重后的取值；category 列保存代码与类别；其他 object 列逐个单元格
+    编码为带类型标记的 JSON。列名与行索引按同样的方式编码。
+
+    Args:
+        df: 要编码的 DataFrame
+
+    Returns:
+        可由 ``frame_from_arrays`` 还原的数组；含有无法编码的值（如多级列名、
+        其他扩展类型或自定义对象）时返回 None
+    """
+    arrays: dict[str, np.ndarray] = {}
+    try:
+        meta = {
+            "columns": _encode_labels(df.columns, "columns", arrays),
+            "index": _encode_labels(df.index, "index", arrays),
+            "data": [
+                _encode_values(df.iloc[:, i], f"c{i}", arrays)
+                for i in range(df.shape[1])
+            ],
+        }
+    except _UnsupportedValue:
+        return None
+    arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+    return arrays
+
+
+def frame_from_arrays(arrays: dict[str, np.ndarray]) -> pd.DataFrame:
+    """还原 ``frame_to_arrays`` 编码的 DataFrame。
+
+    Args:
+        arrays: ``frame_to_arrays`` 的返回值
+
+    Returns:
+        与编码前相同的 DataFrame
+    """
+    meta = json.loads(arrays["meta"].tobytes())
+    data = [
+        _decode_values(item, f"c{i}", arrays) for i, item in enumerate(meta["data"])
+    ]
+    frame = pd.DataFrame(
+        dict(enumerate(data)), index=_decode_labels(meta["index"], "index", arrays)
+    )
+    frame.columns = _decode_labels(meta["columns"], "columns", arrays)
+    return frame
+
+
+class _UnsupportedValue(Exception):
+    """frame_to_arrays 无法编码的值。"""
+
+
+def _encode_labels(
+    labels: pd.Index, name: str, arrays: dict[str, np.ndarray]
+) -> dict[str, Any]:
+    if isinstance(labels, pd.MultiIndex):
+        raise _UnsupportedValue(name)
+    if isinstance(labels, pd.RangeIndex):
+        return {"range": [labels.start, labels.stop, labels.step]}
+    return _encode_values(pd.Series(labels, dtype=labels.dtype), name, arrays)
+
+
+def _decode_labels(
+    item: dict[str, Any], name: str, arrays: dict[str, np.ndarray]
+) -> pd.Index:
+    if "range" in item:
+        return pd.RangeIndex(*item["range"])
+    return pd.Index(_decode_values(item, name, arrays))
+
+
+def _encode_values(
+    series: pd.Series, name: str, arrays: dict[str, np.ndarray]
+) -> dict[str, Any]:
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        arrays[name] = series.cat.codes.to_numpy()
+        categories = pd.Series(dtype.categories, dtype=dtype.categories.dtype)
+        return {
+            "kind": "category",
+            "ordered": bool(dtype.ordered),
+            "categories": _encode_values(categories, f"{name}.categories", arrays),
+        }
+    if isinstance(dtype, pd.StringDtype) or is_string_column(series):
+        if dtype != object and pd.api.types.pandas_dtype(str(dtype)) != dtype:
+            raise _UnsupportedValue(name)
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        arrays[name] = codes.astype(np.int32)
+        for part, array in pack_strings(list(uniques)).items():
+            arrays[f"{name}.{part}"] = array
+        return {"kind": "strings", "dtype": str(dtype)}
+    if isinstance(dtype, np.dtype) and not dtype.hasobject:
+        arrays[name] = series.to_numpy()
+        return {"kind": "numpy"}
+    if dtype == object:
+        return {"kind": "objects", "values": [_encode_cell(v) for v in series]}
+    raise _UnsupportedValue(name)
+
+
+def _decode_values(
+    item: dict[str, Any], name: str, arrays: dict[str, np.ndarray]
+) -> Any:
+    kind = item["kind"]
+    if kind == "category":
+        categories = pd.Index(
+            _decode_values(item["categories"], f"{name}.categories", arrays)
+        )
+        return pd.Categorical.from_codes(
+            arrays[name], categories=categories, ordered=item["ordered"]
+        )
+    if kind == "strings":
+        uniques = np.array(
+            unpack_strings(
+                {"data": arrays[f"{name}.data"], "ends": arrays[f"{name}.ends"]}
+            )
+            + [np.nan],
+            dtype=object,
+        )
+        # 代码 -1（缺失值）取到末尾追加的缺失值
+        values = uniques.take(arrays[name])
+        if item["dtype"] == "object":
+            return values
+        return pd.array(values, dtype=pd.api.types.pandas_dtype(item["dtype"]))
+    if kind == "numpy":
+        return arrays[name]
+    values = np.empty(len(item["values"]), dtype=object)
+    values[:] = [_decode_cell(cell) for cell in item["values"]]
+    return values
+
+
+def _encode_cell(value: Any) -> list[Any]:
+    """将 object 列中的单元格编码为 [类型标记, 值...]。"""
+    if value is None:
+        return ["none"]
+    if value is pd.NaT:
+        return ["nat"]
+    if isinstance(value, (bool, np.bool_)):
+        return ["bool", bool(value)]
+    if isinstance(value, (int, np.integer)):
+        return ["int", int(value)]
+    if isinstance(value, (float, np.floating)):
+        # json 以 NaN / Infinity 表示非有限值
+        return ["float", float(value)]
+    if isinstance(value, str):
+        return ["str", value]
+    if isinstance(value, pd.Timestamp):
+        return ["timestamp", value.isoformat()]
+    if isinstance(value, datetime.datetime):
+        return ["datetime", value.isoformat()]
+    if isinstance(value, datetime.date):
+        return ["date", value.isoformat()]
+    if isinstance(value, datetime.time):
+        return ["time", value.isoformat()]
+    if isinstance(value, pd.Timedelta):
+        return ["timedelta64", value.value]
+    if isinstance(value, datetime.timedelta):
+        return ["timedelta", value.days, value.seconds, value.microseconds]
+    raise _UnsupportedValue(type(value).__name__)
+
+
+def _decode_cell(cell: list[Any]) -> Any:
+    tag = cell[0]
+    if tag == "none":
+        return None
+    if tag == "nat":
+        return pd.NaT
+    if tag in ("bool", "int", "float", "str"):
+        return cell[1]
+    if tag == "timestamp":
+        return pd.Timestamp(cell[1])
+    if tag == "datetime":
+        return datetime.datetime.fromisoformat(cell[1])
+    if tag == "date":
+        return datetime.date.fromisoformat(cell[1])
+    if tag == "time":
+        return datetime.time.fromisoformat(cell[1])
+    if tag == "timedelta64":
+        return pd.Timedelta(cell[1], unit="ns")
+    return datetime.timedelta(days=cell[1], seconds=cell[2], microseconds=cell[3])
+
+
+def is_string_column(series: pd.Series) -> bool:
+    """判断列是否为纯字符串列（忽略缺失值）。"""
+    dtype = series.dtype
+    return (dtype == object or isinstance(dtype, pd.StringDtype)) and (
+        pd.api.types.infer_dtype(series, skipna=True) == "string"
+    )
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """将 DataFrame 的列转换为更省内存的 dtype。
+
+    - 不同取值数不超过非空值数量的 ``COMPACT_CATEGORY_RATIO`` 倍的字符串列转换为
+      ``category``（整数代码加一份去重后的取值）
+    - 整数列降为能容纳全部取值的最小整数类型
+    - 浮点列在转为 float32 不损失精度时降为 float32
+
+    Args:
+        df: 要转换的 DataFrame
+
+    Returns:
+        转换后的 DataFrame（取值不变）
+    """
+    result = df.copy(deep=False)
+    for position in range(result.shape[1]):
+        series = result.iloc[:, position]
+        dtype = series.dtype
+        if is_string_column(series):
+            count = series.count()
+            if count and series.nunique() <= count * COMPACT_CATEGORY_RATIO:
+                result.isetitem(position, series.astype("category"))
+        elif pd.api.types.is_integer_dtype(dtype) and not isinstance(
+            dtype, pd.api.extensions.ExtensionDtype
+        ):
+            result.isetitem(position, pd.to_numeric(series, downcast="integer"))
+        elif dtype == np.float64:
+            values = series.to_numpy()
+            narrowed = values.astype(np.float32)
+            if np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+                result.isetitem(position, pd.Series(narrowed, index=series.index))
+    return result
+
+
+def cell_value(value: Any) -> Any:
+    """将缺失值（None、NaN、NaT、pd.NA）统一为 None，其他值原样返回。
+
+    Excel 没有无穷大，±inf 与 pandas 的默认写入（``inf_rep="inf"``）一样转为文本
+    ``"inf"`` / ``"-inf"``。
+    """
+    if value is None or isinstance(value, (str, bytes, bool, int)):
+        return value
+    if isinstance(value, float) and value in (np.inf, -np.inf):
+        return "inf" if value > 0 else "-inf"
+    try:
+        return None if pd.isna(value) else value
+    except (TypeError, ValueError):
+        return value
+
+
+def frame_rows(df: pd.DataFrame, header: bool) -> Iterator[list[Any]]:
+    """按批将 DataFrame 转换为 Python 值的行，缺失值为 None，±inf 转换同 cell_value。
+
+    Args:
+        df: 要转换的 DataFrame
+        header: 是否先产出列名行
+
+    Yields:
+        每行的值列表
+    """
+    if header:
+        yield [cell_value(column) for column in df.columns]
+    # 只有浮点列与 object 列可能包含无穷大
+    may_be_infinite = any(dtype.kind in "fO" for dtype in df.dtypes)
+    for start in range(0, len(df), _FRAME_BATCH_ROWS):
+        batch = df.iloc[start : start + _FRAME_BATCH_ROWS].astype(object)
+        # 单列时 to_numpy 可能返回只读视图，需要修改时复制
+        values = batch.where(batch.notna(), None).to_numpy(copy=may_be_infinite)
+        if may_be_infinite:
+            values[values == np.inf] = "inf"
+            values[values == -np.inf] = "-inf"
+        yield from values.tolist()
+
+
+def save_workbook(workbook: Any, file_path: str, compression: str = "default") -> None:
+    """按压缩配置保存 openpyxl 工作簿。
+
+    与 ``Workbook.save`` 相同，只是由调用方指定 zip 的压缩方式与级别。
+
+    Args:
+        workbook: openpyxl 工作簿（可以是 write_only 模式）
+        file_path: 输出文件路径
+        compression: 压缩配置，见 ``unifiles._zip.COMPRESSION_PROFILES``
+    """
+    options = zip_options(compression)
+    if workbook.write_only and not workbook.worksheets:
+        workbook.create_sheet()
+    workbook.properties.modified = datetime.datetime.now(
+        tz=datetime.timezone.utc
+    ).replace(tzinfo=None)
+    with zipfile.ZipFile(file_path, "w", allowZip64=True, **options) as archive:
+        ExcelWriter(workbook, archive).save()
@@ -0,0 +1,116 @@
+"""Excel 读写引擎注册表。
+
+每个引擎登记所依赖的模块与支持的扩展名，引擎名称即交给 pandas 的 ``engine``
+参数（``native`` 为内置的原生读取引擎）。注册表按速度从快到慢排列，
+``engine="auto"`` 时选择第一个已安装且支持该扩展名的引擎；可选引擎未安装时
+自动跳过，最终回退到必装的 openpyxl（或内置的原生引擎）。
+"""
+
+from importlib.util import find_spec
+from pathlib import Path
+from typing import NamedTuple
+
+
+class EngineSpec(NamedTuple):
+    """引擎登记信息。"""
+
+    # 依赖的模块名，None 表示内置引擎
+    module: str | None
+    # 安装提示中的包名
+    package: str | None
+    # 支持的扩展名（小写，含点）
+    suffixes: tuple[str, ...]
+
+
+# 读取引擎（按速度从快到慢）
+READ_ENGINES: dict[str, EngineSpec] = {
+    "calamine": EngineSpec(
+        "python_calamine",
+        "python-calamine",
+        (".xlsx", ".xlsm", ".xlsb", ".xls", ".ods"),
+    ),
+    "native": EngineSpec(None, None, (".xlsx", ".xlsm")),
+    "openpyxl": EngineSpec("openpyxl", "openpyxl", (".xlsx", ".xlsm")),
+    "pyxlsb": EngineSpec("pyxlsb", "pyxlsb", (".xlsb",)),
+    "xlrd": EngineSpec("xlrd", "xlrd", (".xls",)),
+    "odf": EngineSpec("odf", "odfpy", (".ods",)),
+}
+
+# 写入引擎（按速度从快到慢）
+WRITE_ENGINES: dict[str, EngineSpec] = {
+    "xlsxwriter": EngineSpec("xlsxwriter", "XlsxWriter", (".xlsx",)),
+    "openpyxl": EngineSpec("openpyxl", "openpyxl", (".xlsx", ".xlsm")),
+    "odf": EngineSpec("odf", "odfpy", (".ods",)),
+}
+
+_available: dict[str, bool] = {}
+
+
+def is_available(spec: EngineSpec) -> bool:
+    """引擎依赖的模块是否已安装（结果按模块缓存）。"""
+    if spec.module is None:
+        return True
+    available = _available.get(spec.module)
+    if available is None:
+        available = _available[spec.module] = find_spec(spec.module) is not None
+    return available
+
+
+def check_engine(engine: str | None, kind: str) -> None:
+    """检查引擎名称是否有效（不检查文件类型与是否已安装）。
+
+    Args:
+        engine: 引擎名称、``"auto"`` 或 None
+        kind: ``"read"`` 或 ``"write"``
+
+    Raises:
+        ValueError: 引擎名称无效
+    """
+    registry = READ_ENGINES if kind == "read" else WRITE_ENGINES
+    if engine is not None and engine != "auto" and engine not in registry:
+        raise ValueError(
+            f"不支持的{'读取' if kind == 'read' else '写入'}引擎: {engine}"
+        )
+
+
+def resolve_engine(engine: str | None, file_path: str, kind: str) -> str | None:
+    """确定读写文件实际使用的引擎。
+
+    Args:
+        engine: 引擎名称、``"auto"`` 或 None（None 原样返回，由调用方使用默认方式）
+        file_path: 文件路径（按扩展名选择引擎）
+        kind: ``"read"`` 或 ``"write"``
+
+    Returns:
+        引擎名称，engine 为 None 时返回 None
+
+    Raises:
+        ValueError: 引擎名称无效、不支持该文件类型、未安装，或没有可用的引擎
+    """
+    check_engine(engine, kind)
+    if engine is None:
+        return None
+    registry = READ_ENGINES if kind == "read" else WRITE_ENGINES
+    suffix = Path(file_path).suffix.lower()
+
+    if engine == "auto":
+        candidates = [
+            name for name, spec in registry.items() if suffix in spec.suffixes
+        ]
+        for name in candidates:
+            if is_available(registry[name]):
+                return name
+        if not candidates:
+            raise ValueError(f"没有支持 {suffix or '该'} 文件的引擎: {file_path}")
+        packages = " 或 ".join(
+            str(registry[name].package) for name in candidates if registry[name].package
+        )
+        raise ValueError(f"没有可用于 {suffix} 文件的引擎，请安装 {packages}")
+
+    spec = registry[engine]
+    if suffix not in spec.suffixes:
+        formats = "/".join(item.lstrip(".") for item in spec.suffixes)
+        raise ValueError(f"{engine} 引擎仅支持 {formats} 文件: {file_path}")
+    if not is_available(spec):
+        raise ValueError(f"{engine} 引擎不可用，请安装 {spec.package}")
+    return engine
@@ -0,0 +1,212 @@
+"""原生 xlsx 读取引擎。
+
+直接流式解析工作表 XML 与共享字符串表，按列收集单元格的原始文本，数字列与
+日期列使用 numpy 整列转换，其余列交给 pandas 读取 Excel 时使用的同一解析器推断
+类型。结果与 openpyxl 引擎（pandas 默认）一致，但不为每个单元格创建对象。
+"""
+
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900, from_excel
+
+from ._common import (
+    COMPACT_CATEGORY_RATIO,
+    compact_frame,
+    header_names,
+    is_string_column,
+    rows_to_frame,
+    trim_row,
+)
+from ._xlsx import XlsxBook
+
+# 与 pandas 由 datetime 对象推断出的 dtype 一致（pandas 2 为 ns，pandas 3 为 us）
+_DATETIME_DTYPE = pd.Series([datetime(2000, 1, 1)]).dtype
+_MS_PER_DAY = 86_400_000
+# float64 能精确表示的最大整数，超出时交给 pandas 推断
+_MAX_EXACT_INT = 2**53
+
+
+class _Column:
+    """单列的原始数据，按单元格类别分组保存。"""
+
+    __slots__ = ("numbers", "dates", "others")
+
+    def __init__(self) -> None:
+        # (数据行号, 原始文本)
+        self.numbers: list[tuple[int, str]] = []
+        self.dates: list[tuple[int, str]] = []
+        # (数据行号, 类型, 样式索引, 原始文本)
+        self.others: list[tuple[int, str, int, str]] = []
+
+
+def read_sheet_native(
+    book: XlsxBook, sheet_name: str, compact: bool = False
+) -> pd.DataFrame:
+    """使用原生引擎读取工作表（第一行为列名）。
+
+    Args:
+        book: 已打开的 xlsx 工作簿
+        sheet_name: 工作表名称
+        compact: 为 True 时结果与 ``compact_frame`` 转换后的一致；只含共享字符串的
+            列由共享字符串索引直接生成 Categorical 代码，不创建逐单元格的字符串
+
+    Returns:
+        与 ``pd.read_excel(engine="openpyxl")`` 一致的 DataFrame
+    """
+    date_styles = book.date_styles - book.timedelta_styles
+    columns: dict[int, _Column] = {}
+    header: list[tuple[int, str, int, str]] | None = None
+    height = 0
+    for row_number, cells, has_value in book.iter_raw_rows(sheet_name):
+        if row_number == 1:
+            header = cells
+            continue
+        if not has_value:
+            continue
+        index = row_number - 2
+        height = index + 1
+        for column, data_type, style, raw in cells:
+            data = columns.get(column)
+            if data is None:
+                data = columns[column] = _Column()
+            if data_type == "n":
+                if style in date_styles:
+                    data.dates.append((index, raw))
+                elif style in book.timedelta_styles:
+                    data.others.append((index, data_type, style, raw))
+                else:
+                    data.numbers.append((index, raw))
+            else:
+                data.others.append((index, data_type, style, raw))
+
+    header_values: dict[int, Any] = {}
+    for column, data_type, style, raw in header or []:
+        header_values[column] = book.convert(data_type, style, raw)
+    last = max(header_values, default=0)
+    names = header_names(trim_row([header_values.get(i) for i in range(1, last + 1)]))
+    width = max(len(names), max(columns, default=0))
+    if header is None and not columns:
+        return pd.DataFrame()
+    names.extend(f"Unnamed: {i}" for i in range(len(names), width))
+
+    arrays: dict[int, Any] = {}
+    inferred: list[int] = []
+    for position in range(width):
+        data = columns.get(position + 1)
+        array = None
+        if data is not None:
+            if compact:
+                array = _categorize(data, height, book)
+            if array is None:
+                array = _vectorize(data, height, book.epoch)
+        if array is None:
+            inferred.append(position)
+        else:
+            arrays[position] = array
+
+    if inferred:
+        # 其余列（字符串、布尔、混合类型、空列）按行交给 pandas 的解析器推断类型
+        values = {
+            position: _python_values(columns.get(position + 1), height, book)
+            for position in inferred
+        }
+        rows = [list(row) for row in zip(*values.values())]
+        frame = rows_to_frame(rows, [names[position] for position in inferred])
+        for offset, position in enumerate(inferred):
+            arrays[position] = frame.iloc[:, offset]
+
+    result = pd.DataFrame(
+        {position: arrays[position] for position in range(width)},
+        index=pd.RangeIndex(height),
+    )
+    result.columns = pd.Index(names)
+    return compact_frame(result) if compact else result
+
+
+def _vectorize(data: _Column, height: int, epoch: datetime) -> np.ndarray | None:
+    """整列转换只含数字或只含日期的列，其他情况返回 None。"""
+    if data.others or (data.numbers and data.dates):
+        return None
+
+    cells = data.numbers or data.dates
+    rows = np.fromiter((index for index, _ in cells), dtype=np.int64, count=len(cells))
+    numbers = np.array([raw for _, raw in cells], dtype=np.float64)
+
+    if data.numbers:
+        if len(cells) == height and np.all(np.mod(numbers, 1) == 0):
+            if np.all(np.abs(numbers) < _MAX_EXACT_INT):
+                result = np.empty(height, dtype=np.int64)
+                result[rows] = numbers.astype(np.int64)
+                return result
+            return None
+        result = np.full(height, np.nan)
+        result[rows] = numbers
+        return result
+
+    # 与 openpyxl 的 from_excel 相同：小数部分四舍五入到毫秒，1900 日期系统中
+    # 1900-03-01 之前的序列号需要加一天（Excel 的 1900-02-29 问题）
+    days = np.floor(numbers)
+    milliseconds = np.round((numbers - days) * _MS_PER_DAY)
+    if np.any((numbers >= 0) & (numbers < 1) & (milliseconds < _MS_PER_DAY)):
+        # 小于 1 的序列号为纯时间（datetime.time），逐个转换
+        return None
+    if epoch == CALENDAR_WINDOWS_1900:
+        days = np.where((numbers > 0) & (numbers < 60), days + 1, days)
+    offsets = days.astype(np.int64) * _MS_PER_DAY + milliseconds.astype(np.int64)
+    dates = np.datetime64(epoch, "ms") + offsets.astype("timedelta64[ms]")
+    result = np.full(height, np.datetime64("NaT"), dtype="datetime64[ms]")
+    result[rows] = dates
+    return result.astype(_DATETIME_DTYPE)
+
+
+def _categorize(data: _Column, height: int, book: XlsxBook) -> pd.Categorical | None:
+    """由共享字符串索引直接生成只含共享字符串的列的 Categorical。
+
+    不满足 ``compact_frame`` 转换为 category 的条件时返回 None。
+    """
+    if data.numbers or data.dates or not data.others:
+        return None
+    if any(data_type != "s" for _, data_type, _, _ in data.others):
+        return None
+    rows = np.fromiter(
+        (index for index, _, _, _ in data.others),
+        dtype=np.int64,
+        count=len(data.others),
+    )
+    indices = np.array([raw for _, _, _, raw in data.others], dtype=np.int64)
+    distinct, inverse = np.unique(indices, return_inverse=True)
+    if len(distinct) > len(indices) * COMPACT_CATEGORY_RATIO:
+        return None
+
+    # 去重后的字符串交给同一解析器转换（缺失值标记如 "NA" 转为 NaN），
+    # 整列都像数字时解析结果不再是字符串，交给常规路径处理
+    parsed = rows_to_frame([[book.shared_strings[int(i)]] for i in distinct], [0])[0]
+    if not is_string_column(parsed):
+        return None
+    string_codes, categories = pd.factorize(parsed, sort=True)
+    if not len(categories):
+        return None
+    count = int(np.count_nonzero(string_codes[inverse] >= 0))
+    if len(categories) > count * COMPACT_CATEGORY_RATIO:
+        return None
+    codes = np.full(height, -1, dtype=np.int64)
+    codes[rows] = string_codes[inverse]
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+def _python_values(data: _Column | None, height: int, book: XlsxBook) -> list[Any]:
+    """逐个转换单元格，得到整列的 Python 值（空单元格为 None）。"""
+    values: list[Any] = [None] * height
+    if data is None:
+        return values
+    for index, raw in data.numbers:
+        number = float(raw)
+        values[index] = int(number) if number.is_integer() else number
+    for index, raw in data.dates:
+        values[index] = from_excel(float(raw), book.epoch)
+    for index, data_type, style, raw in data.others:
+        values[index] = book.convert(data_type, style, raw)
+    return values
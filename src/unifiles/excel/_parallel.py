@@ -0,0 +1,174 @@
+"""并行生成工作表 XML 并组装 xlsx 文件。
+
+每个工作表在独立的工作进程中生成 XML（字符串使用内联字符串，不需要合并共享
+字符串表；日期等类型使用预先约定的固定样式索引），并直接压缩到临时 zip 文件中。
+主进程只写入少量清单文件，再按压缩后的原始字节把各工作表条目复制到目标文件，
+不再解压或重新压缩。
+"""
+
+import datetime
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from xml.sax.saxutils import quoteattr
+
+import pandas as pd
+
+from .._zip import copy_raw, zip_options
+from ._append import NUMBER_FORMATS, write_sheet_xml
+from ._common import pack_frame, unpack_frame
+
+_MAIN_NAMESPACE = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_RELATIONSHIP_NAMESPACE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+# Excel 1900 日期系统的起点
+_EPOCH = datetime.datetime(1899, 12, 30)
+# 日期、时间等单元格使用的样式索引（与 _styles_xml 中 cellXfs 的顺序一致）
+_STYLE_IDS = {kind: index for index, kind in enumerate(NUMBER_FORMATS, start=1)}
+
+
+def write_sheets_parallel(
+    file_path: str,
+    frames: dict[str, pd.DataFrame],
+    workers: int,
+    compression: str = "default",
+) -> None:
+    """使用多个进程生成各工作表的 XML，并组装为 xlsx 文件（原子替换）。
+
+    Args:
+        file_path: 输出的 xlsx 文件路径
+        frames: 工作表名称 -> DataFrame（按工作簿顺序）
+        workers: 工作进程数，为 1 时在当前进程中顺序生成
+        compression: zip 压缩配置（工作表条目在工作进程中按此配置压缩）
+    """
+    names = list(frames)
+    parts = [f"xl/worksheets/sheet{index}.xml" for index in range(1, len(names) + 1)]
+    # 临时文件与目标文件位于同一目录，保证最后可以原子替换
+    directory = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(file_path)))
+    try:
+        paths = [os.path.join(directory, f"sheet{i}.zip") for i in range(len(names))]
+        if workers <= 1 or len(names) <= 1:
+            for name, part, path in zip(names, parts, paths):
+                _write_part(frames[name], part, path, compression)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(
+                    executor.map(
+                        _write_packed_part,
+                        (pack_frame(frames[name]) for name in names),
+                        parts,
+                        paths,
+                        [compression] * len(names),
+                    )
+                )
+
+        temp_path = os.path.join(directory, "workbook.xlsx")
+        options = zip_options(compression)
+        with zipfile.ZipFile(temp_path, "w", **options) as target:
+            target.writestr("[Content_Types].xml", _content_types_xml(parts))
+            target.writestr("_rels/.rels", _ROOT_RELS_XML)
+            target.writestr("xl/workbook.xml", _workbook_xml(names))
+            target.writestr("xl/_rels/workbook.xml.rels", _workbook_rels_xml(parts))
+            target.writestr("xl/styles.xml", _styles_xml())
+            for part, path in zip(parts, paths):
+                with zipfile.ZipFile(path) as source, open(path, "rb") as raw_source:
+                    copy_raw(source, raw_source, source.getinfo(part), target)
+        os.replace(temp_path, file_path)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _write_packed_part(
+    packed: dict[str, Any], part: str, path: str, compression: str
+) -> None:
+    """工作进程中还原 DataFrame 并生成工作表条目。"""
+    _write_part(unpack_frame(packed), part, path, compression)
+
+
+def _write_part(df: pd.DataFrame, part: str, path: str, compression: str) -> None:
+    """将工作表 XML 流式压缩写入只含一个条目的临时 zip 文件。"""
+    with zipfile.ZipFile(path, "w", **zip_options(compression)) as archive:
+        with archive.open(part, "w", force_zip64=True) as stream:
+            write_sheet_xml(stream, df, _MAIN_NAMESPACE, _EPOCH, _STYLE_IDS)
+
+
+_ROOT_RELS_XML = (
+    _XML_DECLARATION
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org'
+    '/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+
+def _content_types_xml(parts: list[str]) -> str:
+    prefix = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+    overrides = "".join(
+        f'<Override PartName="/{part}" ContentType="{prefix}.worksheet+xml"/>'
+        for part in parts
+    )
+    return (
+        _XML_DECLARATION
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        f'<Override PartName="/xl/workbook.xml" ContentType="{prefix}.sheet.main+xml"/>'
+        f'<Override PartName="/xl/styles.xml" ContentType="{prefix}.styles+xml"/>'
+        f"{overrides}</Types>"
+    )
+
+
+def _workbook_xml(names: list[str]) -> str:
+    sheets = "".join(
+        f'<sheet name={quoteattr(name)} sheetId="{index}" r:id="rId{index}"/>'
+        for index, name in enumerate(names, start=1)
+    )
+    return (
+        _XML_DECLARATION
+        + f'<workbook xmlns="{_MAIN_NAMESPACE}" xmlns:r="{_RELATIONSHIP_NAMESPACE}">'
+        f"<sheets>{sheets}</sheets></workbook>"
+    )
+
+
+def _workbook_rels_xml(parts: list[str]) -> str:
+    relationships = "".join(
+        f'<Relationship Id="rId{index}" Type="{_RELATIONSHIP_NAMESPACE}/worksheet" '
+        f'Target="{part.removeprefix("xl/")}"/>'
+        for index, part in enumerate(parts, start=1)
+    )
+    # 样式表的关系 ID 排在所有工作表之后
+    return (
+        _XML_DECLARATION
+        + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        f'relationships">{relationships}<Relationship Id="rId{len(parts) + 1}" '
+        f'Type="{_RELATIONSHIP_NAMESPACE}/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    )
+
+
+def _styles_xml() -> str:
+    cell_formats = "".join(
+        f'<xf numFmtId="{NUMBER_FORMATS[kind]}" fontId="0" fillId="0" borderId="0" '
+        'xfId="0" applyNumberFormat="1"/>'
+        for kind in _STYLE_IDS
+    )
+    return (
+        _XML_DECLARATION + f'<styleSheet xmlns="{_MAIN_NAMESPACE}">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/>'
+        "</border></borders>"
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" '
+        'borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="{len(_STYLE_IDS) + 1}"><xf numFmtId="0" fontId="0" '
+        f'fillId="0" borderId="0" xfId="0"/>{cell_formats}</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+        "</cellStyles></styleSheet>"
+    )
@@ -0,0 +1,196 @@
+"""工作簿句柄缓存。
+
+同一个未修改的文件在多次调用之间共享一个已解析的 ``pd.ExcelFile``（xlsx 时内部为
+openpyxl 只读工作簿）或 ``XlsxBook``，避免每次调用都重新解压并解析 workbook.xml、
+共享字符串表和样式表。缓存以 (绝对路径, mtime, 文件大小) 为键，文件变化后自动失效，
+按 LRU 淘汰。
+
+缓存只保留解析结果，不占用文件：每次调用结束时关闭底层文件，下次使用时再重新打开
+（不会重新解析）。openpyxl 以外的引擎无法只重新打开文件，其 ``pd.ExcelFile``
+不跨调用缓存。
+"""
+
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from ._xlsx import XlsxBook
+
+# 最多保留的工作簿句柄数量（每个句柄会占用已解析的结构信息和共享字符串表的内存）
+MAX_HANDLES = 4
+
+_CacheKey = tuple[str, int, int]
+
+
+class _WorkbookHandle:
+    """缓存中的工作簿句柄，同一时刻只允许一个调用使用。
+
+    ``pd.ExcelFile`` 与 ``XlsxBook`` 都在第一次使用时才打开，最外层调用结束时
+    通过 ``release`` 关闭底层文件。
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.RLock()
+        self.closed = False
+        # 嵌套使用同一句柄的层数，回到 0 时释放文件
+        self.depth = 0
+        self._excel_file: pd.ExcelFile | None = None
+        self._excel_file_released = False
+        self._xlsx_book: XlsxBook | None = None
+
+    @property
+    def excel_file(self) -> pd.ExcelFile:
+        if self._excel_file is None:
+            self._excel_file = pd.ExcelFile(self.path)
+        elif self._excel_file_released:
+            # openpyxl 只读工作簿读取工作表时才从 _archive 打开对应部件
+            self._excel_file.book._archive = zipfile.ZipFile(self.path)
+        self._excel_file_released = False
+        return self._excel_file
+
+    @property
+    def xlsx_book(self) -> XlsxBook:
+        if self._xlsx_book is None:
+            self._xlsx_book = XlsxBook(self.path)
+        else:
+            self._xlsx_book.reopen()
+        return self._xlsx_book
+
+    def release(self) -> None:
+        """关闭底层文件，保留已解析的结果。"""
+        if self._excel_file is not None and not self._excel_file_released:
+            self._excel_file.close()
+            if self._excel_file.engine == "openpyxl":
+                self._excel_file_released = True
+            else:
+                self._excel_file = None
+        if self._xlsx_book is not None:
+            self._xlsx_book.close()
+
+    def close(self) -> None:
+        with self.lock:
+            if not self.closed:
+                self.release()
+                self.closed = True
+
+
+_handles: OrderedDict[_CacheKey, _WorkbookHandle] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_key(file_path: str) -> _CacheKey:
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _get_handle(file_path: str) -> _WorkbookHandle:
+    key = _cache_key(file_path)
+    with _cache_lock:
+        handle = _handles.get(key)
+        if handle is not None:
+            _handles.move_to_end(key)
+            return handle
+
+        handle = _WorkbookHandle(key[0])
+        evicted: list[_WorkbookHandle] = []
+        # 同一路径的旧版本已经失效
+        for stale in [k for k in _handles if k[0] == key[0]]:
+            evicted.append(_handles.pop(stale))
+        _handles[key] = handle
+        while len(_handles) > MAX_HANDLES:
+            evicted.append(_handles.popitem(last=False)[1])
+
+    for old in evicted:
+        old.close()
+    return handle
+
+
+@contextmanager
+def _locked_handle(file_path: str) -> Iterator[_WorkbookHandle]:
+    while True:
+        handle = _get_handle(file_path)
+        with handle.lock:
+            # 获取锁之前句柄可能已被淘汰并关闭，此时重新获取
+            if handle.closed:
+                continue
+            handle.depth += 1
+            try:
+                yield handle
+            finally:
+                handle.depth -= 1
+                if handle.depth == 0:
+                    handle.release()
+            return
+
+
+@contextmanager
+def cached_excel_file(file_path: str) -> Iterator[pd.ExcelFile]:
+    """获取文件对应的已缓存 ``pd.ExcelFile``。
+
+    在 with 块内独占使用该句柄；with 块结束后底层文件即被关闭，解析结果仍保留在
+    缓存中。不要自行关闭它，也不要在 with 块外继续使用。
+
+    Args:
+        file_path: Excel 文件路径
+
+    Yields:
+        已解析的 ``pd.ExcelFile``
+    """
+    with _locked_handle(file_path) as handle:
+        yield handle.excel_file
+
+
+@contextmanager
+def cached_xlsx_book(file_path: str) -> Iterator[XlsxBook]:
+    """获取文件对应的已缓存 ``XlsxBook``（用于底层流式解析），用法同 cached_excel_file。
+
+    Args:
+        file_path: xlsx 文件路径
+
+    Yields:
+        已打开的 ``XlsxBook``
+    """
+    with _locked_handle(file_path) as handle:
+        yield handle.xlsx_book
+
+
+def evict(file_path: str) -> None:
+    """移除文件的缓存句柄（写入文件之前调用，丢弃即将过期的解析结果）。
+
+    Args:
+        file_path: Excel 文件路径
+    """
+    path = str(Path(file_path).resolve())
+    with _cache_lock:
+        evicted = [_handles.pop(k) for k in [k for k in _handles if k[0] == path]]
+    for handle in evicted:
+        handle.close()
+
+
+def _reset_after_fork() -> None:
+    # 子进程与父进程共享已打开文件的读取位置，不能继续使用继承来的句柄；
+    # 锁也可能在 fork 时正被其他线程持有
+    global _cache_lock
+    _cache_lock = threading.Lock()
+    _handles.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def clear() -> None:
+    """清空所有缓存的工作簿句柄。"""
+    with _cache_lock:
+        evicted = list(_handles.values())
+        _handles.clear()
+    for handle in evicted:
+        handle.close()
@@ -0,0 +1,395 @@
+"""xlsx 文件的底层流式解析。
+
+直接使用 zipfile 与 ElementTree.iterparse 读取工作表 XML，不为每个单元格创建
+openpyxl 对象；可以只转换指定列的单元格，并在指定行之后停止解析。单元格值的
+转换规则与 openpyxl（data_only=True）+ pandas 读取 Excel 时一致。
+"""
+
+import posixpath
+import re
+import zipfile
+from collections.abc import Container, Iterator
+from itertools import islice
+from typing import IO, Any
+from xml.etree import ElementTree
+
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    is_date_format,
+    is_timedelta_format,
+)
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    CALENDAR_WINDOWS_1900,
+    from_excel,
+    from_ISO8601,
+)
+
+_DIGITS = "0123456789"
+# last_value_row 扫描的标签：行的起始标签（分组 2 为属性）与单元格值的起始标签
+_ROW_OR_VALUE_RE = re.compile(rb"<(?:[\w.-]+:)?(?:(row)\b([^>]*)|(?:v|is)>)")
+_ROW_NUMBER_RE = re.compile(rb'\sr="(\d+)"')
+# last_value_row 每次解压的字节数
+_SCAN_CHUNK_SIZE = 1 << 20
+
+
+def local_name(tag: str) -> str:
+    """去除 XML 标签的命名空间（同时兼容 Transitional 与 Strict 两种命名空间）。"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _iter_elements(source: IO[bytes], tag: str) -> Iterator[ElementTree.Element]:
+    """流式产出指定本地名的元素，处理完后即从树中移除，内存占用保持恒定。"""
+    parent: ElementTree.Element | None = None
+    previous: ElementTree.Element | None = None
+    qualified = ""
+    for event, element in ElementTree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            # 第一个目标元素开始前最后开始的元素即为其父元素（如 sheetData、sst）
+            if parent is None:
+                if local_name(element.tag) == tag:
+                    parent = previous
+                    qualified = element.tag
+                previous = element
+            continue
+        if element.tag == qualified and parent is not None:
+            yield element
+            parent.clear()
+
+
+def _text_content(element: ElementTree.Element) -> str:
+    """读取字符串元素（si / is）的文本，富文本按顺序拼接，忽略注音。"""
+    parts: list[str] = []
+    for child in element:
+        name = local_name(child.tag)
+        if name == "t":
+            parts.append(child.text or "")
+        elif name == "r":
+            for run_child in child:
+                if local_name(run_child.tag) == "t":
+                    parts.append(run_child.text or "")
+    return "".join(parts)
+
+
+def _resolve_target(base: str, target: str) -> str:
+    """将关系文件中的 Target 解析为 zip 内的路径。"""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base), target))
+
+
+def rels_path(part: str) -> str:
+    return posixpath.join(
+        posixpath.dirname(part), "_rels", posixpath.basename(part) + ".rels"
+    )
+
+
+class SharedStrings:
+    """按需解析的共享字符串表。
+
+    只解析到被引用的最大索引为止；列只引用靠前的字符串时，不会解析整张表。
+    关闭后已解析的字符串仍然保留，之后需要更多字符串时从 archive 重新打开部件，
+    跳过已解析的部分继续解析。
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, part: str | None) -> None:
+        self.archive = archive
+        self._part = part or ""
+        self._complete = part is None
+        self._strings: list[str] = []
+        self._elements: Iterator[ElementTree.Element] | None = None
+        self._source: IO[bytes] | None = None
+
+    def __getitem__(self, index: int) -> str:
+        while index >= len(self._strings) and not self._complete:
+            if self._elements is None:
+                self._source = self.archive.open(self._part)
+                self._elements = islice(
+                    _iter_elements(self._source, "si"), len(self._strings), None
+                )
+            element = next(self._elements, None)
+            if element is None:
+                self._complete = True
+                self.close()
+                break
+            self._strings.append(_text_content(element))
+        return self._strings[index]
+
+    def close(self) -> None:
+        """关闭底层的部件流（已解析的字符串保留）。"""
+        self._elements = None
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+
+class XlsxBook:
+    """已打开的 xlsx 工作簿（只读取结构信息，工作表按需流式解析）。
+
+    ``close`` 只关闭底层文件，已解析的结构信息与共享字符串保留，调用 ``reopen``
+    后可以继续使用。
+
+    Args:
+        file_path: xlsx 文件路径
+
+    Raises:
+        zipfile.BadZipFile: 文件不是 zip 格式
+        KeyError: 缺少必要的部件
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self.closed = False
+        self.archive = zipfile.ZipFile(file_path)
+        try:
+            self._load_structure()
+        except Exception:
+            self.archive.close()
+            raise
+
+    def _load_structure(self) -> None:
+        workbook_part = "xl/workbook.xml"
+        for rel in self._read_rels(""):
+            if rel["Type"].endswith("/officeDocument"):
+                workbook_part = _resolve_target("", rel["Target"])
+        self.workbook_part = workbook_part
+
+        targets: dict[str, tuple[str, str]] = {}
+        for rel in self._read_rels(workbook_part):
+            targets[rel["Id"]] = (
+                rel["Type"].rsplit("/", 1)[-1],
+                _resolve_target(workbook_part, rel["Target"]),
+            )
+
+        self.epoch = CALENDAR_WINDOWS_1900
+        self.sheets: dict[str, str] = {}
+        root = ElementTree.fromstring(self.archive.read(workbook_part))
+        for element in root.iter():
+            name = local_name(element.tag)
+            if name == "workbookPr":
+                if element.get("date1904") in ("1", "true"):
+                    self.epoch = CALENDAR_MAC_1904
+            elif name == "sheet":
+                rel_id = next(
+                    value
+                    for key, value in element.attrib.items()
+                    if key.endswith("}id")
+                )
+                self.sheets[element.get("name", "")] = targets[rel_id][1]
+
+        parts_by_type = {kind: part for kind, part in targets.values()}
+        self.styles_part = parts_by_type.get("styles")
+        self.shared_strings_part = parts_by_type.get("sharedStrings")
+        self.date_styles, self.timedelta_styles = self._read_date_styles(
+            self.styles_part
+        )
+        self.shared_strings = SharedStrings(self.archive, self.shared_strings_part)
+
+    def _read_rels(self, part: str) -> list[dict[str, str]]:
+        path = "_rels/.rels" if not part else rels_path(part)
+        try:
+            data = self.archive.read(path)
+        except KeyError:
+            return []
+        return [dict(element.attrib) for element in ElementTree.fromstring(data)]
+
+    def _read_date_styles(self, part: str | None) -> tuple[set[int], set[int]]:
+        """读取样式表，返回日期格式与时间间隔格式对应的单元格样式索引。"""
+        date_styles: set[int] = set()
+        timedelta_styles: set[int] = set()
+        if part is None:
+            return date_styles, timedelta_styles
+
+        root = ElementTree.fromstring(self.archive.read(part))
+        custom: dict[int, str] = {}
+        xf_formats: list[int] = []
+        for element in root:
+            name = local_name(element.tag)
+            if name == "numFmts":
+                for fmt in element:
+                    custom[int(fmt.get("numFmtId", 0))] = fmt.get("formatCode", "")
+            elif name == "cellXfs":
+                xf_formats = [int(xf.get("numFmtId", 0)) for xf in element]
+
+        for index, fmt_id in enumerate(xf_formats):
+            code = custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id, "General"))
+            if is_date_format(code):
+                date_styles.add(index)
+            if is_timedelta_format(code):
+                timedelta_styles.add(index)
+        return date_styles, timedelta_styles
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return list(self.sheets)
+
+    def iter_raw_rows(
+        self,
+        sheet_name: str,
+        columns: Container[int] | None = None,
+        max_row: int | None = None,
+    ) -> Iterator[tuple[int, list[tuple[int, str, int, str]], bool]]:
+        """流式解析工作表的行，产出未转换的单元格内容。
+
+        Args:
+            sheet_name: 工作表名称
+            columns: 需要产出的列号集合（1-based），None 表示全部列
+            max_row: 解析到的最大行号（1-based），之后的内容不再解析
+
+        Yields:
+            (行号, [(列号, 类型, 样式索引, 原始文本), ...], 该行是否有任意非空单元格)，
+            行号与列号均为 1-based，只包含有值的单元格；类型为 XML 中的 ``t`` 属性
+            （缺省为 ``"n"``），内联字符串的原始文本为其文本内容
+        """
+        column_cache: dict[str, int] = {}
+        value_tag = inline_tag = ""
+        row_number = 0
+        with self.archive.open(self.sheets[sheet_name]) as source:
+            for row in _iter_elements(source, "row"):
+                if not value_tag:
+                    namespace = row.tag[: row.tag.find("}") + 1]
+                    value_tag, inline_tag = namespace + "v", namespace + "is"
+                ref = row.get("r")
+                row_number = int(ref) if ref else row_number + 1
+                if max_row is not None and row_number > max_row:
+                    break
+
+                cells: list[tuple[int, str, int, str]] = []
+                has_value = False
+                column = 0
+                for cell in row:
+                    ref = cell.get("r")
+                    if ref:
+                        letters = ref.rstrip(_DIGITS)
+                        column = column_cache.get(letters, 0)
+                        if not column:
+                            column = column_cache[letters] = column_index_from_string(
+                                letters
+                            )
+                    else:
+                        column += 1
+
+                    data_type = cell.get("t", "n")
+                    if data_type == "inlineStr":
+                        inline = cell.find(inline_tag)
+                        if inline is None:
+                            continue
+                        raw = _text_content(inline)
+                    else:
+                        raw = cell.findtext(value_tag) or ""
+                        # 错误单元格（t="e"）与 pandas 一致视为空值
+                        if not raw or data_type == "e":
+                            if raw:
+                                has_value = True
+                            continue
+                    has_value = True
+                    if columns is None or column in columns:
+                        style = cell.get("s")
+                        cells.append(
+                            (column, data_type, int(style) if style else 0, raw)
+                        )
+
+                yield row_number, cells, has_value
+
+    def last_value_row(self, sheet_name: str) -> int:
+        """返回工作表中最后一个含有值的行号（1-based），没有值时返回 0。
+
+        只在解压后的 XML 字节中查找行标签与单元格值标签，不解析单元格，比逐行解析
+        快得多；只有样式、没有值的单元格（如带格式的空行）不计入。
+
+        Args:
+            sheet_name: 工作表名称
+        """
+        row_number = last = 0
+        tail = b""
+        with self.archive.open(self.sheets[sheet_name]) as source:
+            while True:
+                data = source.read(_SCAN_CHUNK_SIZE)
+                buffer = tail + data
+                if data:
+                    # 未读完时，最后一个标签可能不完整，留到下一块
+                    cut = buffer.rfind(b"<")
+                    buffer, tail = buffer[:cut], buffer[cut:]
+                for match in _ROW_OR_VALUE_RE.finditer(buffer):
+                    if match.group(1):
+                        ref = _ROW_NUMBER_RE.search(match.group(2))
+                        row_number = int(ref.group(1)) if ref else row_number + 1
+                    else:
+                        last = row_number
+                if not data:
+                    return last
+
+    def convert(self, data_type: str, style: int, raw: str) -> Any:
+        """按 openpyxl（data_only=True）+ pandas 的规则转换单元格的原始内容。
+
+        Args:
+            data_type: 单元格类型（``t`` 属性）
+            style: 单元格样式索引
+            raw: 原始文本
+
+        Returns:
+            转换后的 Python 值
+        """
+        if data_type == "n":
+            number = float(raw)
+            if style in self.date_styles:
+                return from_excel(
+                    number, self.epoch, timedelta=style in self.timedelta_styles
+                )
+            if number.is_integer():
+                return int(number)
+            return number
+        if data_type == "s":
+            return self.shared_strings[int(raw)]
+        if data_type == "b":
+            return raw != "0"
+        if data_type == "d":
+            return from_ISO8601(raw)
+        # inlineStr 与公式字符串结果（str）
+        return raw
+
+    def iter_rows(
+        self,
+        sheet_name: str,
+        columns: Container[int] | None = None,
+        max_row: int | None = None,
+    ) -> Iterator[tuple[int, list[tuple[int, Any]], bool]]:
+        """流式解析工作表的行。
+
+        Args:
+            sheet_name: 工作表名称
+            columns: 需要转换的列号集合（1-based），None 表示全部列；
+                其他列的单元格不会被转换为 Python 值
+            max_row: 解析到的最大行号（1-based），之后的内容不再解析
+
+        Yields:
+            (行号, [(列号, 值), ...], 该行是否有任意非空单元格)，行号与列号均为
+            1-based，只包含有值的单元格
+        """
+        convert = self.convert
+        for row_number, cells, has_value in self.iter_raw_rows(
+            sheet_name, columns, max_row
+        ):
+            yield row_number, [
+                (column, convert(data_type, style, raw))
+                for column, data_type, style, raw in cells
+            ], has_value
+
+    def close(self) -> None:
+        self.shared_strings.close()
+        self.archive.close()
+        self.closed = True
+
+    def reopen(self) -> None:
+        """关闭后重新打开底层文件，沿用已解析的结构信息。"""
+        if self.closed:
+            self.archive = zipfile.ZipFile(self.file_path)
+            self.shared_strings.archive = self.archive
+            self.closed = False
+
+    def __enter__(self) -> "XlsxBook":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,236 @@
+"""Excel 转换功能。"""
+
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import closing, suppress
+from datetime import date, datetime, time, timedelta
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import FileWriteError
+from ._common import header_names, resolve_sheet_name, trim_row
+from ._workbook_cache import cached_xlsx_book
+from ._xlsx import XlsxBook
+
+
+def excel_to_sqlite(
+    file_path: str,
+    db_path: str,
+    table: str,
+    sheet_name: str | int | None = None,
+    if_exists: str = "fail",
+    batch_size: int = 10000,
+    infer_rows: int = 1000,
+    indexes: Sequence[str | Sequence[str]] | None = None,
+) -> int:
+    """将 Excel 工作表直接导入 SQLite 数据库表。
+
+    流式解析工作表 XML，每 ``batch_size`` 行用一次 ``executemany`` 插入，全部数据在
+    同一个事务中写入，失败时整体回滚。峰值内存只与一批数据有关，与工作表的行数
+    无关。
+
+    列名与 ``read_excel`` 相同：取自工作表的第 1 行，第 1 行为空或缺少列名时使用
+    ``Unnamed: n``。与 ``read_excel`` 不同的是，之后的空行会被跳过，不会插入全为
+    NULL 的行。
+
+    列类型由前 ``infer_rows`` 个数据行推断：全为整数（或布尔值）时为 INTEGER，含
+    浮点数时为 REAL，其他为 TEXT；日期与时间以 ISO 8601 文本存储。之后的行出现其他
+    类型的值时按 SQLite 的类型亲和规则原样存储。
+
+    Args:
+        file_path: Excel 文件路径（xlsx/xlsm）
+        db_path: SQLite 数据库文件路径，不存在时自动创建
+        table: 目标表名
+        sheet_name: 工作表名称或索引，None 表示第一个工作表
+        if_exists: 表已存在时的处理方式：``"fail"`` 抛出 ValueError，
+            ``"replace"`` 删除后重建，``"append"`` 追加到已有的表
+        batch_size: 每批插入的行数
+        infer_rows: 用于推断列类型的行数
+        indexes: 导入完成后创建的索引，每项为列名或多个列名组成的序列（复合索引）
+
+    Returns:
+        插入的行数
+
+    Raises:
+        FileNotFoundError: Excel 文件不存在
+        ValueError: 工作表不存在、参数无效、表已存在（if_exists="fail"），
+            数据行超出表头的列数，或索引列不存在
+        FileWriteError: 读取 Excel 或写入数据库时发生错误
+
+    Example:
+        >>> rows = excel_to_sqlite("orders.xlsx", "shop.db", "orders")
+        >>> # 覆盖已有表，并为常用查询列建立索引
+        >>> excel_to_sqlite(
+        ...     "orders.xlsx", "shop.db", "orders",
+        ...     if_exists="replace", indexes=["customer_id", ["region", "date"]],
+        ... )
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"文件不存在: {file_path}")
+    if path.suffix.lower() not in (".xlsx", ".xlsm"):
+        raise ValueError(f"仅支持 xlsx/xlsm 文件: {file_path}")
+    if if_exists not in ("fail", "replace", "append"):
+        raise ValueError(f"if_exists 必须为 'fail'、'replace' 或 'append': {if_exists}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size 必须为正整数: {batch_size}")
+    if infer_rows < 1:
+        raise ValueError(f"infer_rows 必须为正整数: {infer_rows}")
+
+    try:
+        with cached_xlsx_book(file_path) as book:
+            name = resolve_sheet_name(book.sheet_names, sheet_name)
+            rows = _iter_sheet_rows(book, name)
+            columns = [str(column) for column in header_names(next(rows, []))]
+            # 推断类型所需的行保留在内存中，随后与剩余的行一起插入
+            sample = list(islice(rows, infer_rows))
+            width = max([len(columns), *(len(row) for row in sample)])
+            columns.extend(f"Unnamed: {i}" for i in range(len(columns), width))
+            types = [
+                _infer_type(row[i] if i < len(row) else None for row in sample)
+                for i in range(width)
+            ]
+            index_columns = [
+                [item] if isinstance(item, str) else list(item)
+                for item in indexes or []
+            ]
+            for item in index_columns:
+                for column in item:
+                    if column not in columns:
+                        raise ValueError(f"索引列不存在: {column}")
+
+            # 自动提交模式下显式开启事务，建表、插入与建索引全部在同一事务中完成
+            with closing(sqlite3.connect(db_path, isolation_level=None)) as conn:
+                conn.execute("BEGIN")
+                try:
+                    count = _load(
+                        conn,
+                        table,
+                        columns,
+                        types,
+                        chain(sample, rows),
+                        if_exists,
+                        batch_size,
+                    )
+                    for item in index_columns:
+                        index_name = _quote(f"idx_{table}_{'_'.join(item)}")
+                        conn.execute(
+                            f"CREATE INDEX IF NOT EXISTS {index_name} ON "
+                            f"{_quote(table)} ({', '.join(map(_quote, item))})"
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    # 回滚本身失败（如连接已失效）时保留原始异常
+                    with suppress(sqlite3.Error):
+                        conn.execute("ROLLBACK")
+                    raise
+            return count
+    except (PermissionError, ValueError):
+        raise
+    except Exception as e:
+        raise FileWriteError(f"导入 SQLite 数据库失败: {e}") from e
+
+
+def _iter_sheet_rows(book: XlsxBook, sheet_name: str) -> Iterator[list[Any]]:
+    """逐行产出工作表的值（已去除行尾空值）。
+
+    首先产出第 1 行（表头，为空时产出空列表），之后只产出非空行。
+    """
+    header = True
+    for row_number, cells, has_value in book.iter_rows(sheet_name):
+        if header:
+            header = False
+            if row_number != 1:
+                yield []
+            elif not has_value:
+                yield []
+                continue
+        elif not has_value:
+            continue
+        row: list[Any] = [None] * (cells[-1][0] if cells else 0)
+        for column, value in cells:
+            row[column - 1] = value
+        yield trim_row(row)
+    if header:
+        yield []
+
+
+def _infer_type(values: Iterable[Any]) -> str:
+    """由样本值推断 SQLite 列类型。"""
+    kind = None
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, (bool, int)):
+            kind = kind or "INTEGER"
+        elif isinstance(value, float):
+            if kind not in (None, "INTEGER", "REAL"):
+                return "TEXT"
+            kind = "REAL"
+        else:
+            return "TEXT"
+    return kind or "TEXT"
+
+
+def _sql_value(value: Any) -> Any:
+    """将单元格的值转换为 sqlite3 可以直接绑定的类型。"""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return str(value)
+    return value
+
+
+def _load(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: list[str],
+    types: list[str],
+    rows: Iterator[list[Any]],
+    if_exists: str,
+    batch_size: int,
+) -> int:
+    """建表（按需）并分批插入数据行，返回插入的行数。"""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    if exists and if_exists == "fail":
+        raise ValueError(f"表已存在: {table}")
+    if exists and if_exists == "replace":
+        conn.execute(f"DROP TABLE {_quote(table)}")
+    if not exists or if_exists == "replace":
+        definitions = ", ".join(
+            f"{_quote(column)} {column_type}"
+            for column, column_type in zip(columns, types)
+        )
+        conn.execute(f"CREATE TABLE {_quote(table)} ({definitions})")
+
+    width = len(columns)
+    statement = (
+        f"INSERT INTO {_quote(table)} ({', '.join(map(_quote, columns))}) "
+        f"VALUES ({', '.join('?' * width)})"
+    )
+    count = 0
+    batch: list[list[Any]] = []
+    for row in rows:
+        if len(row) > width:
+            raise ValueError(f"数据行的列数 {len(row)} 超出表头的列数 {width}")
+        values = [_sql_value(value) for value in row]
+        values.extend([None] * (width - len(values)))
+        batch.append(values)
+        if len(batch) >= batch_size:
+            conn.executemany(statement, batch)
+            count += len(batch)
+            batch.clear()
+    if batch:
+        conn.executemany(statement, batch)
+        count += len(batch)
+    return count
+
+
+def _quote(identifier: str) -> str:
+    """以双引号引用 SQL 标识符。"""
+    return '"' + identifier.replace('"', '""') + '"'
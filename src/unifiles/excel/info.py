@@ -1,153 +1,152 @@
-"""Excel 文件操作模块。
+"""Excel 元数据查询功能。"""
 
-提供 Excel 文件的读取、写入和查询功能。
-"""
-
-from typing import Any, cast
+import hashlib
+import zipfile
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any
 
 import pandas as pd
-from pathlib import Path
 
-from .exceptions import FileReadError, FileWriteError
+from .._zip import raw_blocks
+from ..exceptions import FileReadError
+from ._common import (
+    df_preview_to_records,
+    header_names,
+    iter_sheet_values,
+    resolve_sheet_name,
+    rows_to_frame,
+)
+from ._engines import READ_ENGINES, WRITE_ENGINES, is_available
+from ._workbook_cache import cached_excel_file, cached_xlsx_book
+
 
+def available_excel_engines() -> dict[str, list[str]]:
+    """获取当前环境中已安装的 Excel 读写引擎。
 
-def _df_preview_to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
-    df_obj = df.astype(object)
-    df_none = df_obj.where(pd.notna(df_obj), None)
-    return cast(list[dict[str, Any]], df_none.to_dict("records"))
+    Returns:
+        ``{"read": [...], "write": [...]}``，按 ``engine="auto"`` 时的优先级
+        （速度从快到慢）排列
+
+    Example:
+        >>> available_excel_engines()
+        {'read': ['native', 'openpyxl'], 'write': ['openpyxl']}
+    """
+    return {
+        "read": [name for name, spec in READ_ENGINES.items() if is_available(spec)],
+        "write": [name for name, spec in WRITE_ENGINES.items() if is_available(spec)],
+    }
 
 
-def read_excel(file_path: str, sheet_name: str | int | None = None) -> pd.DataFrame:
-    """读取 Excel 文件内容。
+def get_sheet_names(file_path: str) -> list[str]:
+    """获取 Excel 文件中的所有工作表名称。
 
     Args:
         file_path: Excel 文件路径
-        sheet_name: 工作表名称或索引，None 表示读取第一个工作表
 
     Returns:
-        包含 Excel 数据的 DataFrame 对象
+        工作表名称列表
 
     Raises:
         FileNotFoundError: 文件不存在
-        ValueError: 工作表不存在或无效
         FileReadError: 读取文件时发生错误
 
     Example:
-        >>> df = read_excel("data.xlsx", sheet_name="Sheet1")
-        >>> print(df.head())
-        >>> # 使用索引读取
-        >>> df = read_excel("data.xlsx", sheet_name=0)
-        >>> # 读取第一个工作表
-        >>> df = read_excel("data.xlsx")
+        >>> sheets = get_sheet_names("data.xlsx")
+        >>> print(sheets)
+        ['Sheet1', 'Sheet2']
     """
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"文件不存在: {file_path}")
 
     try:
-        result = pd.read_excel(file_path, sheet_name=sheet_name)
-        # 如果 sheet_name=None 且返回的是字典（只有一个工作表时也可能返回字典），提取第一个 DataFrame
-        if sheet_name is None and isinstance(result, dict):
-            if len(result) == 1:
-                return list(result.values())[0]
-            else:
-                # 多个工作表时，返回第一个
-                return list(result.values())[0]
-        return result
+        with cached_excel_file(file_path) as excel_file:
+            sheet_names: list[str] = list(excel_file.sheet_names)
+            return sheet_names
     except FileNotFoundError:
         raise
-    except ValueError as e:
-        raise ValueError(f"工作表不存在或无效: {e}") from e
     except Exception as e:
-        raise FileReadError(f"读取 Excel 文件失败: {e}") from e
-
-
-def write_excel(
-    data: pd.DataFrame | dict[str, pd.DataFrame],
-    file_path: str,
-    sheet_name: str = "Sheet1",
-) -> None:
-    """将数据写入 Excel 文件。
-
-    支持写入单个 DataFrame 或多个 DataFrame（字典形式）。
-    注意：此函数会覆盖整个目标文件，不保留原文件中的其他 Sheet。
-
-    Args:
-        data: 要写入的数据，可以是单个 DataFrame 或字典（多工作表）
-        file_path: 输出 Excel 文件路径
-        sheet_name: 工作表名称（当 data 为 DataFrame 时使用）
+        raise FileReadError(f"获取工作表名称失败: {e}") from e
 
-    Raises:
-        ValueError: 数据格式无效
-        PermissionError: 文件权限不足
-        FileWriteError: 写入文件时发生错误
 
-    Example:
-        >>> # 写入单个 DataFrame
-        >>> df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
-        >>> write_excel(df, "output.xlsx", sheet_name="Results")
-        >>> # 写入多个工作表
-        >>> data_dict = {"Sheet1": df1, "Sheet2": df2}
-        >>> write_excel(data_dict, "output.xlsx")
-    """
-    if not isinstance(data, (pd.DataFrame, dict)):
-        raise ValueError(
-            f"数据格式无效，期望 DataFrame 或 dict，实际类型: {type(data)}"
-        )
+def fingerprint_excel(file_path: str, deep: bool = False) -> dict[str, str]:
+    """计算每个工作表的指纹，用于判断工作表内容是否变化。
 
-    # 如果是字典，先验证所有值都是 DataFrame
-    if isinstance(data, dict):
-        for sheet, df in data.items():
-            if not isinstance(df, pd.DataFrame):
-                raise ValueError(f"字典值必须是 DataFrame，实际类型: {type(df)}")
+    指纹由工作表 XML 部件、共享字符串表部件、样式表部件（决定数字是否为日期）与
+    工作簿的日期系统计算得到，不解析单元格、不构造 DataFrame。默认对各部件压缩后的
+    原始字节（连同 CRC-32、大小与压缩方式）计算 SHA-256，不需要解压；内容不变但被
+    重新压缩（如用其他程序另存）时指纹也会变化。``deep=True`` 时对解压后的内容计算
+    SHA-256，只随内容变化，但需要解压全部部件。
 
-    try:
-        if isinstance(data, pd.DataFrame):
-            # 单个 DataFrame，写入指定工作表
-            with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-                data.to_excel(writer, sheet_name=sheet_name, index=False)
-        else:
-            # 字典形式，写入多个工作表
-            with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-                for sheet, df in data.items():
-                    df.to_excel(writer, sheet_name=sheet, index=False)
-    except PermissionError:
-        raise
-    except Exception as e:
-        raise FileWriteError(f"写入 Excel 文件失败: {e}") from e
-
-
-def get_sheet_names(file_path: str) -> list[str]:
-    """获取 Excel 文件中的所有工作表名称。
+    共享字符串表由所有工作表共用，任一工作表的文本变化时其他工作表的指纹也会变化
+    （可能误报变化，但不会漏报）。
 
     Args:
-        file_path: Excel 文件路径
+        file_path: Excel 文件路径（xlsx/xlsm）
+        deep: 为 True 时哈希各部件解压后的内容，否则哈希压缩后的原始字节
 
     Returns:
-        工作表名称列表
+        以工作表名称为键、按工作簿顺序排列的十六进制指纹字典
 
     Raises:
         FileNotFoundError: 文件不存在
+        ValueError: 不是 xlsx/xlsm 文件
         FileReadError: 读取文件时发生错误
 
     Example:
-        >>> sheets = get_sheet_names("data.xlsx")
-        >>> print(sheets)
-        ['Sheet1', 'Sheet2']
+        >>> previous = fingerprint_excel("daily.xlsx")
+        >>> current = fingerprint_excel("daily.xlsx")
+        >>> changed = [name for name in current if current[name] != previous.get(name)]
     """
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"文件不存在: {file_path}")
+    if path.suffix.lower() not in (".xlsx", ".xlsm"):
+        raise ValueError(f"仅支持 xlsx/xlsm 文件: {file_path}")
 
     try:
-        # 使用 pandas.ExcelFile 获取工作表名称
-        with pd.ExcelFile(file_path) as excel_file:
-            sheet_names: list[str] = excel_file.sheet_names
-            return sheet_names
-    except FileNotFoundError:
-        raise
+        with cached_xlsx_book(file_path) as book, open(file_path, "rb") as raw:
+            digests: dict[str | None, bytes] = {}
+
+            def part_digest(part: str | None) -> bytes:
+                if part not in digests:
+                    digests[part] = _part_digest(book.archive, raw, part, deep)
+                return digests[part]
+
+            common = (
+                part_digest(book.shared_strings_part)
+                + part_digest(book.styles_part)
+                + str(book.epoch).encode()
+            )
+            return {
+                name: hashlib.sha256(part_digest(part) + common).hexdigest()
+                for name, part in book.sheets.items()
+            }
     except Exception as e:
-        raise FileReadError(f"获取工作表名称失败: {e}") from e
+        raise FileReadError(f"计算 Excel 指纹失败: {e}") from e
+
+
+def _part_digest(
+    archive: zipfile.ZipFile, raw: IO[bytes], part: str | None, deep: bool
+) -> bytes:
+    """返回 zip 部件的 SHA-256 摘要，部件不存在时为固定值。"""
+    if part is None:
+        return b"-"
+    hasher = hashlib.sha256(part.encode())
+    if deep:
+        with archive.open(part) as source:
+            for block in iter(lambda: source.read(1024 * 1024), b""):
+                hasher.update(block)
+        return hasher.digest()
+    info = archive.getinfo(part)
+    hasher.update(
+        f":{info.compress_type}:{info.CRC}:{info.file_size}:{info.compress_size};".encode()
+    )
+    for block in raw_blocks(raw, info):
+        hasher.update(block)
+    return hasher.digest()
 
 
 def get_column_names(
@@ -159,6 +158,7 @@ def get_column_names(
     """获取 Excel 工作表的列名。
 
     如果第一行不是列名，可以通过 header 参数指定列名所在行，或使用 peek_rows 预览前几行。
+    只解析到表头行（或预览行）为止，不会读取整个工作表，列名以表头行的内容为准。
 
     Args:
         file_path: Excel 文件路径
@@ -192,17 +192,12 @@ def get_column_names(
         raise FileNotFoundError(f"文件不存在: {file_path}")
 
     try:
+        sheet = 0 if sheet_name is None else sheet_name
         # 如果 peek_rows > 0，读取前几行用于预览
         if peek_rows > 0:
             # 读取前 peek_rows + 1 行（包含可能的 header 行）
-            result_preview = pd.read_excel(
-                file_path, sheet_name=sheet_name, nrows=peek_rows, header=None
-            )
-            # 处理 sheet_name=None 时返回字典的情况
-            if isinstance(result_preview, dict):
-                df_preview = list(result_preview.values())[0]
-            else:
-                df_preview = result_preview
+            with cached_excel_file(file_path) as excel_file:
+                df_preview = excel_file.parse(sheet, nrows=peek_rows, header=None)
 
             preview_dict: dict[int, list[str]] = {}
             for idx in range(min(peek_rows, len(df_preview))):
@@ -214,13 +209,9 @@ def get_column_names(
                 preview_dict[idx] = row_values
             return preview_dict
 
-        # 正常获取列名
-        result = pd.read_excel(file_path, sheet_name=sheet_name, header=header)
-        # 处理 sheet_name=None 时返回字典的情况
-        if isinstance(result, dict):
-            df = list(result.values())[0]
-        else:
-            df = result
+        # 正常获取列名：nrows=0 时只流式解析到表头行为止，耗时与工作表行数无关
+        with cached_excel_file(file_path) as excel_file:
+            df = excel_file.parse(sheet, header=header, nrows=0)
         column_names: list[str] = list(df.columns)
         return column_names
     except FileNotFoundError:
@@ -235,6 +226,7 @@ def get_excel_info(
     file_path: str,
     include_preview: bool = False,
     preview_rows: int = 3,
+    fast: bool = False,
 ) -> dict[str, Any]:
     """获取 Excel 文件的完整信息。
 
@@ -244,6 +236,9 @@ def get_excel_info(
         file_path: Excel 文件路径
         include_preview: 是否包含每个工作表的数据预览（默认 False，避免数据量大时性能问题）
         preview_rows: 如果 include_preview=True，每个工作表预览的行数（默认 3 行）
+        fast: 是否使用仅读取元数据的快速模式（默认 False）。快速模式下行数取自
+            工作表 XML 中最后一个含有值的行（只扫描 XML 字节，不解析单元格），
+            列名与预览只解析表头行和预览行，列数以这些行为准
 
     Returns:
         包含文件信息的字典：
@@ -289,29 +284,39 @@ def get_excel_info(
         # 获取文件大小
         file_size = path.stat().st_size
 
-        # 获取所有工作表名称
-        with pd.ExcelFile(file_path) as excel_file:
-            sheet_names = excel_file.sheet_names
-
-        # 获取每个工作表的信息
-        sheets_info: list[dict[str, Any]] = []
-        for sheet_name in sheet_names:
-            # 读取工作表数据
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-
-            sheet_info: dict[str, Any] = {
-                "sheet_name": sheet_name,
-                "row_count": len(df),
-                "column_count": len(df.columns),
-                "column_names": list(df.columns),
-            }
-
-            # 如果需要预览数据
-            if include_preview:
-                preview_df = df.head(preview_rows)
-                sheet_info["preview"] = _df_preview_to_records(preview_df)
-
-            sheets_info.append(sheet_info)
+        with cached_excel_file(file_path) as excel_file:
+            sheet_names = list(excel_file.sheet_names)
+
+            # 获取每个工作表的信息
+            sheets_info: list[dict[str, Any]] = []
+            for sheet_name in sheet_names:
+                if fast and excel_file.engine == "openpyxl":
+                    # 快速模式：每个工作表只读取元数据和少量行
+                    sheets_info.append(
+                        _fast_sheet_info(
+                            file_path,
+                            excel_file.book[sheet_name],
+                            preview_rows if include_preview else None,
+                        )
+                    )
+                    continue
+
+                # 读取工作表数据
+                df = excel_file.parse(sheet_name)
+
+                sheet_info: dict[str, Any] = {
+                    "sheet_name": sheet_name,
+                    "row_count": len(df),
+                    "column_count": len(df.columns),
+                    "column_names": list(df.columns),
+                }
+
+                # 如果需要预览数据
+                if include_preview:
+                    preview_df = df.head(preview_rows)
+                    sheet_info["preview"] = df_preview_to_records(preview_df)
+
+                sheets_info.append(sheet_info)
 
         info: dict[str, Any] = {
             "file_path": str(path),
@@ -332,6 +337,7 @@ def get_sheet_info(
     file_path: str,
     sheet_name: str | int | None = None,
     preview_rows: int = 5,
+    fast: bool = False,
 ) -> dict[str, Any]:
     """获取 Excel 工作表的基本信息。
 
@@ -339,6 +345,8 @@ def get_sheet_info(
         file_path: Excel 文件路径
         sheet_name: 工作表名称或索引，None 表示读取第一个工作表
         preview_rows: 预览的行数（默认 5 行），用于展示数据样例
+        fast: 是否使用仅读取元数据的快速模式（默认 False），不再解析整个工作表，
+            规则同 ``get_excel_info``
 
     Returns:
         包含工作表信息的字典：
@@ -373,24 +381,18 @@ def get_sheet_info(
         raise FileNotFoundError(f"文件不存在: {file_path}")
 
     try:
-        # 读取完整数据
-        result = pd.read_excel(file_path, sheet_name=sheet_name)
-        # 处理 sheet_name=None 时返回字典的情况
-        if isinstance(result, dict):
-            df = list(result.values())[0]
-        else:
-            df = result
-
-        # 获取工作表名称
-        if sheet_name is None:
-            # 如果未指定，获取第一个工作表名称
-            with pd.ExcelFile(file_path) as excel_file:
-                actual_sheet_name = excel_file.sheet_names[0]
-        elif isinstance(sheet_name, int):
-            with pd.ExcelFile(file_path) as excel_file:
-                actual_sheet_name = excel_file.sheet_names[sheet_name]
-        else:
-            actual_sheet_name = sheet_name
+        with cached_excel_file(file_path) as excel_file:
+            # 获取工作表名称
+            actual_sheet_name = resolve_sheet_name(
+                list(excel_file.sheet_names), sheet_name
+            )
+            if fast and excel_file.engine == "openpyxl":
+                return _fast_sheet_info(
+                    file_path, excel_file.book[actual_sheet_name], preview_rows
+                )
+
+            # 读取完整数据
+            df = excel_file.parse(actual_sheet_name)
 
         # 获取基本信息
         row_count = len(df)
@@ -399,7 +401,7 @@ def get_sheet_info(
 
         # 获取预览数据（转换为字典列表，便于 JSON 序列化）
         preview_df = df.head(preview_rows)
-        preview = _df_preview_to_records(preview_df)
+        preview = df_preview_to_records(preview_df)
 
         info: dict[str, Any] = {
             "sheet_name": actual_sheet_name,
@@ -416,3 +418,44 @@ def get_sheet_info(
         raise ValueError(f"工作表不存在或无效: {e}") from e
     except Exception as e:
         raise FileReadError(f"获取工作表信息失败: {e}") from e
+
+
+def _fast_sheet_info(
+    file_path: str, worksheet: Any, preview_rows: int | None
+) -> dict[str, Any]:
+    """只解析表头行与预览行，构造工作表信息。
+
+    ``<dimension>`` 元素可能缺失或偏大（如带格式的空行），不作为行数的依据：
+    行数取自工作表 XML 中最后一个含有值的行，只扫描 XML 字节，不解析单元格。
+
+    Args:
+        file_path: Excel 文件路径
+        worksheet: openpyxl 只读工作表
+        preview_rows: 预览行数，None 表示不生成预览
+
+    Returns:
+        与完整模式结构相同的工作表信息字典
+    """
+    worksheet.reset_dimensions()
+    with closing(iter_sheet_values(worksheet)) as rows:
+        head = list(islice(rows, (preview_rows or 0) + 1))
+
+    columns = header_names(head[0]) if head else []
+    data_rows = head[1:]
+    for values in data_rows:
+        if len(values) > len(columns):
+            columns.extend(f"Unnamed: {i}" for i in range(len(columns), len(values)))
+
+    with cached_xlsx_book(file_path) as book:
+        last_row = book.last_value_row(worksheet.title)
+
+    info: dict[str, Any] = {
+        "sheet_name": worksheet.title,
+        "row_count": max(last_row - 1, 0),
+        "column_count": len(columns),
+        "column_names": columns,
+    }
+    if preview_rows is not None:
+        preview_df = rows_to_frame(data_rows, columns)
+        info["preview"] = df_preview_to_records(preview_df)
+    return info
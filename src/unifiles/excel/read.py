@@ -0,0 +1,776 @@
+"""Excel 读取功能。"""
+
+import glob
+import operator
+import os
+import time
+import warnings
+from collections import deque
+from collections.abc import Callable, Container, Hashable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import openpyxl
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+
+from ..cache import cache_key, load_entry, store_entry
+from ..exceptions import FileReadError
+from ._common import (
+    compact_frame,
+    frame_from_arrays,
+    frame_to_arrays,
+    header_names,
+    iter_sheet_values,
+    pack_frame,
+    resolve_sheet_name,
+    rows_to_frame,
+    trim_row,
+    unpack_frame,
+)
+from ._engines import check_engine, resolve_engine
+from ._native import read_sheet_native
+from ._workbook_cache import cached_excel_file, cached_xlsx_book
+
+# 行过滤条件支持的运算符
+_FILTER_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda value, operand: value in operand,
+    "not in": lambda value, operand: value not in operand,
+}
+
+_Filter = tuple[str | int, str, Any]
+
+# Excel 工作表的最大列数（XFD）
+MAX_COLUMN = 16384
+
+
+def read_excel(
+    file_path: str,
+    sheet_name: str | int | None = None,
+    usecols: str | list[str | int] | None = None,
+    filters: list[_Filter] | None = None,
+    cache: bool = False,
+    engine: str | None = None,
+    compact: bool = False,
+    cell_range: str | None = None,
+) -> pd.DataFrame:
+    """读取 Excel 文件内容。
+
+    指定 usecols、filters 或 cell_range 时（仅支持 xlsx/xlsm），在流式解析工作表 XML
+    的同时完成区域限定、列选择与行过滤：未选中列的单元格不会被转换为 Python 值，
+    不满足条件的行不会进入 DataFrame，区域之后的行不会被解析，可以显著减少解析时间
+    与峰值内存。
+
+    Args:
+        file_path: Excel 文件路径
+        sheet_name: 工作表名称或索引，None 表示读取第一个工作表
+        usecols: 要读取的列，可以是列字母字符串（如 ``"A:C,F"``），或由列名 / 列索引
+            （0-based）组成的列表；结果中的列按文件中的顺序排列。None 表示全部列
+        filters: 行过滤条件列表，每个条件为 ``(列, 运算符, 值)``，列为列名或列索引，
+            运算符为 ``==``、``!=``、``<``、``<=``、``>``、``>=``、``in``、``not in``；
+            多个条件之间为“且”的关系。空单元格或类型无法比较时视为不满足条件。
+            过滤列不必包含在 usecols 中
+        cache: 为 True 时使用磁盘缓存（见 ``configure_cache``）：解析结果按列存储在
+            缓存目录中，源文件（路径、大小、修改时间、内容哈希）未变化时直接加载；
+            指定 usecols、filters 或 cell_range 时不使用缓存
+        engine: 读取引擎。None 表示使用 pandas 的默认引擎（xlsx 为 openpyxl）；
+            ``"native"`` 表示直接流式解析工作表 XML 并按列整体转换数字与日期
+            （仅支持 xlsx/xlsm），结果与 openpyxl 相同，大工作表上速度更快；
+            ``"calamine"``、``"pyxlsb"``（xlsb）、``"xlrd"``（xls）、``"odf"``（ods）
+            需要安装对应的可选依赖；``"auto"`` 按文件类型选择已安装的最快引擎
+            （见 ``available_excel_engines``）
+        compact: 为 True 时使用更省内存的 dtype：重复取值较多的字符串列（不同取值数
+            不超过非空值数量的一半）转换为 ``category``，整数列降为最小的整数类型，
+            浮点列在不损失精度时降为 float32。与 ``engine="native"`` 同时使用时，
+            只含共享字符串的列由共享字符串索引直接生成 Categorical 代码
+        cell_range: 只读取的单元格区域，如 ``"B2:F5000"``、``"B:F"``（整列）或
+            ``"3:100"``（整行），区域的第一行为列名，区域外的单元格被忽略，超过区域
+            最后一行的内容不再解析。与 usecols 同时使用时，列字母指工作表中的列，
+            列名与列索引相对于区域
+
+    Returns:
+        包含 Excel 数据的 DataFrame 对象；指定 filters 时行索引重新从 0 开始
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 工作表不存在或无效；
+            usecols / filters / cell_range 无效；
+            引擎不支持该文件或未安装
+        FileReadError: 读取文件时发生错误
+
+    Example:
+        >>> df = read_excel("data.xlsx", sheet_name="Sheet1")
+        >>> print(df.head())
+        >>> # 使用索引读取
+        >>> df = read_excel("data.xlsx", sheet_name=0)
+        >>> # 读取第一个工作表
+        >>> df = read_excel("data.xlsx")
+        >>> # 只读取两列中金额大于 100 的行
+        >>> df = read_excel(
+        ...     "data.xlsx", usecols=["姓名", "金额"], filters=[("金额", ">", 100)]
+        ... )
+        >>> # 只读取模板中固定位置的数据块（第 2 行为列名）
+        >>> df = read_excel("template.xlsx", cell_range="B2:F5000")
+        >>> # 重复读取未修改的文件时从磁盘缓存加载
+        >>> df = read_excel("data.xlsx", cache=True)
+        >>> # 大工作表使用原生引擎
+        >>> df = read_excel("large.xlsx", engine="native")
+        >>> # 自动选择最快的可用引擎（如已安装 python-calamine 时读取 xlsb）
+        >>> df = read_excel("data.xlsb", engine="auto")
+        >>> # 状态码、地区等低基数字符串列读取为 category
+        >>> df = read_excel("large.xlsx", engine="native", compact=True)
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"文件不存在: {file_path}")
+    engine = resolve_engine(engine, file_path, "read")
+
+    pushdown = usecols is not None or filters is not None or cell_range is not None
+    if cache and not pushdown:
+        return _read_cached(file_path, sheet_name, engine, compact)
+
+    if pushdown:
+        if path.suffix.lower() not in (".xlsx", ".xlsm"):
+            raise ValueError(
+                f"usecols、filters 与 cell_range 仅支持 xlsx/xlsm 文件: {file_path}"
+            )
+        for _column, op, _value in filters or []:
+            if op not in _FILTER_OPERATORS:
+                raise ValueError(f"不支持的过滤运算符: {op}")
+        bounds = _parse_cell_range(cell_range)
+        try:
+            df = _read_pushdown(file_path, sheet_name, usecols, filters or [], bounds)
+            return compact_frame(df) if compact else df
+        except ValueError as e:
+            raise ValueError(f"工作表或列不存在或无效: {e}") from e
+        except Exception as e:
+            raise FileReadError(f"读取 Excel 文件失败: {e}") from e
+
+    try:
+        if engine == "native":
+            with cached_xlsx_book(file_path) as book:
+                return read_sheet_native(
+                    book, resolve_sheet_name(book.sheet_names, sheet_name), compact
+                )
+        if engine in (None, "openpyxl"):
+            # 同一未修改文件的多次调用共享已解析的工作簿句柄
+            with cached_excel_file(file_path) as excel_file:
+                df = excel_file.parse(0 if sheet_name is None else sheet_name)
+        else:
+            df = pd.read_excel(
+                file_path, 0 if sheet_name is None else sheet_name, engine=engine
+            )
+        return compact_frame(df) if compact else df
+    except FileNotFoundError:
+        raise
+    except ValueError as e:
+        raise ValueError(f"工作表不存在或无效: {e}") from e
+    except Exception as e:
+        raise FileReadError(f"读取 Excel 文件失败: {e}") from e
+
+
+def read_excel_sheets(
+    file_path: str,
+    sheets: list[str | int] | None = None,
+    workers: int | None = None,
+) -> dict[str, pd.DataFrame]:
+    """使用多个进程并行读取多个工作表。
+
+    每个工作表在独立的工作进程中解析，结果与 ``read_excel`` 逐个读取一致。
+    字符串列以整数代码加去重取值的形式传回主进程，避免逐个序列化大量字符串对象。
+
+    Args:
+        file_path: Excel 文件路径
+        sheets: 要读取的工作表名称或索引列表，None 表示全部工作表
+        workers: 工作进程数，None 表示 ``min(工作表数, CPU 核数)``；
+            为 1 时在当前进程中顺序读取
+
+    Returns:
+        以工作表名称为键、按 sheets 顺序排列的 DataFrame 字典
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 工作表不存在或无效，或 workers 无效
+        FileReadError: 读取文件时发生错误
+
+    Example:
+        >>> frames = read_excel_sheets("report.xlsx", workers=8)
+        >>> for name, df in frames.items():
+        ...     print(name, len(df))
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"文件不存在: {file_path}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers 必须为正整数: {workers}")
+
+    try:
+        with cached_excel_file(file_path) as excel_file:
+            sheet_names = [str(name) for name in excel_file.sheet_names]
+    except Exception as e:
+        raise FileReadError(f"读取 Excel 文件失败: {e}") from e
+
+    try:
+        names = [
+            resolve_sheet_name(sheet_names, sheet)
+            for sheet in (sheet_names if sheets is None else sheets)
+        ]
+    except ValueError as e:
+        raise ValueError(f"工作表不存在或无效: {e}") from e
+    names = list(dict.fromkeys(names))
+    if workers is None:
+        workers = min(len(names), os.cpu_count() or 1)
+
+    if workers <= 1 or len(names) <= 1:
+        return {name: read_excel(file_path, name) for name in names}
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            packed = list(
+                executor.map(_read_sheet_packed, [file_path] * len(names), names)
+            )
+    except (ValueError, FileReadError):
+        raise
+    except Exception as e:
+        raise FileReadError(f"读取 Excel 文件失败: {e}") from e
+    return {name: unpack_frame(item) for name, item in zip(names, packed)}
+
+
+def read_excel_many(
+    paths: str | list[str],
+    sheet_name: str | int | None = None,
+    workers: int | None = None,
+    source_column: str | None = None,
+    as_iterator: bool = False,
+    engine: str | None = None,
+    report: dict[str, Any] | None = None,
+) -> pd.DataFrame | Iterator[tuple[str, pd.DataFrame]]:
+    """使用多个进程并行读取多个 Excel 文件。
+
+    每个文件在工作进程中用 ``read_excel`` 读取，结果按输入顺序返回。单个文件读取失败
+    不会中断整批读取：失败的文件被跳过，错误信息记录在 ``report["errors"]`` 中
+    （未传入 report 时在结束后发出一条 ``RuntimeWarning``）。
+
+    Args:
+        paths: 文件路径列表，或 glob 模式字符串（如 ``"exports/*.xlsx"``，
+            支持 ``**`` 递归匹配，按路径排序）
+        sheet_name: 每个文件要读取的工作表名称或索引，None 表示第一个工作表
+        workers: 工作进程数，None 表示 ``min(文件数, CPU 核数)``；
+            为 1 时在当前进程中顺序读取
+        source_column: 来源文件列的列名，指定时在每个 DataFrame 末尾追加该列，
+            取值为文件路径；None 表示不追加
+        as_iterator: 为 True 时返回逐个产出 ``(路径, DataFrame)`` 的迭代器，
+            同时只保留少量已读取的结果；为 False 时返回合并后的 DataFrame
+        engine: 读取引擎，含义与 ``read_excel`` 相同
+        report: 可选的字典，读取过程中写入统计信息：``files``（文件总数）、
+            ``succeeded``、``failed``、``rows``（已读取行数）、``elapsed``（秒）、
+            ``files_per_second``、``rows_per_second`` 与 ``errors``
+            （``{"path", "error"}`` 字典列表）
+
+    Returns:
+        按输入顺序合并的 DataFrame（行索引从 0 重新编号，没有成功读取的文件时为空
+        DataFrame），或 ``(路径, DataFrame)`` 迭代器
+
+    Raises:
+        FileNotFoundError: glob 模式没有匹配的文件
+        ValueError: workers 无效或引擎不支持
+        FileReadError: 进程池异常终止
+
+    Example:
+        >>> stats = {}
+        >>> df = read_excel_many("exports/*.xlsx", source_column="source", report=stats)
+        >>> print(stats["files_per_second"], stats["errors"])
+        >>> for path, df in read_excel_many(paths, as_iterator=True):
+        ...     print(path, len(df))
+    """
+    if isinstance(paths, str):
+        files = sorted(glob.glob(paths, recursive=True))
+        if not files:
+            raise FileNotFoundError(f"没有匹配的文件: {paths}")
+    else:
+        files = [str(path) for path in paths]
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers 必须为正整数: {workers}")
+    check_engine(engine, "read")
+    if workers is None:
+        workers = min(len(files), os.cpu_count() or 1)
+
+    stats = report if report is not None else {}
+    stats.update(
+        files=len(files),
+        succeeded=0,
+        failed=0,
+        rows=0,
+        elapsed=0.0,
+        files_per_second=0.0,
+        rows_per_second=0.0,
+        errors=[],
+    )
+    frames = _iter_many(files, sheet_name, engine, workers, source_column, stats)
+    if report is None:
+        frames = _warn_errors(frames, stats)
+    if as_iterator:
+        return frames
+    results = [df for _, df in frames]
+    if not results:
+        return pd.DataFrame()
+    return pd.concat(results, ignore_index=True)
+
+
+def iter_excel_rows(
+    file_path: str,
+    sheet_name: str | int | None = None,
+    header: int | None = 0,
+    as_dict: bool = False,
+) -> Iterator[tuple[Any, ...] | dict[Hashable, Any]]:
+    """逐行流式读取 Excel 工作表。
+
+    以 openpyxl 只读模式打开工作簿，每次只解析并产出一行，内存占用不随行数增长，
+    适合处理数十万行以上的大文件。列名规则与 ``get_column_names`` 一致。
+
+    Args:
+        file_path: Excel 文件路径
+        sheet_name: 工作表名称或索引，None 表示读取第一个工作表
+        header: 列名所在行（0-based），该行之前的行会被跳过，None 表示无列名
+        as_dict: 为 True 时每行产出以列名为键的字典，否则产出元组；
+            header 为 None 时字典的键为列索引（从 0 开始）
+
+    Yields:
+        每个数据行对应的元组或字典，空单元格为 None
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 工作表不存在或无效，或 header 超出范围（迭代时抛出）
+        FileReadError: 读取文件时发生错误（迭代时抛出）
+
+    Example:
+        >>> for row in iter_excel_rows("large.xlsx"):
+        ...     print(row)
+        (1, '张三', 25)
+        >>> # 以字典形式逐行读取
+        >>> for record in iter_excel_rows("large.xlsx", as_dict=True):
+        ...     print(record["姓名"])
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"文件不存在: {file_path}")
+    if header is not None and header < 0:
+        raise ValueError(f"header 必须为非负整数或 None: {header}")
+
+    return _iter_rows(file_path, sheet_name, header, as_dict)
+
+
+def read_excel_chunks(
+    file_path: str,
+    chunksize: int,
+    sheet_name: str | int | None = None,
+    header: int | None = 0,
+) -> Iterator[pd.DataFrame]:
+    """分块读取 Excel 工作表，每次产出 chunksize 行的 DataFrame。
+
+    工作表 XML 只顺序解析一遍，不会为每个分块重新读取文件。每个分块使用与
+    ``read_excel`` 相同的 pandas 解析器构造，因此同样的数据得到同样的 dtype；
+    行索引在分块之间连续。注意：dtype 由分块内的数据推断，例如整数列只在包含
+    空值的分块中为 float64。
+
+    Args:
+        file_path: Excel 文件路径
+        chunksize: 每个分块的行数，必须为正整数
+        sheet_name: 工作表名称或索引，None 表示读取第一个工作表
+        header: 列名所在行（0-based），None 表示无列名
+
+    Yields:
+        每个分块对应的 DataFrame；工作表没有数据行时产出一个只有列名的空 DataFrame
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: chunksize 无效；工作表不存在或无效，或 header 超出范围（迭代时抛出）
+        FileReadError: 读取文件时发生错误（迭代时抛出）
+
+    Example:
+        >>> for chunk in read_excel_chunks("large.xlsx", chunksize=10000):
+        ...     process(chunk)
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"文件不存在: {file_path}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize 必须为正整数: {chunksize}")
+    if header is not None and header < 0:
+        raise ValueError(f"header 必须为非负整数或 None: {header}")
+
+    return _iter_chunks(file_path, chunksize, sheet_name, header)
+
+
+def _read_cached(
+    file_path: str, sheet_name: str | int | None, engine: str | None, compact: bool
+) -> pd.DataFrame:
+    """通过磁盘缓存读取工作表，未命中时解析并写入缓存。"""
+    try:
+        # native 与 openpyxl 引擎的结果相同，可以共享缓存条目
+        variant = None if engine in (None, "openpyxl", "native") else engine
+        # 升级 pandas 或 openpyxl 可能改变解析结果（类型推断、日期转换），旧条目随之失效
+        key = cache_key(
+            file_path,
+            "read_excel",
+            sheet_name,
+            compact,
+            variant,
+            pd.__version__,
+            openpyxl.__version__,
+        )
+    except OSError as e:
+        raise FileReadError(f"读取 Excel 文件失败: {e}") from e
+    arrays = load_entry("excel", key)
+    if arrays is not None:
+        return frame_from_arrays(arrays)
+    df = read_excel(file_path, sheet_name, engine=engine, compact=compact)
+    arrays = frame_to_arrays(df)
+    # 含有无法编码的值（如自定义对象）时不写入缓存
+    if arrays is not None:
+        store_entry("excel", key, arrays)
+    return df
+
+
+def _read_sheet_packed(file_path: str, sheet_name: str) -> dict[str, Any]:
+    """工作进程中读取单个工作表并打包结果。"""
+    return pack_frame(read_excel(file_path, sheet_name))
+
+
+def _read_file_packed(
+    file_path: str, sheet_name: str | int | None, engine: str | None
+) -> tuple[dict[str, Any] | None, str | None]:
+    """工作进程中读取单个文件并打包结果，失败时返回错误信息。"""
+    try:
+        return pack_frame(read_excel(file_path, sheet_name, engine=engine)), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _iter_many(
+    files: list[str],
+    sheet_name: str | int | None,
+    engine: str | None,
+    workers: int,
+    source_column: str | None,
+    stats: dict[str, Any],
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """按输入顺序产出读取成功的文件，并持续更新统计信息。"""
+    errors: list[dict[str, str]] = stats["errors"]
+    start = time.perf_counter()
+
+    def record(
+        path: str, result: tuple[dict[str, Any] | None, str | None]
+    ) -> pd.DataFrame | None:
+        packed, error = result
+        df = None
+        if packed is None:
+            stats["failed"] += 1
+            errors.append({"path": path, "error": str(error)})
+        else:
+            df = unpack_frame(packed)
+            if source_column is not None:
+                df[source_column] = path
+            stats["succeeded"] += 1
+            stats["rows"] += len(df)
+        elapsed = time.perf_counter() - start
+        done = stats["succeeded"] + stats["failed"]
+        stats.update(
+            elapsed=elapsed,
+            files_per_second=done / elapsed if elapsed else 0.0,
+            rows_per_second=stats["rows"] / elapsed if elapsed else 0.0,
+        )
+        return df
+
+    if workers <= 1 or len(files) <= 1:
+        for path in files:
+            df = record(path, _read_file_packed(path, sheet_name, engine))
+            if df is not None:
+                yield path, df
+        return
+
+    # 只保持有限数量的未完成任务，避免结果在主进程中堆积
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending: deque[tuple[str, Future[Any]]] = deque()
+    remaining = iter(files)
+    try:
+        for path in remaining:
+            pending.append(
+                (path, executor.submit(_read_file_packed, path, sheet_name, engine))
+            )
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            path, future = pending.popleft()
+            try:
+                result = future.result()
+            except Exception as e:
+                raise FileReadError(f"读取 Excel 文件失败: {e}") from e
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append(
+                    (
+                        next_path,
+                        executor.submit(
+                            _read_file_packed, next_path, sheet_name, engine
+                        ),
+                    )
+                )
+            df = record(path, result)
+            if df is not None:
+                yield path, df
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _warn_errors(
+    frames: Iterator[tuple[str, pd.DataFrame]], stats: dict[str, Any]
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """读取结束后对失败的文件发出一条警告。"""
+    yield from frames
+    if stats["errors"]:
+        failed = ", ".join(item["path"] for item in stats["errors"][:5])
+        warnings.warn(
+            f"{stats['failed']} 个 Excel 文件读取失败（已跳过）: {failed}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+
+def _iter_rows(
+    file_path: str,
+    sheet_name: str | int | None,
+    header: int | None,
+    as_dict: bool,
+) -> Iterator[tuple[Any, ...] | dict[Hashable, Any]]:
+    columns: list[Hashable] = []
+    for values in _iter_records(file_path, sheet_name, header, columns):
+        if as_dict:
+            yield dict(zip(columns, values))
+        else:
+            yield tuple(values)
+
+
+def _iter_chunks(
+    file_path: str,
+    chunksize: int,
+    sheet_name: str | int | None,
+    header: int | None,
+) -> Iterator[pd.DataFrame]:
+    columns: list[Hashable] = []
+    batch: list[list[Any]] = []
+    start = 0
+    for values in _iter_records(file_path, sheet_name, header, columns):
+        batch.append(values)
+        if len(batch) == chunksize:
+            yield rows_to_frame(batch, columns, start)
+            start += len(batch)
+            batch = []
+    if batch or start == 0:
+        yield rows_to_frame(batch, columns, start)
+
+
+def _iter_records(
+    file_path: str,
+    sheet_name: str | int | None,
+    header: int | None,
+    columns: list[Hashable],
+) -> Iterator[list[Any]]:
+    """流式产出数据行的值列表，并就地填充 columns。
+
+    每行补齐到当前列数；遇到比列名更宽的行时，columns 会追加 ``Unnamed: i``
+    （无列名时为列索引）。
+    """
+    try:
+        workbook = load_workbook(
+            file_path, read_only=True, data_only=True, keep_links=False
+        )
+    except Exception as e:
+        raise FileReadError(f"读取 Excel 文件失败: {e}") from e
+
+    try:
+        worksheet = workbook[resolve_sheet_name(workbook.sheetnames, sheet_name)]
+        # 部分程序写出的 dimension 不可靠，按实际内容逐行解析
+        worksheet.reset_dimensions()
+        rows = iter_sheet_values(worksheet)
+
+        if header is not None:
+            for index, values in enumerate(rows):
+                if index == header:
+                    columns.extend(header_names(values))
+                    break
+            else:
+                raise ValueError(f"header 超出范围: {header}")
+
+        for values in rows:
+            if len(values) > len(columns):
+                columns.extend(
+                    f"Unnamed: {i}" if header is not None else i
+                    for i in range(len(columns), len(values))
+                )
+            values.extend([None] * (len(columns) - len(values)))
+            yield values
+    except ValueError as e:
+        raise ValueError(f"工作表不存在或无效，或 header 超出范围: {e}") from e
+    except Exception as e:
+        raise FileReadError(f"读取 Excel 文件失败: {e}") from e
+    finally:
+        workbook.close()
+
+
+def _resolve_usecols(
+    spec: str | list[str | int],
+    names: list[Hashable],
+    offset: int = 0,
+    width: int | None = None,
+) -> list[int]:
+    """将 usecols 解析为列索引（0-based），按文件中的顺序去重排列。
+
+    列字母表示工作表中的列，offset 为单元格区域左侧的列数，width 为区域的列数
+    （None 表示不限），结果相对于区域的第一列。
+    """
+    positions: set[int] = set()
+    if isinstance(spec, str):
+        for part in spec.replace(" ", "").split(","):
+            first, _, last = part.partition(":")
+            start = column_index_from_string(first.upper())
+            end = column_index_from_string(last.upper()) if last else start
+            if start <= offset or (width is not None and end > offset + width):
+                raise ValueError(f"列不在单元格区域内: {part}")
+            positions.update(range(start - 1 - offset, end - offset))
+    else:
+        positions.update(_resolve_column(column, names, width) for column in spec)
+    return sorted(positions)
+
+
+def _resolve_column(
+    column: str | int, names: list[Hashable], width: int | None = None
+) -> int:
+    if isinstance(column, int):
+        if column < 0:
+            raise ValueError(f"列索引必须为非负整数: {column}")
+        if width is not None and column >= width:
+            raise ValueError(f"列不在单元格区域内: {column}")
+        return column
+    if column not in names:
+        raise ValueError(f"列不存在: {column}")
+    return names.index(column)
+
+
+def _parse_cell_range(
+    cell_range: str | None,
+) -> tuple[int, int, int | None, int | None]:
+    """将单元格区域解析为 (min_col, min_row, max_col, max_row)，None 表示不限。"""
+    if cell_range is None:
+        return (1, 1, None, None)
+    try:
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range.upper())
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"单元格区域无效: {cell_range}") from e
+    return (min_col or 1, min_row or 1, max_col, max_row)
+
+
+def _matches(value: Any, op: str, operand: Any) -> bool:
+    if value is None:
+        return False
+    try:
+        return bool(_FILTER_OPERATORS[op](value, operand))
+    except TypeError:
+        return False
+
+
+def _read_pushdown(
+    file_path: str,
+    sheet_name: str | int | None,
+    usecols: str | list[str | int] | None,
+    filters: list[_Filter],
+    bounds: tuple[int, int, int | None, int | None] = (1, 1, None, None),
+) -> pd.DataFrame:
+    """流式读取工作表，解析时只转换需要的列并过滤行。
+
+    bounds 为单元格区域 (min_col, min_row, max_col, max_row)（1-based，None 表示
+    不限），区域的第一行为列名，超过 max_row 的行不再解析。
+    """
+    min_col, min_row, max_col, max_row = bounds
+    offset = min_col - 1
+    in_range = None
+    if offset or max_col is not None:
+        in_range = range(min_col, (max_col or MAX_COLUMN) + 1)
+
+    with cached_xlsx_book(file_path) as book:
+        name = resolve_sheet_name(book.sheet_names, sheet_name)
+
+        header_values: list[Any] = []
+        for row_number, cells, _has_value in book.iter_rows(
+            name, columns=in_range, max_row=min_row
+        ):
+            if row_number == min_row:
+                values: dict[int, Any] = {
+                    column - offset: value for column, value in cells
+                }
+                header_values = [
+                    values.get(i) for i in range(1, max(values, default=0) + 1)
+                ]
+        names = header_names(trim_row(header_values))
+
+        range_width = None if max_col is None else max_col - offset
+        selected = (
+            None
+            if usecols is None
+            else _resolve_usecols(usecols, names, offset, range_width)
+        )
+        predicates = [
+            (_resolve_column(column, names, range_width) + 1, op, value)
+            for column, op, value in filters
+        ]
+        needed: Container[int] | None = in_range
+        if selected is not None:
+            positions = {position + 1 for position in selected}
+            positions.update(column for column, _op, _value in predicates)
+            needed = {position + offset for position in positions}
+
+        rows: list[dict[int, Any]] = []
+        width = len(names)
+        pending_empty = 0
+        next_row = min_row + 1
+        for row_number, cells, has_value in book.iter_rows(
+            name, columns=needed, max_row=max_row
+        ):
+            if row_number <= min_row:
+                continue
+            # XML 中省略的行与不含值的行都是空行；末尾的空行会被丢弃
+            pending_empty += row_number - next_row
+            next_row = row_number + 1
+            if in_range is not None:
+                # 只读取单元格区域时，按区域内是否有值判断空行
+                has_value = bool(cells)
+            if not has_value:
+                pending_empty += 1
+                continue
+            if pending_empty and not predicates:
+                rows.extend({} for _ in range(pending_empty))
+            pending_empty = 0
+
+            values = {column - offset: value for column, value in cells}
+            if all(_matches(values.get(c), op, v) for c, op, v in predicates):
+                rows.append(values)
+                if selected is None and cells:
+                    width = max(width, cells[-1][0] - offset)
+
+    if selected is None:
+        names.extend(f"Unnamed: {i}" for i in range(len(names), width))
+        selected = list(range(width))
+    columns = [
+        names[position] if position < len(names) else f"Unnamed: {position}"
+        for position in selected
+    ]
+    data = [[values.get(position + 1) for position in selected] for values in rows]
+    return rows_to_frame(data, columns)
@@ -0,0 +1,386 @@
+"""Excel 写入功能。"""
+
+import io
+import os
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+from openpyxl import Workbook
+
+from .._zip import zip_options
+from ..exceptions import FileWriteError
+from ._append import append_sheets
+from ._common import cell_value, check_sheet_names, frame_rows, save_workbook
+from ._engines import check_engine, resolve_engine
+from ._parallel import write_sheets_parallel
+from ._workbook_cache import evict
+
+# Excel 单个工作表的最大行数
+MAX_SHEET_ROWS = 1_048_576
+
+_MISSING = object()
+
+
+def write_excel(
+    data: pd.DataFrame | dict[str, pd.DataFrame],
+    file_path: str,
+    sheet_name: str = "Sheet1",
+    streaming: bool = False,
+    mode: str = "w",
+    if_sheet_exists: str = "error",
+    engine: str | None = None,
+    split_sheets: bool = False,
+    max_rows_per_sheet: int | None = None,
+    parallel: bool = False,
+    workers: int | None = None,
+    compression: str = "default",
+) -> None:
+    """将数据写入 Excel 文件。
+
+    支持写入单个 DataFrame 或多个 DataFrame（字典形式）。
+    注意：默认（mode="w"）会覆盖整个目标文件，不保留原文件中的其他 Sheet；
+    mode="a" 时向已有的 xlsx/xlsm 文件追加工作表，其他工作表保持不变。
+
+    Args:
+        data: 要写入的数据，可以是单个 DataFrame 或字典（多工作表）
+        file_path: 输出 Excel 文件路径
+        sheet_name: 工作表名称（当 data 为 DataFrame 时使用）
+        streaming: 为 True 时使用 openpyxl write_only 工作簿流式写入，行数据逐批
+            写入工作表 XML，不为每个单元格保留对象，适合数十万行以上的数据；
+            写入的数据与默认方式相同，但表头不带加粗和边框样式
+        mode: ``"w"`` 覆盖写入；``"a"`` 追加到已有文件：其他工作表等部件按原始
+            压缩字节复制到新文件，只生成新工作表的 XML 并更新工作簿清单，耗时取决于
+            新工作表的大小而不是整个工作簿的大小（新工作表的表头不带样式）
+        if_sheet_exists: mode="a" 时同名工作表（不区分大小写）已存在的处理方式：
+            ``"error"`` 抛出 ValueError，``"replace"`` 替换该工作表（保留原名称）
+        engine: 写入引擎，None 表示 openpyxl；``"xlsxwriter"``（仅 xlsx，速度更快）
+            与 ``"odf"``（ods）需要安装对应的可选依赖；``"auto"`` 按文件类型选择已安装
+            的最快引擎。streaming=True 或 mode="a" 时总是使用内置的写入方式，
+            只接受 None、``"auto"`` 与 ``"openpyxl"``
+        split_sheets: 为 True 时流式写入，行数超过单个工作表的上限时依次写入
+            ``{sheet_name}_1``、``{sheet_name}_2`` 等工作表，每个工作表都带表头；
+            不需要预先复制各工作表的数据，内存占用不随行数增长
+        max_rows_per_sheet: 拆分时每个工作表的最大行数（含表头），None 表示 Excel 的
+            上限 1,048,576 行
+        parallel: 为 True 时（仅 xlsx）每个工作表的 XML 在独立的工作进程中生成并压缩，
+            主进程只组装 zip 文件，适合包含大量工作表的导出；字符串写为内联字符串，
+            表头不带样式。不能与 mode="a"、split_sheets 同时使用
+        workers: parallel=True 时的工作进程数，None 表示 ``min(工作表数, CPU 核数)``；
+            为 1 时在当前进程中顺序生成
+        compression: zip 压缩配置：``"default"``（zlib 默认级别）、``"fastest"``
+            （写入最快，文件较大，适合临时的中间文件）、``"smallest"``（文件最小，
+            适合归档）或 ``"store"``（不压缩）。只有 openpyxl 引擎与内置写入方式支持；
+            mode="a" 时只作用于新写入的部件，原样复制的条目保持原来的压缩方式
+
+    Raises:
+        FileNotFoundError: mode="a" 时文件不存在
+        ValueError: 数据格式或参数无效；
+            工作表已存在（if_sheet_exists="error"）；
+            引擎不支持该文件或未安装
+        PermissionError: 文件权限不足
+        FileWriteError: 写入文件时发生错误
+
+    Example:
+        >>> # 写入单个 DataFrame
+        >>> df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+        >>> write_excel(df, "output.xlsx", sheet_name="Results")
+        >>> # 写入多个工作表
+        >>> data_dict = {"Sheet1": df1, "Sheet2": df2}
+        >>> write_excel(data_dict, "output.xlsx")
+        >>> # 大数据量时流式写入
+        >>> write_excel(large_df, "large.xlsx", streaming=True)
+        >>> # 向已有工作簿追加（或替换）一个工作表
+        >>> write_excel(df, "report.xlsx", sheet_name="Summary", mode="a")
+        >>> write_excel(
+        ...     df, "report.xlsx", sheet_name="Summary", mode="a", if_sheet_exists="replace"
+        ... )
+        >>> # 超过 1,048,576 行时拆分到 Data_1、Data_2 等多个工作表
+        >>> write_excel(huge_df, "huge.xlsx", sheet_name="Data", split_sheets=True)
+        >>> # 多个工作表并行生成
+        >>> write_excel(frames_by_region, "regions.xlsx", parallel=True, workers=8)
+        >>> # 临时中间文件：以最低压缩级别换取写入速度
+        >>> write_excel(df, "intermediate.xlsx", streaming=True, compression="fastest")
+        >>> # 已安装 XlsxWriter 时使用更快的写入引擎
+        >>> write_excel(df, "output.xlsx", engine="auto")
+    """
+    if not isinstance(data, (pd.DataFrame, dict)):
+        raise ValueError(
+            f"数据格式无效，期望 DataFrame 或 dict，实际类型: {type(data)}"
+        )
+
+    # 如果是字典，先验证所有值都是 DataFrame
+    if isinstance(data, dict):
+        for sheet, df in data.items():
+            if not isinstance(df, pd.DataFrame):
+                raise ValueError(f"字典值必须是 DataFrame，实际类型: {type(df)}")
+
+    if mode not in ("w", "a"):
+        raise ValueError(f"mode 必须为 'w' 或 'a': {mode}")
+    if if_sheet_exists not in ("error", "replace"):
+        raise ValueError(
+            f"if_sheet_exists 必须为 'error' 或 'replace': {if_sheet_exists}"
+        )
+
+    if max_rows_per_sheet is not None and not 2 <= max_rows_per_sheet <= MAX_SHEET_ROWS:
+        raise ValueError(
+            f"max_rows_per_sheet 必须在 2 到 {MAX_SHEET_ROWS} 之间: {max_rows_per_sheet}"
+        )
+    if split_sheets and mode == "a":
+        raise ValueError("追加模式不支持 split_sheets")
+    zip_options(compression)
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers 必须为正整数: {workers}")
+    if parallel and (mode == "a" or split_sheets):
+        raise ValueError("parallel 不能与追加模式或 split_sheets 同时使用")
+    if parallel and Path(file_path).suffix.lower() != ".xlsx":
+        raise ValueError(f"并行写入仅支持 xlsx 文件: {file_path}")
+
+    frames = {sheet_name: data} if isinstance(data, pd.DataFrame) else data
+    if not split_sheets:
+        # 在写入任何数据之前检查行数，避免写入大量数据后才失败
+        for sheet, df in frames.items():
+            if len(df) + 1 > MAX_SHEET_ROWS:
+                raise ValueError(
+                    f"工作表 {sheet} 的行数 {len(df)} 超过 Excel 的上限，"
+                    "可使用 split_sheets=True 拆分到多个工作表"
+                )
+
+    if streaming or split_sheets or parallel or mode == "a":
+        check_engine(engine, "write")
+        if engine not in (None, "auto", "openpyxl"):
+            raise ValueError(f"流式、并行写入与追加模式不支持 {engine} 引擎")
+        writer_engine = "openpyxl"
+    else:
+        if compression != "default" and engine not in (None, "openpyxl"):
+            # 只有 openpyxl 引擎可以指定压缩参数，auto 时不选择其他引擎
+            check_engine(engine, "write")
+            if engine != "auto":
+                raise ValueError(f"{engine} 引擎不支持 compression 参数")
+            if Path(file_path).suffix.lower() in (".xlsx", ".xlsm"):
+                engine = "openpyxl"
+        writer_engine = resolve_engine(engine, file_path, "write") or "openpyxl"
+        if compression != "default" and writer_engine != "openpyxl":
+            raise ValueError(f"{writer_engine} 引擎不支持 compression 参数")
+
+    # 释放缓存中该文件的句柄，避免读取到旧内容或占用文件
+    evict(file_path)
+
+    if mode == "a":
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"文件不存在: {file_path}")
+        if path.suffix.lower() not in (".xlsx", ".xlsm"):
+            raise ValueError(f"追加模式仅支持 xlsx/xlsm 文件: {file_path}")
+        try:
+            append_sheets(
+                file_path,
+                {sheet_name: data} if isinstance(data, pd.DataFrame) else data,
+                replace=if_sheet_exists == "replace",
+                compression=compression,
+            )
+        except (PermissionError, ValueError):
+            raise
+        except Exception as e:
+            raise FileWriteError(f"写入 Excel 文件失败: {e}") from e
+        return
+
+    if parallel:
+        check_sheet_names(list(frames))
+        try:
+            write_sheets_parallel(
+                file_path,
+                frames,
+                workers or min(len(frames), os.cpu_count() or 1),
+                compression,
+            )
+        except (PermissionError, ValueError):
+            raise
+        except Exception as e:
+            raise FileWriteError(f"写入 Excel 文件失败: {e}") from e
+        return
+
+    if streaming or split_sheets:
+        _write_streaming(
+            file_path,
+            {
+                sheet: (
+                    [cell_value(column) for column in df.columns],
+                    frame_rows(df, header=False),
+                )
+                for sheet, df in frames.items()
+            },
+            split=split_sheets,
+            max_rows=(split_sheets and max_rows_per_sheet) or MAX_SHEET_ROWS,
+            compression=compression,
+        )
+        return
+
+    try:
+        if writer_engine == "openpyxl":
+            # 由 pandas 生成带表头样式的工作簿，再按压缩配置保存（内存缓冲区不会被写入）
+            writer = pd.ExcelWriter(io.BytesIO(), engine="openpyxl")
+            for sheet, df in frames.items():
+                df.to_excel(writer, sheet_name=sheet, index=False)
+            save_workbook(writer.book, file_path, compression)
+        else:
+            with pd.ExcelWriter(file_path, engine=writer_engine) as writer:
+                for sheet, df in frames.items():
+                    df.to_excel(writer, sheet_name=sheet, index=False)
+    except PermissionError:
+        raise
+    except Exception as e:
+        raise FileWriteError(f"写入 Excel 文件失败: {e}") from e
+
+
+def write_excel_rows(
+    rows: Iterable[Sequence[Any] | Mapping[Hashable, Any] | pd.DataFrame],
+    file_path: str,
+    sheet_name: str = "Sheet1",
+    columns: list[Hashable] | None = None,
+    split_sheets: bool = False,
+    max_rows_per_sheet: int | None = None,
+    compression: str = "default",
+) -> None:
+    """将行数据流式写入 Excel 文件。
+
+    使用 openpyxl write_only 工作簿，每收到一行（或一个 DataFrame 分块）就写入
+    工作表 XML，内存占用不随行数增长，可以直接写入生成器或 ``read_excel_chunks``
+    的结果。注意：此函数会覆盖整个目标文件。
+
+    Args:
+        rows: 行数据的可迭代对象，每项可以是：
+            值序列（列表、元组）；以列名为键的字典；DataFrame 分块
+        file_path: 输出 Excel 文件路径
+        sheet_name: 工作表名称
+        columns: 表头列名；None 时取第一个字典的键或第一个 DataFrame 的列名，
+            行为值序列时不写表头。给出 columns 时字典按其顺序取值，缺失的键为空
+        split_sheets: 为 True 时行数超过单个工作表的上限后依次写入
+            ``{sheet_name}_1``、``{sheet_name}_2`` 等工作表，每个工作表都重复表头；
+            为 False 时超过上限抛出 ValueError
+        max_rows_per_sheet: 拆分时每个工作表的最大行数（含表头），None 表示 Excel 的
+            上限 1,048,576 行
+        compression: zip 压缩配置：``"default"``、``"fastest"``、``"smallest"`` 或
+            ``"store"``，见 ``write_excel``
+
+    Raises:
+        ValueError: 数据格式无效，压缩配置无效，或行数超过上限（split_sheets=False）
+        PermissionError: 文件权限不足
+        FileWriteError: 写入文件时发生错误
+
+    Example:
+        >>> rows = ((i, f"Item {i}") for i in range(1_000_000))
+        >>> write_excel_rows(rows, "large.xlsx", columns=["id", "name"])
+        >>> # 边读边写，转换大文件
+        >>> write_excel_rows(read_excel_chunks("in.xlsx", chunksize=10000), "out.xlsx")
+        >>> # 导出任意大小的查询结果，每 1,048,576 行一个工作表
+        >>> write_excel_rows(cursor, "export.xlsx", "Data", columns, split_sheets=True)
+    """
+    if isinstance(rows, (str, bytes, pd.DataFrame)) or not isinstance(rows, Iterable):
+        raise ValueError(f"数据格式无效，期望行的可迭代对象，实际类型: {type(rows)}")
+    if max_rows_per_sheet is not None and not 2 <= max_rows_per_sheet <= MAX_SHEET_ROWS:
+        raise ValueError(
+            f"max_rows_per_sheet 必须在 2 到 {MAX_SHEET_ROWS} 之间: {max_rows_per_sheet}"
+        )
+
+    zip_options(compression)
+
+    _write_streaming(
+        file_path,
+        {sheet_name: _split_header(rows, columns)},
+        split=split_sheets,
+        max_rows=(split_sheets and max_rows_per_sheet) or MAX_SHEET_ROWS,
+        compression=compression,
+    )
+
+
+def _split_header(
+    rows: Iterable[Sequence[Any] | Mapping[Hashable, Any] | pd.DataFrame],
+    columns: list[Hashable] | None,
+) -> tuple[list[Any] | None, Iterator[list[Any]]]:
+    """确定表头（columns 或第一个字典的键、第一个 DataFrame 的列名），返回表头与数据行。"""
+    iterator = iter(rows)
+    first = next(iterator, _MISSING)
+    if first is not _MISSING:
+        if columns is None and isinstance(first, pd.DataFrame):
+            columns = list(first.columns)
+        elif columns is None and isinstance(first, Mapping):
+            columns = list(first.keys())
+        iterator = chain([first], iterator)
+    header = None if columns is None else [cell_value(column) for column in columns]
+    return header, _iter_row_values(iterator, columns)
+
+
+def _iter_row_values(
+    rows: Iterable[Any], columns: list[Hashable] | None
+) -> Iterator[list[Any]]:
+    for row in rows:
+        if isinstance(row, pd.DataFrame):
+            yield from frame_rows(row, header=False)
+        elif isinstance(row, Mapping):
+            if columns is None:
+                columns = list(row.keys())
+            yield [cell_value(row.get(column)) for column in columns]
+        elif isinstance(row, Sequence) and not isinstance(row, (str, bytes)):
+            yield [cell_value(value) for value in row]
+        else:
+            raise ValueError(
+                f"行数据格式无效，期望序列、字典或 DataFrame，实际类型: {type(row)}"
+            )
+
+
+def _write_streaming(
+    file_path: str,
+    sheets: dict[str, tuple[list[Any] | None, Iterator[list[Any]]]],
+    split: bool = False,
+    max_rows: int = MAX_SHEET_ROWS,
+    compression: str = "default",
+) -> None:
+    """使用 openpyxl write_only 工作簿逐行写入各工作表。
+
+    sheets 的值为 (表头, 数据行)。split 为 True 时每个工作表写满 max_rows 行
+    （含表头）后换到下一个编号的工作表；否则超过 Excel 的行数上限时抛出 ValueError。
+    compression 为保存时使用的 zip 压缩配置。
+    """
+    evict(file_path)
+    try:
+        workbook = Workbook(write_only=True)
+        for sheet, (header, rows) in sheets.items():
+            part = 0
+            worksheet: Any = None
+            count = max_rows
+            for values in rows:
+                if count >= max_rows:
+                    if not split and worksheet is not None:
+                        raise ValueError(
+                            f"工作表 {sheet} 的行数超过 Excel 的上限 {MAX_SHEET_ROWS}，"
+                            "可使用 split_sheets=True 拆分到多个工作表"
+                        )
+                    part += 1
+                    worksheet, count = _create_sheet(
+                        workbook, f"{sheet}_{part}" if split else sheet, header
+                    )
+                worksheet.append(values)
+                count += 1
+            if worksheet is None:
+                _create_sheet(workbook, f"{sheet}_1" if split else sheet, header)
+        save_workbook(workbook, file_path, compression)
+    except PermissionError:
+        raise
+    except ValueError:
+        raise
+    except Exception as e:
+        raise FileWriteError(f"写入 Excel 文件失败: {e}") from e
+
+
+def _create_sheet(
+    workbook: Workbook, title: str, header: list[Any] | None
+) -> tuple[Any, int]:
+    """创建工作表并写入表头，返回工作表与已写入的行数。"""
+    worksheet = workbook.create_sheet(title=title)
+    if header is None:
+        return worksheet, 0
+    worksheet.append(header)
+    return worksheet, 1
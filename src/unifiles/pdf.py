@@ -3,28 +3,56 @@
 提供 PDF 文件的文本提取和表格提取功能。
 """
 
+import math
 import re
+import unicodedata
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, TypeVar
 
+import numpy as np
 import pandas as pd
-from pypdf import PdfReader
+import pypdf
+from pypdf import PageObject, PdfReader
+from pypdf.generic import TextStringObject
 
+from .cache import cache_key, load_entry, pack_strings, store_entries, unpack_strings
 from .exceptions import FileReadError
 
+# 并行提取时每个工作进程平均分到的页块数（页块越多，各进程的负载越均衡）
+_CHUNKS_PER_WORKER = 4
+# extract_pdf 中文本的提取方式 -> _page_text 的提取方式
+_TEXT_MODES = {"plain": "text", "layout": "layout"}
+# 表格识别引擎 -> _extract_pages 的提取方式
+_TABLE_MODES = {"layout": "layout", "coordinates": "runs"}
 
-def extract_text(file_path: str, page_range: tuple[int, int] | None = None) -> str:
+_T = TypeVar("_T")
+
+
+def extract_text(
+    file_path: str,
+    page_range: tuple[int, int] | None = None,
+    workers: int | None = None,
+    cache: bool = False,
+) -> str:
     """从 PDF 文件中提取文本内容。
 
     Args:
         file_path: PDF 文件路径
         page_range: 页码范围 (start, end)，1-based（从 1 开始），None 表示提取所有页面
+        workers: 工作进程数，None 或 1 表示在当前进程中逐页提取；大于 1 时页码范围
+            被切分为连续的页块，每个工作进程打开自己的 PdfReader 提取页块中的页面，
+            结果按页码顺序合并，与逐页提取完全相同
+        cache: 为 True 时使用磁盘缓存（见 ``configure_cache``）：每页的文本单独缓存，
+            源文件未变化时直接加载，只提取缓存中缺失的页面
 
     Returns:
         提取的文本内容，页面之间用换行符分隔
 
     Raises:
         FileNotFoundError: 文件不存在
-        ValueError: 页码范围无效
+        ValueError: 页码范围或 workers 无效
         FileReadError: 读取文件时发生错误
 
     Example:
@@ -32,35 +60,25 @@ def extract_text(file_path: str, page_range: tuple[int, int] | None = None) -> s
         >>> text = extract_text("document.pdf")
         >>> # 提取第 1 到第 5 页
         >>> text = extract_text("document.pdf", page_range=(1, 5))
+        >>> # 使用 8 个进程提取大文档
+        >>> text = extract_text("report.pdf", workers=8)
+        >>> # 反复处理同一文档时缓存每页的提取结果
+        >>> text = extract_text("report.pdf", page_range=(1, 50), cache=True)
     """
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"文件不存在: {file_path}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers 必须为正整数: {workers}")
 
     try:
         reader = PdfReader(file_path)
-        total_pages = len(reader.pages)
+        start_idx, end_idx = _page_bounds(len(reader.pages), page_range)
 
-        if page_range is None:
-            # 提取所有页面
-            start_idx = 0
-            end_idx = total_pages
-        else:
-            start, end = page_range
-            # 验证范围
-            if start < 1 or end < start or end > total_pages:
-                raise ValueError(f"页码范围无效: {page_range}, 总页数: {total_pages}")
-            # 转换为 0-based 索引
-            start_idx = start - 1
-            end_idx = end
-
-        # 提取文本
-        texts: list[str] = []
-        for i in range(start_idx, end_idx):
-            text = reader.pages[i].extract_text()
-            texts.append(text)
-
-        return "\n".join(texts)
+        pages = _extract_pages(
+            file_path, reader, range(start_idx, end_idx), ("text",), workers, cache
+        )
+        return "\n".join(pages["text"])
     except FileNotFoundError:
         raise
     except ValueError:
@@ -69,13 +87,49 @@ def extract_text(file_path: str, page_range: tuple[int, int] | None = None) -> s
         raise FileReadError(f"提取 PDF 文本失败: {e}") from e
 
 
-def extract_tables(
+def iter_pdf_pages(
     file_path: str, page_range: tuple[int, int] | None = None
+) -> Iterator[tuple[int, str]]:
+    """逐页提取 PDF 文本，每提取完一页就产出该页。
+
+    与 ``extract_text`` 使用相同的提取方式，但不拼接整个文档的文本：调用方可以在
+    提取后续页面的同时处理已产出的页面，也可以随时停止迭代，跳过剩余页面。
+
+    Args:
+        file_path: PDF 文件路径
+        page_range: 页码范围 (start, end)，1-based（从 1 开始），None 表示所有页面
+
+    Yields:
+        (页码, 文本)，页码从 1 开始
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 页码范围无效（迭代时抛出）
+        FileReadError: 读取文件时发生错误（迭代时抛出）
+
+    Example:
+        >>> for page_number, text in iter_pdf_pages("report.pdf"):
+        ...     index(page_number, text)
+        >>> # 只处理第 10 到第 20 页
+        >>> pages = dict(iter_pdf_pages("report.pdf", page_range=(10, 20)))
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"文件不存在: {file_path}")
+
+    return _iter_pages(file_path, page_range)
+
+
+def extract_tables(
+    file_path: str,
+    page_range: tuple[int, int] | None = None,
+    cache: bool = False,
+    engine: str = "layout",
 ) -> list[pd.DataFrame]:
     """从 PDF 文件中提取表格数据。
 
     **MVP 限制说明**:
-    本函数基于 pypdf 的布局文本提取实现，仅支持基础表格提取。
+    本函数基于 pypdf 的文本提取实现，仅支持基础表格提取（每页最多识别一个表格）。
     以下情况可能无法正确识别：
     - 合并单元格的表格
     - 多列布局的复杂表格
@@ -88,13 +142,22 @@ def extract_tables(
     Args:
         file_path: PDF 文件路径
         page_range: 页码范围 (start, end)，1-based（从 1 开始），None 表示提取所有页面
+        cache: 为 True 时使用磁盘缓存（见 ``configure_cache``）：每页的提取结果单独
+            缓存，只对缓存中缺失的页面运行 pypdf 的提取
+        engine: 表格识别引擎：
+
+            - ``"layout"``：由 pypdf 布局模式生成的文本识别，按连续空格切分单元格
+            - ``"coordinates"``：通过 pypdf 的 ``visitor_text`` 回调收集每个文本片段
+              的坐标，按纵坐标聚类为行、按横向区间聚类为列。列按位置对齐，空单元格为
+              缺失值，不会使后续单元格错位；由多个文本片段组成的单元格会被合并。
+              依赖 pypdf 的普通模式提取，比 ``"layout"`` 慢
 
     Returns:
         提取的表格列表，每个表格为一个 DataFrame
 
     Raises:
         FileNotFoundError: 文件不存在
-        ValueError: 页码范围无效
+        ValueError: 页码范围或 engine 无效
         FileReadError: 读取文件时发生错误
 
     Example:
@@ -102,88 +165,491 @@ def extract_tables(
         >>> tables = extract_tables("document.pdf")
         >>> # 提取第 1 到第 3 页的表格
         >>> tables = extract_tables("document.pdf", page_range=(1, 3))
+        >>> # 按文本坐标识别表格
+        >>> tables = extract_tables("report.pdf", engine="coordinates")
     """
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"文件不存在: {file_path}")
+    if engine not in _TABLE_MODES:
+        raise ValueError(f"engine 必须为 'layout' 或 'coordinates': {engine}")
 
     try:
         reader = PdfReader(file_path)
-        total_pages = len(reader.pages)
+        start_idx, end_idx = _page_bounds(len(reader.pages), page_range)
 
-        # 页面范围处理（与 extract_text 相同）
-        if page_range is None:
-            start_idx = 0
-            end_idx = total_pages
-        else:
-            start, end = page_range
-            if start < 1 or end < start or end > total_pages:
-                raise ValueError(f"页码范围无效: {page_range}, 总页数: {total_pages}")
-            start_idx = start - 1
-            end_idx = end
+        mode = _TABLE_MODES[engine]
+        pages = _extract_pages(
+            file_path, reader, range(start_idx, end_idx), (mode,), None, cache
+        )
+        return _page_tables(pages[mode], mode)
+    except FileNotFoundError:
+        raise
+    except ValueError:
+        raise
+    except Exception as e:
+        raise FileReadError(f"提取 PDF 表格失败: {e}") from e
 
-        tables: list[pd.DataFrame] = []
 
-        # 遍历页面，尝试提取表格
-        for i in range(start_idx, end_idx):
-            page = reader.pages[i]
-            # 使用布局模式提取文本
-            # 如果页面没有内容（如空白页），可能抛出异常，需要处理
-            try:
-                layout_text = page.extract_text(extraction_mode="layout")
-            except (KeyError, AttributeError):
-                # 如果布局模式失败（如空白页），尝试普通模式
-                layout_text = page.extract_text()
-                if not layout_text.strip():
-                    # 空白页，跳过
-                    continue
-
-            # 简单的表格识别逻辑（MVP）
-            # 尝试通过制表符或连续空格识别表格行
-            lines = layout_text.split("\n")
-            table_rows: list[list[str]] = []
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # 如果行包含制表符或多个连续空格，可能是表格行
-                if "\t" in line:
-                    # 使用制表符分割
-                    cols = [col.strip() for col in line.split("\t") if col.strip()]
-                elif "  " in line:
-                    # 使用多个连续空格分割（至少 2 个空格）
-                    cols = [
-                        col.strip() for col in re.split(r" {2,}", line) if col.strip()
-                    ]
-                else:
-                    continue
-
-                # 至少两列才认为是表格
-                if len(cols) > 1:
-                    table_rows.append(cols)
-
-            # 如果找到表格行，创建 DataFrame
-            if table_rows:
-                # 尝试第一行作为表头（如果行数足够）
-                if len(table_rows) > 1:
-                    # 检查第一行是否看起来像表头（例如，都是字符串且较短）
-                    header = table_rows[0]
-                    data_rows = table_rows[1:]
-                    try:
-                        df = pd.DataFrame(data_rows, columns=header)
-                    except Exception:
-                        # 如果表头设置失败，使用默认列名
-                        df = pd.DataFrame(table_rows)
-                else:
-                    df = pd.DataFrame(table_rows)
-                tables.append(df)
-
-        return tables
+def extract_pdf(
+    file_path: str,
+    page_range: tuple[int, int] | None = None,
+    text: bool = True,
+    tables: bool = True,
+    text_mode: str = "layout",
+    workers: int | None = None,
+    cache: bool = False,
+    engine: str = "layout",
+) -> dict[str, Any]:
+    """一次遍历 PDF 的页面，同时提取文本与表格。
+
+    只打开一次 PdfReader，每页只访问一次：表格的识别方式与 ``extract_tables``
+    相同。默认的 ``text_mode="layout"`` 时文本直接取自同一次布局提取的结果（保留
+    版面中的空格与空行），每页的内容流只解析一次；``text_mode="plain"`` 时文本与
+    ``extract_text`` 完全相同，但每页还需要一次普通模式的提取，耗时与分别调用相近。
+
+    Args:
+        file_path: PDF 文件路径
+        page_range: 页码范围 (start, end)，1-based（从 1 开始），None 表示所有页面
+        text: 是否提取文本
+        tables: 是否提取表格
+        text_mode: 文本的提取方式：``"layout"``（布局模式，默认；与
+            ``engine="layout"`` 一起使用时文本与表格取自同一次提取）或 ``"plain"``
+            （普通模式，与 ``extract_text`` 相同）
+        workers: 工作进程数，None 或 1 表示在当前进程中逐页提取，见 ``extract_text``
+        cache: 为 True 时使用磁盘缓存，与 ``extract_text``、``extract_tables`` 共用
+            每页的缓存条目
+        engine: 表格识别引擎：``"layout"`` 或 ``"coordinates"``，见 ``extract_tables``
+
+    Returns:
+        包含所请求结果的字典：``"text"`` 为页面之间用换行符分隔的文本，
+        ``"tables"`` 为表格 DataFrame 列表
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 页码范围、text_mode、engine 或 workers 无效，或 text 与 tables
+            均为 False
+        FileReadError: 读取文件时发生错误
+
+    Example:
+        >>> # 文本与表格都取自同一次布局提取
+        >>> result = extract_pdf("report.pdf")
+        >>> text, tables = result["text"], result["tables"]
+        >>> # 文本与 extract_text 相同
+        >>> result = extract_pdf("report.pdf", text_mode="plain", page_range=(1, 20))
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"文件不存在: {file_path}")
+    if not text and not tables:
+        raise ValueError("text 与 tables 至少需要一个为 True")
+    if text_mode not in _TEXT_MODES:
+        raise ValueError(f"text_mode 必须为 'plain' 或 'layout': {text_mode}")
+    if engine not in _TABLE_MODES:
+        raise ValueError(f"engine 必须为 'layout' 或 'coordinates': {engine}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers 必须为正整数: {workers}")
+
+    modes = []
+    if text:
+        modes.append(_TEXT_MODES[text_mode])
+    table_mode = _TABLE_MODES[engine]
+    if tables and table_mode not in modes:
+        modes.append(table_mode)
+
+    try:
+        reader = PdfReader(file_path)
+        start_idx, end_idx = _page_bounds(len(reader.pages), page_range)
+        pages = _extract_pages(
+            file_path, reader, range(start_idx, end_idx), tuple(modes), workers, cache
+        )
+
+        result: dict[str, Any] = {}
+        if text:
+            result["text"] = "\n".join(pages[_TEXT_MODES[text_mode]])
+        if tables:
+            result["tables"] = _page_tables(pages[table_mode], table_mode)
+        return result
     except FileNotFoundError:
         raise
     except ValueError:
         raise
     except Exception as e:
-        raise FileReadError(f"提取 PDF 表格失败: {e}") from e
+        raise FileReadError(f"提取 PDF 内容失败: {e}") from e
+
+
+def _page_bounds(
+    total_pages: int, page_range: tuple[int, int] | None
+) -> tuple[int, int]:
+    """将 1-based 的页码范围转换为 0-based 的 [start, end) 索引。
+
+    Raises:
+        ValueError: 页码范围无效
+    """
+    if page_range is None:
+        return 0, total_pages
+    start, end = page_range
+    if start < 1 or end < start or end > total_pages:
+        raise ValueError(f"页码范围无效: {page_range}, 总页数: {total_pages}")
+    return start - 1, end
+
+
+def _page_chunks(pages: list[_T], count: int) -> list[list[_T]]:
+    """将页列表尽量均匀地切分为最多 count 个连续的页块。"""
+    count = min(count, len(pages))
+    size, extra = divmod(len(pages), count)
+    chunks: list[list[_T]] = []
+    start = 0
+    for index in range(count):
+        end = start + size + (index < extra)
+        chunks.append(pages[start:end])
+        start = end
+    return chunks
+
+
+def _page_text(page: PageObject, mode: str) -> str:
+    """按提取方式提取单页文本：``"text"`` 为普通模式，``"layout"`` 为布局模式。"""
+    if mode == "layout":
+        # 如果页面没有内容（如空白页），布局模式可能抛出异常，此时使用普通模式
+        try:
+            return page.extract_text(extraction_mode="layout")
+        except (KeyError, AttributeError):
+            return page.extract_text()
+    return page.extract_text()
+
+
+def _page_content(page: PageObject, mode: str) -> Any:
+    """按提取方式提取单页内容：``"runs"`` 为带坐标的文本片段，其他见 _page_text。"""
+    if mode == "runs":
+        return _page_runs(page)
+    return _page_text(page, mode)
+
+
+def _page_runs(page: PageObject) -> list[tuple[float, float, float, str]]:
+    """通过 pypdf 的 visitor 回调收集单页中的文本片段：(x, y, 字号, 文本)。
+
+    pypdf 的普通提取只在换行、换字体或变换矩阵变化时调用 visitor_text，同一行中的
+    多个单元格会合并为一段文本。visitor_operand_before 在每个 Tj/TJ 操作前记录该操作
+    的位置与字节串，visitor_text 回调时再按这些字节串把合并的文本依次切回各个操作；
+    无法对应的部分作为一个片段保留在最后对应上的位置。坐标与字号已换算到页面坐标系。
+    """
+    runs: list[tuple[float, float, float, str]] = []
+    pending: list[tuple[float, float, float, bytes | None]] = []
+
+    def before(
+        operator: bytes, operands: list[Any], cm: list[float], tm: list[float]
+    ) -> None:
+        if operator in (b"Tj", b"TJ"):
+            # Td 等操作会原地修改 tm，这里立即换算成坐标
+            pending.append(
+                (*_device_position(cm, tm), _operand_bytes(operator, operands))
+            )
+
+    def visit(
+        text: str, cm: list[float], tm: list[float], font: Any, font_size: Any
+    ) -> None:
+        size = float(font_size or 0.0)
+        # Type0（CID）字体每个字符占两个字节，其余简单字体占一个字节
+        code_width = 2 if font is not None and font.get("/Subtype") == "/Type0" else 1
+        position = _device_position(cm, tm)
+        cursor = 0
+        for x, y, scale, raw in pending:
+            end = _match_run(text, cursor, raw, code_width)
+            if end < 0:
+                position = (x, y, scale)
+                break
+            piece = text[cursor:end].strip()
+            if piece:
+                runs.append((x, y, size * scale, piece))
+            cursor = end
+        pending.clear()
+        rest = text[cursor:].strip()
+        if rest:
+            runs.append((position[0], position[1], size * position[2], rest))
+
+    page.extract_text(visitor_operand_before=before, visitor_text=visit)
+    return runs
+
+
+def _device_position(cm: list[float], tm: list[float]) -> tuple[float, float, float]:
+    """返回文本矩阵 tm 在变换矩阵 cm 下的页面坐标 (x, y) 与字号缩放比例。"""
+    x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+    y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+    scale = math.hypot(tm[2] * cm[0] + tm[3] * cm[2], tm[2] * cm[1] + tm[3] * cm[3])
+    return x, y, scale
+
+
+def _operand_bytes(operator: bytes, operands: list[Any]) -> bytes | None:
+    """返回 Tj/TJ 操作显示的字节串（TJ 中的字距调整被忽略），操作数无效时返回 None。"""
+    if not operands:
+        return None
+    parts = operands[0] if operator == b"TJ" else [operands[0]]
+    raw = []
+    for part in parts:
+        if isinstance(part, TextStringObject):
+            raw.append(part.original_bytes)
+        elif isinstance(part, bytes):
+            raw.append(part)
+        elif isinstance(part, str):
+            return None
+    return b"".join(raw)
+
+
+def _match_run(text: str, cursor: int, raw: bytes | None, code_width: int) -> int:
+    """返回字节串 raw 显示的文本在 text 中从 cursor 起的结束位置，无法对应时返回 -1。
+
+    提取时插入的空白会被跳过。raw 为可打印 ASCII 时按内容逐字匹配，否则（字体使用
+    自定义编码或双字节编码）按字符数截取。
+    """
+    if raw is None:
+        return -1
+    if raw.isascii() and raw.decode("ascii").isprintable():
+        end = cursor
+        for char in raw.decode("ascii"):
+            if char.isspace():
+                continue
+            while end < len(text) and text[end].isspace():
+                end += 1
+            if end == len(text) or text[end] != char:
+                break
+            end += 1
+        else:
+            return end
+    count = len(raw) // code_width
+    if count == 0:
+        return cursor
+    while cursor < len(text) and text[cursor].isspace():
+        cursor += 1
+    return cursor + count if cursor + count <= len(text) else -1
+
+
+def _extract_pages(
+    file_path: str,
+    reader: PdfReader,
+    indices: range,
+    modes: tuple[str, ...],
+    workers: int | None,
+    cache: bool,
+) -> dict[str, list[Any]]:
+    """按页码顺序返回各页在每种提取方式下的内容，可使用磁盘缓存与多个工作进程。
+
+    每页只访问一次，依次完成 modes 中的各种提取。cache 为 True 时每页的结果以
+    （源文件、pypdf 版本、提取方式、页索引）为键单独缓存，只提取缓存中缺失的部分，
+    新提取的结果在全部完成后一次写入缓存。
+    """
+    texts: dict[tuple[str, int], Any] = {}
+    keys: dict[tuple[str, int], str] = {}
+    if cache:
+        base = cache_key(file_path, "pdf", pypdf.__version__)
+        for i in indices:
+            for mode in modes:
+                keys[mode, i] = f"{base}-{mode}-{i}"
+                cached = load_entry("pdf", keys[mode, i])
+                if cached is not None:
+                    texts[mode, i] = _unpack_content(mode, cached)
+    # 每页缺失的提取方式
+    missing = [
+        (i, tuple(mode for mode in modes if (mode, i) not in texts)) for i in indices
+    ]
+    missing = [(i, page_modes) for i, page_modes in missing if page_modes]
+
+    computed: dict[tuple[str, int], Any] = {}
+    if workers is None or workers <= 1 or len(missing) <= 1:
+        for i, page_modes in missing:
+            page = reader.pages[i]
+            for mode in page_modes:
+                computed[mode, i] = _page_content(page, mode)
+    else:
+        chunks = _page_chunks(missing, workers * _CHUNKS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk, chunk_texts in zip(
+                chunks,
+                executor.map(_extract_page_texts, [file_path] * len(chunks), chunks),
+            ):
+                for (i, page_modes), page_texts in zip(chunk, chunk_texts):
+                    computed.update(
+                        ((mode, i), text) for mode, text in zip(page_modes, page_texts)
+                    )
+
+    if cache and computed:
+        store_entries(
+            "pdf",
+            {
+                keys[mode, i]: _pack_content(mode, content)
+                for (mode, i), content in computed.items()
+            },
+        )
+    texts.update(computed)
+    return {mode: [texts[mode, i] for i in indices] for mode in modes}
+
+
+def _pack_content(mode: str, content: Any) -> dict[str, np.ndarray]:
+    """将单页的提取结果编码为数组（用于磁盘缓存）。"""
+    if mode != "runs":
+        return pack_strings([content])
+    arrays = pack_strings([text for _x, _y, _size, text in content])
+    arrays["coordinates"] = np.array(
+        [(x, y, size) for x, y, size, _text in content], dtype=np.float64
+    ).reshape(-1, 3)
+    return arrays
+
+
+def _unpack_content(mode: str, arrays: dict[str, np.ndarray]) -> Any:
+    """还原 ``_pack_content`` 编码的单页提取结果。"""
+    texts = unpack_strings(arrays)
+    if mode != "runs":
+        return texts[0]
+    return [
+        (x, y, size, text)
+        for (x, y, size), text in zip(arrays["coordinates"].tolist(), texts)
+    ]
+
+
+def _extract_page_texts(
+    file_path: str, pages: list[tuple[int, tuple[str, ...]]]
+) -> list[list[Any]]:
+    """工作进程中打开 PDF，提取页块中各页在所需提取方式下的内容。"""
+    reader = PdfReader(file_path)
+    results: list[list[Any]] = []
+    for i, modes in pages:
+        page = reader.pages[i]
+        results.append([_page_content(page, mode) for mode in modes])
+    return results
+
+
+def _page_tables(pages: list[Any], mode: str) -> list[pd.DataFrame]:
+    """由各页的提取结果识别表格（每页最多一个）。"""
+    parse = _cluster_table if mode == "runs" else _parse_table
+    tables = (parse(content) for content in pages)
+    return [table for table in tables if table is not None]
+
+
+def _parse_table(layout_text: str) -> pd.DataFrame | None:
+    """由单页的布局文本识别表格（MVP），没有表格行时返回 None。"""
+    # 简单的表格识别逻辑（MVP）
+    # 尝试通过制表符或连续空格识别表格行
+    lines = layout_text.split("\n")
+    table_rows: list[list[str]] = []
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # 如果行包含制表符或多个连续空格，可能是表格行
+        if "\t" in line:
+            # 使用制表符分割
+            cols = [col.strip() for col in line.split("\t") if col.strip()]
+        elif "  " in line:
+            # 使用多个连续空格分割（至少 2 个空格）
+            cols = [col.strip() for col in re.split(r" {2,}", line) if col.strip()]
+        else:
+            continue
+
+        # 至少两列才认为是表格
+        if len(cols) > 1:
+            table_rows.append(cols)
+
+    # 如果找到表格行，创建 DataFrame
+    if not table_rows:
+        return None
+    # 尝试第一行作为表头（如果行数足够）
+    if len(table_rows) > 1:
+        # 检查第一行是否看起来像表头（例如，都是字符串且较短）
+        header = table_rows[0]
+        data_rows = table_rows[1:]
+        try:
+            return pd.DataFrame(data_rows, columns=header)
+        except Exception:
+            # 如果表头设置失败，使用默认列名
+            return pd.DataFrame(table_rows)
+    return pd.DataFrame(table_rows)
+
+
+def _cluster_table(
+    runs: list[tuple[float, float, float, str]],
+) -> pd.DataFrame | None:
+    """由单页的文本片段坐标识别表格，没有表格行时返回 None。
+
+    片段按纵坐标聚类为行（间距小于半个字号视为同一行），同一行中间距小于一个字号的
+    相邻片段合并为一个单元格（片段宽度按字符数估算），至少含两个单元格的行为表格行；
+    表格行的单元格再按横向区间聚类为列（区间重叠的单元格属于同一列）。
+    """
+    if not runs:
+        return None
+    x_values, y_values, sizes, texts = zip(*runs)
+    x = np.asarray(x_values)
+    y = np.asarray(y_values)
+    size = np.maximum(np.asarray(sizes), 1.0)
+    widths = np.fromiter((_text_width(text) for text in texts), float, len(texts))
+    end = x + widths * size
+
+    # 按纵坐标从上到下聚类为行，行内按横坐标排序
+    by_y = np.argsort(-y, kind="stable")
+    tolerance = 0.5 * float(np.median(size))
+    row_ids = np.empty(len(runs), dtype=np.int64)
+    row_ids[by_y] = np.cumsum(np.r_[0, np.diff(-y[by_y]) > tolerance])
+    order = np.lexsort((x, row_ids))
+    rows, x, end, size = row_ids[order], x[order], end[order], size[order]
+
+    # 行内相邻片段的间距超过一个字号时开始新的单元格
+    gaps = x[1:] - end[:-1]
+    starts = np.flatnonzero(np.r_[True, (rows[1:] != rows[:-1]) | (gaps > size[1:])])
+    cell_rows = rows[starts]
+    cell_x = x[starts]
+    cell_end = np.maximum.reduceat(end, starts)
+    bounds = np.r_[starts, len(order)]
+    cell_texts = [
+        " ".join(texts[k] for k in order[bounds[i] : bounds[i + 1]])
+        for i in range(len(starts))
+    ]
+
+    # 至少含两个单元格的行为表格行
+    table = np.flatnonzero(np.bincount(cell_rows)[cell_rows] > 1)
+    if len(table) == 0:
+        return None
+
+    # 按起点排序后，起点超过此前所有单元格终点的位置开始新的列
+    by_x = table[np.argsort(cell_x[table], kind="stable")]
+    reach = np.maximum.accumulate(cell_end[by_x])
+    column_ids = np.empty(len(runs), dtype=np.int64)
+    column_ids[by_x] = np.cumsum(np.r_[0, cell_x[by_x][1:] > reach[:-1]])
+    row_numbers, row_index = np.unique(cell_rows[table], return_inverse=True)
+
+    grid: list[list[str | None]] = [
+        [None] * (int(column_ids[by_x[-1]]) + 1) for _ in row_numbers
+    ]
+    for cell, row in zip(table, row_index):
+        current = grid[row][column_ids[cell]]
+        text = cell_texts[cell]
+        grid[row][column_ids[cell]] = text if current is None else f"{current} {text}"
+
+    if len(grid) > 1:
+        return pd.DataFrame(grid[1:], columns=grid[0])
+    return pd.DataFrame(grid)
+
+
+def _text_width(text: str) -> float:
+    """按字符数估算文本宽度（以字号为单位）：全角字符为 1，其他字符为 0.5。"""
+    if text.isascii():
+        return 0.5 * len(text)
+    return sum(1.0 if unicodedata.east_asian_width(c) in "WF" else 0.5 for c in text)
+
+
+def _iter_pages(
+    file_path: str, page_range: tuple[int, int] | None
+) -> Iterator[tuple[int, str]]:
+    try:
+        reader = PdfReader(file_path)
+        start_idx, end_idx = _page_bounds(len(reader.pages), page_range)
+    except ValueError:
+        raise
+    except Exception as e:
+        raise FileReadError(f"提取 PDF 文本失败: {e}") from e
+
+    for i in range(start_idx, end_idx):
+        try:
+            text = _page_text(reader.pages[i], "text")
+        except Exception as e:
+            raise FileReadError(f"提取 PDF 文本失败（第 {i + 1} 页）: {e}") from e
+        yield i + 1, text
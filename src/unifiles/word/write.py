@@ -1,13 +1,25 @@
 """Word 文档写入功能。"""
 
+import zipfile
 from pathlib import Path
+from typing import Any
+from xml.sax.saxutils import quoteattr
 
 from docx import Document
 
+from .._zip import zip_options
 from ..exceptions import FileWriteError
 
+_CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+_RELS_CONTENT_TYPE = "application/vnd.openxmlformats-package.relationships+xml"
 
-def write_docx(content: str, file_path: str, title: str | None = None) -> None:
+
+def write_docx(
+    content: str,
+    file_path: str,
+    title: str | None = None,
+    compression: str = "default",
+) -> None:
     """将内容写入 Word 文档。
 
     创建新的 Word 文档并写入内容。如果提供了标题，会将标题作为文档标题添加。
@@ -16,18 +28,23 @@ def write_docx(content: str, file_path: str, title: str | None = None) -> None:
         content: 要写入的文本内容
         file_path: 输出 Word 文档路径
         title: 可选的文档标题
+        compression: zip 压缩配置：``"default"``（python-docx 的默认压缩）、
+            ``"fastest"``（写入最快）、``"smallest"``（文件最小）或 ``"store"``（不压缩）；
+            非默认配置时各部件按配置直接压缩写入文件
 
     Raises:
-        ValueError: 内容格式无效
+        ValueError: 内容格式无效或压缩配置无效
         PermissionError: 文件权限不足
         FileWriteError: 写入文件时发生错误
 
     Example:
         >>> write_docx("Hello World", "output.docx")
         >>> write_docx("This is the content.", "output.docx", title="My Document")
+        >>> write_docx(report_text, "archive.docx", compression="smallest")
     """
     if not isinstance(content, str):
         raise ValueError(f"内容格式无效，期望 str，实际类型: {type(content)}")
+    zip_options(compression)
 
     try:
         document = Document()
@@ -39,8 +56,41 @@ def write_docx(content: str, file_path: str, title: str | None = None) -> None:
         for line in lines:
             document.add_paragraph(line)
 
-        document.save(file_path)
+        if compression == "default":
+            document.save(file_path)
+        else:
+            _save_document(document, file_path, zip_options(compression))
     except PermissionError:
         raise
     except Exception as e:
         raise FileWriteError(f"写入 Word 文档失败: {e}") from e
+
+
+def _save_document(document: Any, file_path: str, options: dict[str, Any]) -> None:
+    """按 zip 压缩参数保存文档，每个部件只压缩一次。
+
+    python-docx 的 save 不支持指定压缩参数，这里按与其相同的结构（内容类型清单、
+    包关系、各部件及其关系）把各部件直接写入以 options 创建的 ZipFile。
+    """
+    package = document.part.package
+    parts = list(package.iter_parts())
+    for part in parts:
+        part.before_marshal()
+    overrides = "".join(
+        f"<Override PartName={quoteattr(str(part.partname))} "
+        f"ContentType={quoteattr(part.content_type)}/>"
+        for part in parts
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Types xmlns="{_CONTENT_TYPES_NS}">'
+        f'<Default Extension="rels" ContentType="{_RELS_CONTENT_TYPE}"/>'
+        f'<Default Extension="xml" ContentType="application/xml"/>{overrides}</Types>'
+    )
+    with zipfile.ZipFile(file_path, "w", **options) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("_rels/.rels", package.rels.xml)
+        for part in parts:
+            archive.writestr(part.partname.membername, part.blob)
+            if len(part.rels):
+                archive.writestr(part.partname.rels_uri.membername, part.rels.xml)
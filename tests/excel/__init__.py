@@ -0,0 +1 @@
+"""Excel 模块测试包。"""
@@ -0,0 +1,151 @@
+"""Excel 导入 SQLite 测试。"""
+
+import sqlite3
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import excel_to_sqlite, read_excel, write_excel
+from unifiles.exceptions import FileWriteError
+from unifiles.sqlite import get_schema, query
+
+
+@pytest.fixture
+def orders_file(tmp_path: Path) -> Path:
+    test_file = tmp_path / "orders.xlsx"
+    df = pd.DataFrame(
+        {
+            "id": range(1, 8),
+            "customer": ["张三", "李四", None, "王五", "张三", "李四", "王五"],
+            "amount": [10, 20.5, 30, None, 50, 60, 70],
+            "date": pd.date_range("2024-01-01", periods=7),
+            "paid": [True, False, True, True, False, True, False],
+        }
+    )
+    write_excel(df, str(test_file))
+    return test_file
+
+
+def test_excel_to_sqlite(orders_file: Path, tmp_path: Path):
+    """测试分批导入：列类型推断、空值、日期文本与行数。"""
+    db_path = tmp_path / "shop.db"
+    count = excel_to_sqlite(str(orders_file), str(db_path), "orders", batch_size=3)
+
+    assert count == 7
+    assert get_schema(str(db_path), "orders") == {
+        "id": "INTEGER",
+        "customer": "TEXT",
+        "amount": "REAL",
+        "date": "TEXT",
+        "paid": "INTEGER",
+    }
+    df = query(str(db_path), "SELECT * FROM orders ORDER BY id")
+    assert df["id"].tolist() == list(range(1, 8))
+    assert df["customer"].isna().sum() == 1
+    assert df["amount"].tolist()[:2] == [10.0, 20.5]
+    assert df["date"].iloc[0] == "2024-01-01 00:00:00"
+    assert df["paid"].tolist()[:2] == [1, 0]
+
+
+def test_excel_to_sqlite_if_exists_and_indexes(orders_file: Path, tmp_path: Path):
+    """测试表已存在时的处理方式，以及导入后创建索引。"""
+    db_path = tmp_path / "shop.db"
+    excel_to_sqlite(str(orders_file), str(db_path), "orders")
+    with pytest.raises(ValueError, match="表已存在"):
+        excel_to_sqlite(str(orders_file), str(db_path), "orders")
+
+    excel_to_sqlite(str(orders_file), str(db_path), "orders", if_exists="append")
+    assert query(str(db_path), "SELECT COUNT(*) AS n FROM orders")["n"][0] == 14
+
+    excel_to_sqlite(
+        str(orders_file),
+        str(db_path),
+        "orders",
+        if_exists="replace",
+        indexes=["customer", ("date", "id")],
+    )
+    assert query(str(db_path), "SELECT COUNT(*) AS n FROM orders")["n"][0] == 7
+    indexes = query(
+        str(db_path),
+        "SELECT name FROM sqlite_master WHERE type = 'index' ORDER BY name",
+    )["name"].tolist()
+    assert indexes == ["idx_orders_customer", "idx_orders_date_id"]
+
+
+def test_excel_to_sqlite_rolls_back(tmp_path: Path):
+    """测试导入失败时整体回滚，已有的表不受影响。"""
+    source = tmp_path / "wide.xlsx"
+    rows = [["a", "b"], [1, 2]] + [[i, i] for i in range(5)] + [[1, 2, 3]]
+    pd.DataFrame(rows).to_excel(source, header=False, index=False)
+    db_path = tmp_path / "test.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE data (a INTEGER, b INTEGER)")
+        conn.execute("INSERT INTO data VALUES (0, 0)")
+    conn.close()
+
+    with pytest.raises(ValueError, match="超出表头的列数"):
+        excel_to_sqlite(
+            str(source), str(db_path), "data", if_exists="replace", infer_rows=2
+        )
+    assert query(str(db_path), "SELECT * FROM data")["a"].tolist() == [0]
+
+
+def test_excel_to_sqlite_blank_header_row(tmp_path: Path):
+    """测试第 1 行为空时列名与 read_excel 相同（Unnamed: n），之后的空行被跳过。"""
+    source = tmp_path / "blank.xlsx"
+    rows = [[None, None], ["a", "b"], [None, None], [1, 2]]
+    pd.DataFrame(rows).to_excel(source, header=False, index=False)
+    db_path = tmp_path / "test.db"
+
+    assert excel_to_sqlite(str(source), str(db_path), "data") == 2
+    expected = read_excel(str(source))
+    assert list(expected.columns) == ["Unnamed: 0", "Unnamed: 1"]
+    df = query(str(db_path), "SELECT * FROM data")
+    assert list(df.columns) == list(expected.columns)
+    assert df.values.tolist() == [["a", "b"], ["1", "2"]]
+
+
+def test_excel_to_sqlite_rollback_failure(
+    orders_file: Path, tmp_path: Path, monkeypatch
+):
+    """测试回滚本身失败时仍抛出导致失败的原始异常。"""
+    connect = sqlite3.connect
+
+    class FailingConnection:
+        def __init__(self, *args, **kwargs):
+            self._conn = connect(*args, **kwargs)
+
+        def execute(self, sql, *args):
+            if sql == "ROLLBACK":
+                raise sqlite3.OperationalError("cannot rollback")
+            return self._conn.execute(sql, *args)
+
+        def executemany(self, sql, rows):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        def close(self):
+            self._conn.close()
+
+    monkeypatch.setattr(sqlite3, "connect", FailingConnection)
+    with pytest.raises(FileWriteError, match="disk I/O error") as exc_info:
+        excel_to_sqlite(str(orders_file), str(tmp_path / "shop.db"), "orders")
+    assert isinstance(exc_info.value.__cause__, sqlite3.OperationalError)
+    assert "disk I/O error" in str(exc_info.value.__cause__)
+
+
+def test_excel_to_sqlite_invalid(orders_file: Path, tmp_path: Path):
+    """测试文件不存在与无效参数。"""
+    db_path = str(tmp_path / "shop.db")
+    with pytest.raises(FileNotFoundError, match="文件不存在"):
+        excel_to_sqlite(str(tmp_path / "missing.xlsx"), db_path, "t")
+    with pytest.raises(ValueError, match="if_exists"):
+        excel_to_sqlite(str(orders_file), db_path, "t", if_exists="merge")
+    with pytest.raises(ValueError, match="batch_size"):
+        excel_to_sqlite(str(orders_file), db_path, "t", batch_size=0)
+    with pytest.raises(ValueError, match="工作表不存在"):
+        excel_to_sqlite(str(orders_file), db_path, "t", sheet_name="Missing")
+    with pytest.raises(ValueError, match="索引列不存在"):
+        excel_to_sqlite(str(orders_file), db_path, "t", indexes=["missing"])
+    with pytest.raises(FileWriteError):
+        excel_to_sqlite(str(orders_file), str(tmp_path), "t")
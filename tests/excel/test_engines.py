@@ -0,0 +1,97 @@
+"""Excel 读写引擎注册表测试。"""
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import (
+    available_excel_engines,
+    read_excel,
+    write_excel,
+)
+from unifiles.excel import _engines
+from unifiles.excel._engines import resolve_engine
+
+
+@pytest.fixture
+def sample_file(tmp_path: Path) -> Path:
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"name": ["张三", "李四"], "value": [1.5, 2]})
+    write_excel(df, str(test_file))
+    return test_file
+
+
+@pytest.fixture
+def no_optional_engines(monkeypatch: pytest.MonkeyPatch) -> None:
+    """模拟未安装任何可选引擎的环境。"""
+    for spec in (*_engines.READ_ENGINES.values(), *_engines.WRITE_ENGINES.values()):
+        if spec.module not in (None, "openpyxl"):
+            monkeypatch.setitem(_engines._available, spec.module, False)
+
+
+def test_available_excel_engines():
+    """测试已安装引擎列表按优先级排列，必装引擎总是可用。"""
+    engines = available_excel_engines()
+    assert engines["read"].index("native") < engines["read"].index("openpyxl")
+    assert "openpyxl" in engines["write"]
+
+
+def test_auto_selects_fastest_available(monkeypatch: pytest.MonkeyPatch):
+    """测试 auto 按文件类型选择已安装的最快引擎，可选引擎缺失时回退。"""
+    monkeypatch.setitem(_engines._available, "python_calamine", True)
+    monkeypatch.setitem(_engines._available, "xlsxwriter", True)
+    assert resolve_engine("auto", "a.xlsx", "read") == "calamine"
+    assert resolve_engine("auto", "a.xlsb", "read") == "calamine"
+    assert resolve_engine("auto", "a.xlsx", "write") == "xlsxwriter"
+    assert resolve_engine("auto", "a.xlsm", "write") == "openpyxl"
+
+    monkeypatch.setitem(_engines._available, "python_calamine", False)
+    monkeypatch.setitem(_engines._available, "pyxlsb", True)
+    monkeypatch.setitem(_engines._available, "xlsxwriter", False)
+    assert resolve_engine("auto", "a.XLSX", "read") == "native"
+    assert resolve_engine("auto", "a.xlsb", "read") == "pyxlsb"
+    assert resolve_engine("auto", "a.xlsx", "write") == "openpyxl"
+    assert resolve_engine(None, "a.xlsx", "read") is None
+
+
+def test_missing_engines(no_optional_engines: None, sample_file: Path):
+    """测试引擎未安装或不支持文件类型时给出明确的错误。"""
+    with pytest.raises(ValueError, match="请安装 python-calamine 或 pyxlsb"):
+        resolve_engine("auto", "a.xlsb", "read")
+    with pytest.raises(ValueError, match="没有支持 .csv 文件的引擎"):
+        resolve_engine("auto", "a.csv", "read")
+    with pytest.raises(ValueError, match="calamine 引擎不可用，请安装 python-calamine"):
+        read_excel(str(sample_file), engine="calamine")
+    with pytest.raises(ValueError, match="xlsxwriter 引擎不可用"):
+        write_excel(pd.DataFrame({"A": [1]}), str(sample_file), engine="xlsxwriter")
+    with pytest.raises(ValueError, match="odf 引擎仅支持 ods"):
+        write_excel(pd.DataFrame({"A": [1]}), str(sample_file), engine="odf")
+    with pytest.raises(ValueError, match="不支持的写入引擎"):
+        write_excel(pd.DataFrame({"A": [1]}), str(sample_file), engine="unknown")
+
+
+def test_auto_engine_roundtrip(sample_file: Path, tmp_path: Path):
+    """测试 engine="auto" 读写的结果与默认引擎一致。"""
+    expected = read_excel(str(sample_file))
+    pd.testing.assert_frame_equal(read_excel(str(sample_file), engine="auto"), expected)
+
+    output = tmp_path / "auto.xlsx"
+    write_excel(expected, str(output), engine="auto")
+    pd.testing.assert_frame_equal(read_excel(str(output)), expected)
+
+
+def test_streaming_requires_builtin_writer(sample_file: Path):
+    """测试流式写入与追加模式只接受内置写入方式。"""
+    df = pd.DataFrame({"A": [1]})
+    with pytest.raises(ValueError, match="不支持 xlsxwriter 引擎"):
+        write_excel(df, str(sample_file), streaming=True, engine="xlsxwriter")
+    write_excel(df, str(sample_file), sheet_name="New", mode="a", engine="auto")
+    assert read_excel(str(sample_file), sheet_name="New")["A"].tolist() == [1]
+
+
+def test_calamine_engine(sample_file: Path):
+    """测试 calamine 引擎（需要安装 python-calamine）。"""
+    pytest.importorskip("python_calamine")
+    result = read_excel(str(sample_file), engine="calamine")
+    assert result["name"].tolist() == ["张三", "李四"]
+    assert result["value"].tolist() == [1.5, 2]
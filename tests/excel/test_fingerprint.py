@@ -0,0 +1,89 @@
+"""Excel 工作表指纹测试。"""
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import fingerprint_excel, write_excel
+from unifiles.exceptions import FileReadError
+
+
+def _write_report(file_path: Path, value: int = 1) -> None:
+    write_excel(
+        {
+            "Summary": pd.DataFrame({"name": ["张三", "李四"], "value": [value, 2]}),
+            "Detail": pd.DataFrame({"id": [1, 2, 3]}),
+        },
+        str(file_path),
+    )
+
+
+@pytest.mark.parametrize("deep", [False, True])
+def test_fingerprint_excel(tmp_path: Path, deep: bool):
+    """测试重新导出相同数据时指纹不变，修改工作表后只有该工作表的指纹变化。"""
+    test_file = tmp_path / "report.xlsx"
+    _write_report(test_file)
+    first = fingerprint_excel(str(test_file), deep=deep)
+    assert list(first) == ["Summary", "Detail"]
+    assert all(len(digest) == 64 for digest in first.values())
+
+    _write_report(test_file)
+    assert fingerprint_excel(str(test_file), deep=deep) == first
+
+    write_excel(
+        pd.DataFrame({"id": [1, 2, 4]}),
+        str(test_file),
+        sheet_name="Detail",
+        mode="a",
+        if_sheet_exists="replace",
+    )
+    changed = fingerprint_excel(str(test_file), deep=deep)
+    assert changed["Summary"] == first["Summary"]
+    assert changed["Detail"] != first["Detail"]
+
+
+def test_fingerprint_excel_detects_value_change(tmp_path: Path):
+    """测试两种模式都能发现单元格值的变化。"""
+    test_file = tmp_path / "report.xlsx"
+    _write_report(test_file, value=1)
+    before = (
+        fingerprint_excel(str(test_file)),
+        fingerprint_excel(str(test_file), True),
+    )
+    _write_report(test_file, value=100)
+    after = (fingerprint_excel(str(test_file)), fingerprint_excel(str(test_file), True))
+    assert before[0]["Summary"] != after[0]["Summary"]
+    assert before[1]["Summary"] != after[1]["Summary"]
+    assert before[0]["Summary"] != before[1]["Summary"]
+
+
+def test_fingerprint_excel_hashes_part_bytes(tmp_path: Path):
+    """测试默认模式哈希部件的字节：CRC-32 与大小相同但内容不同的部件也能区分。"""
+    test_file = tmp_path / "report.xlsx"
+    write_excel(
+        pd.DataFrame({"name": ["qzxjk-1", "qzxjk-2"]}),
+        str(test_file),
+        sheet_name="Summary",
+        streaming=True,
+        compression="store",
+    )
+    before = fingerprint_excel(str(test_file))
+    # 只改动工作表的数据，不更新 zip 目录中记录的 CRC-32 与大小
+    data = test_file.read_bytes()
+    assert data.count(b"qzxjk-1") == 1
+    test_file.write_bytes(data.replace(b"qzxjk-1", b"qzxjk-9"))
+    assert fingerprint_excel(str(test_file))["Summary"] != before["Summary"]
+
+
+def test_fingerprint_excel_invalid(tmp_path: Path):
+    """测试文件不存在、不支持的格式与损坏的文件。"""
+    with pytest.raises(FileNotFoundError, match="文件不存在"):
+        fingerprint_excel(str(tmp_path / "missing.xlsx"))
+    xls_file = tmp_path / "old.xls"
+    xls_file.write_bytes(b"")
+    with pytest.raises(ValueError, match="仅支持 xlsx"):
+        fingerprint_excel(str(xls_file))
+    broken = tmp_path / "broken.xlsx"
+    broken.write_bytes(b"not a zip")
+    with pytest.raises(FileReadError):
+        fingerprint_excel(str(broken))
@@ -1,7 +1,12 @@
-"""Excel 模块测试用例。"""
+"""Excel 元数据查询测试。"""
+
+import re
+import zipfile
 
 import pytest
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.styles import PatternFill
 from pathlib import Path
 
 from unifiles.excel import (
@@ -9,160 +14,7 @@ from unifiles.excel import (
     get_excel_info,
     get_sheet_info,
     get_sheet_names,
-    read_excel,
-    write_excel,
 )
-from unifiles.exceptions import FileReadError, FileWriteError
-
-
-def test_read_excel_success(tmp_path: Path):
-    """测试成功读取 Excel 文件。"""
-    # 创建测试文件
-    test_file = tmp_path / "test.xlsx"
-    df_expected = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
-    # 使用 ExcelWriter 确保文件格式正确
-    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
-        df_expected.to_excel(writer, sheet_name="Sheet1", index=False)
-
-    # 测试读取
-    result = read_excel(str(test_file))
-    assert isinstance(result, pd.DataFrame)
-    assert len(result) == 3
-    assert list(result.columns) == ["A", "B"]
-    pd.testing.assert_frame_equal(result, df_expected)
-
-
-def test_read_excel_sheet_name(tmp_path: Path):
-    """测试指定工作表名称读取。"""
-    test_file = tmp_path / "test.xlsx"
-    df1 = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
-    df2 = pd.DataFrame({"C": [5, 6], "D": [7, 8]})
-
-    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
-        df1.to_excel(writer, sheet_name="Sheet1", index=False)
-        df2.to_excel(writer, sheet_name="Sheet2", index=False)
-
-    # 读取指定工作表
-    result = read_excel(str(test_file), sheet_name="Sheet2")
-    assert isinstance(result, pd.DataFrame)
-    assert list(result.columns) == ["C", "D"]
-    pd.testing.assert_frame_equal(result, df2)
-
-
-def test_read_excel_sheet_index(tmp_path: Path):
-    """测试使用索引读取工作表。"""
-    test_file = tmp_path / "test.xlsx"
-    df1 = pd.DataFrame({"A": [1, 2]})
-    df2 = pd.DataFrame({"B": [3, 4]})
-
-    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
-        df1.to_excel(writer, sheet_name="Sheet1", index=False)
-        df2.to_excel(writer, sheet_name="Sheet2", index=False)
-
-    # 使用索引读取第二个工作表
-    result = read_excel(str(test_file), sheet_name=1)
-    assert isinstance(result, pd.DataFrame)
-    assert list(result.columns) == ["B"]
-
-
-def test_read_excel_file_not_found():
-    """测试文件不存在的情况。"""
-    with pytest.raises(FileNotFoundError, match="文件不存在"):
-        read_excel("nonexistent.xlsx")
-
-
-def test_read_excel_invalid_sheet(tmp_path: Path):
-    """测试无效工作表的情况。"""
-    test_file = tmp_path / "test.xlsx"
-    df = pd.DataFrame({"A": [1, 2, 3]})
-    df.to_excel(test_file, index=False)
-
-    # 测试不存在的工作表名称
-    with pytest.raises(ValueError, match="工作表不存在或无效"):
-        read_excel(str(test_file), sheet_name="NonExistentSheet")
-
-    # 测试超出范围的索引
-    with pytest.raises(ValueError):
-        read_excel(str(test_file), sheet_name=999)
-
-
-def test_write_excel_dataframe(tmp_path: Path):
-    """测试写入单个 DataFrame。"""
-    test_file = tmp_path / "output.xlsx"
-    df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
-
-    write_excel(df, str(test_file), sheet_name="Results")
-
-    # 验证文件已创建
-    assert test_file.exists()
-
-    # 验证内容
-    result = read_excel(str(test_file), sheet_name="Results")
-    pd.testing.assert_frame_equal(result, df)
-
-
-def test_write_excel_dict(tmp_path: Path):
-    """测试写入多工作表。"""
-    test_file = tmp_path / "output.xlsx"
-    df1 = pd.DataFrame({"A": [1, 2]})
-    df2 = pd.DataFrame({"B": [3, 4]})
-    data_dict = {"Sheet1": df1, "Sheet2": df2}
-
-    write_excel(data_dict, str(test_file))
-
-    # 验证文件已创建
-    assert test_file.exists()
-
-    # 验证两个工作表都存在
-    sheets = get_sheet_names(str(test_file))
-    assert "Sheet1" in sheets
-    assert "Sheet2" in sheets
-
-    # 验证内容
-    result1 = read_excel(str(test_file), sheet_name="Sheet1")
-    result2 = read_excel(str(test_file), sheet_name="Sheet2")
-    pd.testing.assert_frame_equal(result1, df1)
-    pd.testing.assert_frame_equal(result2, df2)
-
-
-def test_write_excel_overwrite(tmp_path: Path):
-    """测试覆盖文件，验证不保留原有其他 Sheet。"""
-    test_file = tmp_path / "output.xlsx"
-
-    # 第一次写入，包含两个工作表
-    df1 = pd.DataFrame({"A": [1, 2]})
-    df2 = pd.DataFrame({"B": [3, 4]})
-    write_excel({"Sheet1": df1, "Sheet2": df2}, str(test_file))
-
-    # 验证两个工作表都存在
-    sheets_before = get_sheet_names(str(test_file))
-    assert len(sheets_before) == 2
-    assert "Sheet1" in sheets_before
-    assert "Sheet2" in sheets_before
-
-    # 第二次写入，只写入一个工作表
-    df3 = pd.DataFrame({"C": [5, 6]})
-    write_excel(df3, str(test_file), sheet_name="Sheet3")
-
-    # 验证现在只有一个工作表
-    sheets_after = get_sheet_names(str(test_file))
-    assert len(sheets_after) == 1
-    assert "Sheet3" in sheets_after
-    assert "Sheet1" not in sheets_after
-    assert "Sheet2" not in sheets_after
-
-
-def test_write_excel_invalid_data(tmp_path: Path):
-    """测试无效数据格式。"""
-    test_file = tmp_path / "output.xlsx"
-
-    # 测试非 DataFrame 和非 dict 类型
-    with pytest.raises(ValueError, match="数据格式无效"):
-        write_excel("invalid_data", str(test_file))
-
-    # 测试 dict 中值不是 DataFrame
-    with pytest.raises(ValueError, match="字典值必须是 DataFrame"):
-        write_excel({"Sheet1": "invalid"}, str(test_file))
 
 
 def test_get_sheet_names(tmp_path: Path):
@@ -249,6 +101,25 @@ def test_get_column_names_peek_rows(tmp_path: Path):
     assert preview[0] == ["姓名", "年龄", "城市"]
 
 
+def test_get_column_names_reads_header_only(tmp_path: Path):
+    """测试只解析到表头行：表头之后的损坏数据不影响获取列名。"""
+    test_file = tmp_path / "test.xlsx"
+    pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]}).to_excel(test_file, index=False)
+    with zipfile.ZipFile(test_file) as source:
+        parts = {name: source.read(name) for name in source.namelist()}
+    # 将第 3 行的数值改为无法解析的内容，完整读取会失败
+    parts["xl/worksheets/sheet1.xml"] = parts["xl/worksheets/sheet1.xml"].replace(
+        b"<v>2</v>", b"<v>not-a-number</v>"
+    )
+    with zipfile.ZipFile(test_file, "w", zipfile.ZIP_DEFLATED) as target:
+        for name, data in parts.items():
+            target.writestr(name, data)
+
+    assert get_column_names(str(test_file)) == ["A", "B"]
+    with pytest.raises(ValueError):
+        get_sheet_info(str(test_file))
+
+
 def test_get_column_names_file_not_found():
     """测试文件不存在的情况。"""
     with pytest.raises(FileNotFoundError, match="文件不存在"):
@@ -416,3 +287,109 @@ def test_get_excel_info_file_not_found():
     """测试文件不存在的情况。"""
     with pytest.raises(FileNotFoundError, match="文件不存在"):
         get_excel_info("nonexistent.xlsx")
+
+
+def _rewrite_dimension(file_path: Path, replacement: str) -> None:
+    """改写第一个工作表 XML 中的 dimension 元素（模拟不规范的写入程序）。"""
+    with zipfile.ZipFile(file_path) as source:
+        parts = {name: source.read(name) for name in source.namelist()}
+    sheet_xml = parts["xl/worksheets/sheet1.xml"].decode("utf-8")
+    parts["xl/worksheets/sheet1.xml"] = re.sub(
+        r"<dimension [^>]*/>", replacement, sheet_xml
+    ).encode("utf-8")
+    with zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED) as target:
+        for name, data in parts.items():
+            target.writestr(name, data)
+
+
+def test_get_excel_info_fast_matches_full(tmp_path: Path):
+    """测试快速模式与完整模式的结果一致。"""
+    test_file = tmp_path / "test.xlsx"
+    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
+        pd.DataFrame({"A": [1, 2, 3], "B": ["x", None, "z"]}).to_excel(
+            writer, sheet_name="Sheet1", index=False
+        )
+        pd.DataFrame({"C": [], "D": []}).to_excel(
+            writer, sheet_name="Sheet2", index=False
+        )
+
+    full = get_excel_info(str(test_file), include_preview=True, preview_rows=2)
+    fast = get_excel_info(
+        str(test_file), include_preview=True, preview_rows=2, fast=True
+    )
+    assert fast == full
+    assert get_excel_info(str(test_file), fast=True) == get_excel_info(str(test_file))
+
+
+def test_get_sheet_info_fast_matches_full(tmp_path: Path):
+    """测试 get_sheet_info 快速模式与完整模式的结果一致。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"姓名": ["张三", "李四", "王五"], "年龄": [25, 30, 28]})
+    df.to_excel(test_file, index=False, sheet_name="员工信息")
+
+    full = get_sheet_info(str(test_file), sheet_name=0, preview_rows=2)
+    fast = get_sheet_info(str(test_file), sheet_name=0, preview_rows=2, fast=True)
+    assert fast == full
+    assert fast["sheet_name"] == "员工信息"
+
+    with pytest.raises(ValueError, match="工作表不存在或无效"):
+        get_sheet_info(str(test_file), sheet_name="NonExistentSheet", fast=True)
+
+
+@pytest.mark.parametrize("dimension", ["", '<dimension ref="A1"/>'])
+def test_get_sheet_info_fast_untrusted_dimension(tmp_path: Path, dimension: str):
+    """测试 dimension 缺失或不可靠时，快速模式通过流式计数得到准确行数。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"A": range(20), "B": range(20)})
+    df.to_excel(test_file, index=False)
+    _rewrite_dimension(test_file, dimension)
+
+    info = get_sheet_info(str(test_file), preview_rows=2, fast=True)
+    assert info["row_count"] == 20
+    assert info["column_names"] == ["A", "B"]
+    assert len(info["preview"]) == 2
+
+
+def test_get_sheet_info_fast_formatted_trailing_rows(tmp_path: Path):
+    """测试带格式的空行使 dimension 偏大时，快速模式仍得到准确行数。"""
+    test_file = tmp_path / "test.xlsx"
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["A", "B"])
+    sheet.append([1, "x"])
+    sheet.append([2, "y"])
+    for row in range(4, 501):
+        sheet.cell(row=row, column=1).fill = PatternFill("solid", fgColor="FFFF00")
+    workbook.save(test_file)
+    with zipfile.ZipFile(test_file) as archive:
+        assert b'<dimension ref="A1:B500"/>' in archive.read("xl/worksheets/sheet1.xml")
+
+    fast = get_sheet_info(str(test_file), preview_rows=2, fast=True)
+    assert fast["row_count"] == 2
+    assert fast == get_sheet_info(str(test_file), preview_rows=2)
+    info = get_excel_info(str(test_file), fast=True)
+    assert info["sheets"][0]["row_count"] == 2
+
+
+def test_get_sheet_info_fast_unusual_sheet_xml(tmp_path: Path):
+    """测试快速模式的行数：命名空间前缀、省略行号、内联字符串与只有样式的单元格。"""
+    test_file = tmp_path / "test.xlsx"
+    pd.DataFrame({"A": [1]}).to_excel(test_file, index=False)
+    with zipfile.ZipFile(test_file) as source:
+        parts = {name: source.read(name) for name in source.namelist()}
+    namespace = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    parts["xl/worksheets/sheet1.xml"] = (
+        f'<x:worksheet xmlns:x="{namespace}"><x:sheetData>'
+        '<x:row><x:c t="inlineStr"><x:is><x:t>A</x:t></x:is></x:c></x:row>'
+        "<x:row><x:c><x:v>1</x:v></x:c></x:row>"
+        '<x:row r="5"><x:c t="inlineStr"><x:is><x:t>x</x:t></x:is></x:c></x:row>'
+        '<x:row r="9"><x:c r="A9" s="0"/></x:row>'
+        "</x:sheetData></x:worksheet>"
+    ).encode("utf-8")
+    with zipfile.ZipFile(test_file, "w", zipfile.ZIP_DEFLATED) as target:
+        for name, data in parts.items():
+            target.writestr(name, data)
+
+    fast = get_sheet_info(str(test_file), preview_rows=0, fast=True)
+    assert fast["row_count"] == 4
+    assert fast["row_count"] == get_sheet_info(str(test_file))["row_count"]
@@ -0,0 +1,93 @@
+"""Excel 流式逐行读取测试。"""
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import get_column_names, iter_excel_rows
+
+
+def test_iter_excel_rows_tuples(tmp_path: Path):
+    """测试默认以元组形式逐行读取。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "z"]})
+    df.to_excel(test_file, index=False)
+
+    rows = list(iter_excel_rows(str(test_file)))
+    assert rows == [(1, "x"), (2, "y"), (3, "z")]
+
+
+def test_iter_excel_rows_as_dict(tmp_path: Path):
+    """测试以字典形式逐行读取，键与 get_column_names 一致。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"姓名": ["张三", "李四"], "年龄": [25, 30]})
+    df.to_excel(test_file, index=False)
+
+    rows = list(iter_excel_rows(str(test_file), as_dict=True))
+    assert rows == [{"姓名": "张三", "年龄": 25}, {"姓名": "李四", "年龄": 30}]
+    assert list(rows[0].keys()) == get_column_names(str(test_file))
+
+
+def test_iter_excel_rows_header_row(tmp_path: Path):
+    """测试指定 header 行，之前的行被跳过。"""
+    test_file = tmp_path / "test.xlsx"
+    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
+        pd.DataFrame([["标题行", None]]).to_excel(
+            writer, sheet_name="Sheet1", index=False, header=False
+        )
+        pd.DataFrame([["姓名", "年龄"], ["张三", 25]]).to_excel(
+            writer, sheet_name="Sheet1", index=False, header=False, startrow=1
+        )
+
+    rows = list(iter_excel_rows(str(test_file), header=1, as_dict=True))
+    assert rows == [{"姓名": "张三", "年龄": 25}]
+
+
+def test_iter_excel_rows_no_header(tmp_path: Path):
+    """测试 header=None 时所有行都作为数据行。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"A": [1, 2]})
+    df.to_excel(test_file, index=False)
+
+    assert list(iter_excel_rows(str(test_file), header=None)) == [("A",), (1,), (2,)]
+    records = list(iter_excel_rows(str(test_file), header=None, as_dict=True))
+    assert records[0] == {0: "A"}
+
+
+def test_iter_excel_rows_blank_cells(tmp_path: Path):
+    """测试空单元格与中间空行为 None，末尾空行被丢弃，整数值的浮点数转为 int。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"A": [1.0, None, 3.5], "B": ["x", None, None]})
+    df.to_excel(test_file, index=False)
+
+    rows = list(iter_excel_rows(str(test_file)))
+    assert rows == [(1, "x"), (None, None), (3.5, None)]
+    assert isinstance(rows[0][0], int)
+
+
+def test_iter_excel_rows_sheet_name(tmp_path: Path):
+    """测试按名称和索引选择工作表。"""
+    test_file = tmp_path / "test.xlsx"
+    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
+        pd.DataFrame({"A": [1]}).to_excel(writer, sheet_name="Sheet1", index=False)
+        pd.DataFrame({"B": [2]}).to_excel(writer, sheet_name="Sheet2", index=False)
+
+    assert list(iter_excel_rows(str(test_file), sheet_name="Sheet2")) == [(2,)]
+    assert list(iter_excel_rows(str(test_file), sheet_name=1)) == [(2,)]
+
+
+def test_iter_excel_rows_file_not_found():
+    """测试文件不存在的情况（调用时立即抛出）。"""
+    with pytest.raises(FileNotFoundError, match="文件不存在"):
+        iter_excel_rows("nonexistent.xlsx")
+
+
+def test_iter_excel_rows_invalid_sheet(tmp_path: Path):
+    """测试无效工作表与超出范围的 header。"""
+    test_file = tmp_path / "test.xlsx"
+    pd.DataFrame({"A": [1]}).to_excel(test_file, index=False)
+
+    with pytest.raises(ValueError, match="工作表不存在或无效"):
+        list(iter_excel_rows(str(test_file), sheet_name="NonExistentSheet"))
+    with pytest.raises(ValueError, match="header 超出范围"):
+        list(iter_excel_rows(str(test_file), header=10))
@@ -0,0 +1,104 @@
+"""Excel 原生读取引擎测试。"""
+
+import datetime
+
+import pytest
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+from pathlib import Path
+
+from unifiles.excel import read_excel
+
+
+def _assert_same_as_openpyxl(file_path: Path, **kwargs):
+    expected = read_excel(str(file_path), **kwargs)
+    result = read_excel(str(file_path), engine="native", **kwargs)
+    pd.testing.assert_frame_equal(result, expected)
+    return result
+
+
+def test_native_engine_matches_openpyxl(tmp_path: Path):
+    """测试各种列类型（含空值与混合类型）的结果与 openpyxl 引擎一致。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "int_gap": [1, None, 3],
+            "float": [1.5, 2, None],
+            "str": ["a", None, "c"],
+            "date": pd.date_range("2024-01-01 10:30", periods=3, freq="7h"),
+            "date_gap": [
+                pd.Timestamp("2020-02-02"),
+                pd.NaT,
+                pd.Timestamp("1900-01-05"),
+            ],
+            "bool": [True, False, True],
+            "mixed": [1, "x", 2.5],
+        }
+    )
+    df.to_excel(test_file, index=False)
+
+    result = _assert_same_as_openpyxl(test_file)
+    assert result["int"].dtype == "int64"
+    assert result["date_gap"].iloc[2] == pd.Timestamp("1900-01-05")
+
+
+def test_native_engine_times_and_sparse_cells(tmp_path: Path):
+    """测试纯时间、时间间隔、稀疏单元格与比表头更宽的行。"""
+    test_file = tmp_path / "test.xlsx"
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(["time", "delta", "value", "value"])
+    worksheet.append([datetime.time(10, 30), datetime.timedelta(hours=30), 1, "=1+1"])
+    worksheet.append([None, None, None, None])
+    worksheet.append([datetime.time(1, 2, 3), datetime.timedelta(minutes=5), "x"])
+    worksheet["B2"].number_format = "[h]:mm:ss"
+    worksheet["B4"].number_format = "[h]:mm:ss"
+    worksheet["F6"] = 5
+    workbook.save(test_file)
+
+    result = _assert_same_as_openpyxl(test_file)
+    assert list(result.columns)[-1] == "Unnamed: 5"
+
+
+def test_native_engine_1904_dates_and_sheet_name(tmp_path: Path):
+    """测试 1904 日期系统与按名称 / 索引选择工作表。"""
+    test_file = tmp_path / "test.xlsx"
+    workbook = Workbook()
+    workbook.epoch = CALENDAR_MAC_1904
+    workbook.active.append(["A"])
+    worksheet = workbook.create_sheet("Dates")
+    worksheet.append(["date"])
+    worksheet.append([datetime.datetime(2024, 5, 6, 7, 8, 9)])
+    workbook.save(test_file)
+
+    result = _assert_same_as_openpyxl(test_file, sheet_name="Dates")
+    assert result["date"].iloc[0] == pd.Timestamp("2024-05-06 07:08:09")
+    _assert_same_as_openpyxl(test_file, sheet_name=1)
+
+
+def test_native_engine_empty_sheets(tmp_path: Path):
+    """测试空工作表与只有表头的工作表。"""
+    empty_file = tmp_path / "empty.xlsx"
+    Workbook().save(empty_file)
+    _assert_same_as_openpyxl(empty_file)
+
+    header_file = tmp_path / "header.xlsx"
+    pd.DataFrame({"A": [], "B": []}).to_excel(header_file, index=False)
+    _assert_same_as_openpyxl(header_file)
+
+
+def test_native_engine_invalid_args(tmp_path: Path):
+    """测试不支持的引擎与文件格式。"""
+    test_file = tmp_path / "test.xlsx"
+    pd.DataFrame({"A": [1]}).to_excel(test_file, index=False)
+    with pytest.raises(ValueError, match="不支持的读取引擎"):
+        read_excel(str(test_file), engine="unknown")
+    with pytest.raises(ValueError, match="工作表不存在或无效"):
+        read_excel(str(test_file), sheet_name="NonExistentSheet", engine="native")
+
+    xls_file = tmp_path / "test.xls"
+    xls_file.write_bytes(b"")
+    with pytest.raises(ValueError, match="仅支持 xlsx"):
+        read_excel(str(xls_file), engine="native")
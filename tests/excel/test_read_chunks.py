@@ -0,0 +1,76 @@
+"""Excel 分块读取测试。"""
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import read_excel, read_excel_chunks
+
+
+def test_read_excel_chunks_matches_full_read(tmp_path: Path):
+    """测试分块结果拼接后与完整读取一致（含 dtype 与连续的行索引）。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame(
+        {
+            "i": range(10),
+            "f": [i * 0.5 for i in range(10)],
+            "s": list("abcdefghij"),
+            "d": pd.date_range("2024-01-01", periods=10),
+            "b": [True, False] * 5,
+        }
+    )
+    df.to_excel(test_file, index=False)
+
+    chunks = list(read_excel_chunks(str(test_file), chunksize=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert list(chunks[1].index) == [4, 5, 6, 7]
+    pd.testing.assert_frame_equal(pd.concat(chunks), read_excel(str(test_file)))
+
+
+def test_read_excel_chunks_dtypes_follow_chunk_data(tmp_path: Path):
+    """测试每个分块的 dtype 与 read_excel 读取相同数据时一致。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"A": [1, 2, None, 4]})
+    df.to_excel(test_file, index=False)
+
+    first, second = read_excel_chunks(str(test_file), chunksize=2)
+    assert first["A"].dtype == "int64"
+    assert second["A"].dtype == "float64"
+
+
+def test_read_excel_chunks_header_and_sheet(tmp_path: Path):
+    """测试 header 与 sheet_name 参数。"""
+    test_file = tmp_path / "test.xlsx"
+    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
+        pd.DataFrame({"A": [1]}).to_excel(writer, sheet_name="Sheet1", index=False)
+        pd.DataFrame([["标题"], ["B"], [2], [3]]).to_excel(
+            writer, sheet_name="Sheet2", index=False, header=False
+        )
+
+    chunks = list(
+        read_excel_chunks(str(test_file), chunksize=5, sheet_name="Sheet2", header=1)
+    )
+    assert len(chunks) == 1
+    assert list(chunks[0].columns) == ["B"]
+    assert chunks[0]["B"].tolist() == [2, 3]
+
+
+def test_read_excel_chunks_empty_sheet(tmp_path: Path):
+    """测试没有数据行时产出一个只有列名的空 DataFrame。"""
+    test_file = tmp_path / "test.xlsx"
+    pd.DataFrame({"A": [], "B": []}).to_excel(test_file, index=False)
+
+    chunks = list(read_excel_chunks(str(test_file), chunksize=3))
+    assert len(chunks) == 1
+    pd.testing.assert_frame_equal(chunks[0], read_excel(str(test_file)))
+
+
+def test_read_excel_chunks_invalid_args(tmp_path: Path):
+    """测试文件不存在与无效 chunksize。"""
+    with pytest.raises(FileNotFoundError, match="文件不存在"):
+        read_excel_chunks("nonexistent.xlsx", chunksize=10)
+
+    test_file = tmp_path / "test.xlsx"
+    pd.DataFrame({"A": [1]}).to_excel(test_file, index=False)
+    with pytest.raises(ValueError, match="chunksize"):
+        read_excel_chunks(str(test_file), chunksize=0)
@@ -0,0 +1,75 @@
+"""read_excel 紧凑 dtype（compact）测试。"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import read_excel, write_excel
+
+
+@pytest.fixture
+def status_file(tmp_path: Path) -> Path:
+    test_file = tmp_path / "status.xlsx"
+    rows = 60
+    df = pd.DataFrame(
+        {
+            "status": [("open", "closed", "NA")[i % 3] for i in range(rows)],
+            "region": [
+                None if i % 4 == 0 else ("北", "南")[i % 2] for i in range(rows)
+            ],
+            "code": [("1", "2")[i % 2] for i in range(rows)],
+            "id": range(rows),
+            "big": [i * 100_000 for i in range(rows)],
+            "half": [i / 2 for i in range(rows)],
+            "ratio": [i / 3 for i in range(rows)],
+            "name": [f"name {i}" for i in range(rows)],
+        }
+    )
+    write_excel(df, str(test_file))
+    return test_file
+
+
+@pytest.mark.parametrize("engine", [None, "native"])
+def test_read_excel_compact(status_file: Path, engine: str | None):
+    """测试 compact=True：低基数字符串列转为 category，数值列按需降级。"""
+    default = read_excel(str(status_file), engine=engine)
+    result = read_excel(str(status_file), engine=engine, compact=True)
+
+    assert result["status"].dtype == "category"
+    assert list(result["status"].cat.categories) == ["closed", "open"]
+    assert result["status"].isna().sum() == 20
+    assert result["region"].dtype == "category"
+    assert result["region"].isna().sum() == 15
+    # 整列都是数字文本时，按 read_excel 的规则解析为数字
+    assert result["code"].dtype == np.int8
+    assert result["id"].dtype == np.int8
+    assert result["big"].dtype == np.int32
+    assert result["half"].dtype == np.float32
+    assert result["ratio"].dtype == np.float64
+    # 不同取值过多的字符串列保持原样
+    assert result["name"].dtype == default["name"].dtype
+
+    assert result.astype(object).equals(default.astype(object))
+    assert result.memory_usage(deep=True).sum() < default.memory_usage(deep=True).sum()
+
+
+def test_read_excel_compact_engines_match(status_file: Path):
+    """测试原生引擎直接由共享字符串生成的结果与 openpyxl 引擎一致。"""
+    pd.testing.assert_frame_equal(
+        read_excel(str(status_file), engine="native", compact=True),
+        read_excel(str(status_file), compact=True),
+    )
+
+
+def test_read_excel_compact_with_usecols(status_file: Path):
+    """测试 compact 与列选择、行过滤同时使用。"""
+    result = read_excel(
+        str(status_file),
+        usecols=["status", "id"],
+        filters=[("id", "<", 30)],
+        compact=True,
+    )
+    assert list(result.columns) == ["status", "id"]
+    assert result["status"].dtype == "category"
+    assert result["id"].dtype == np.int8
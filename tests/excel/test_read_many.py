@@ -0,0 +1,99 @@
+"""Excel 多文件批量读取测试。"""
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import read_excel, read_excel_many, write_excel
+
+
+@pytest.fixture
+def export_dir(tmp_path: Path) -> Path:
+    for day in range(1, 5):
+        df = pd.DataFrame(
+            {
+                "day": [day] * 3,
+                "name": ["张三", "李四", None],
+                "amount": [1.5 * day, 2.0, 3.25],
+            }
+        )
+        write_excel(df, str(tmp_path / f"2024-01-0{day}.xlsx"))
+    return tmp_path
+
+
+def test_read_excel_many_glob(export_dir: Path):
+    """测试 glob 模式并行读取：按路径排序合并，追加来源文件列。"""
+    report: dict = {}
+    result = read_excel_many(
+        str(export_dir / "*.xlsx"), workers=2, source_column="source", report=report
+    )
+
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) == 12
+    assert result["day"].tolist() == [1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4]
+    assert result.index.tolist() == list(range(12))
+    assert Path(result["source"].iloc[-1]).name == "2024-01-04.xlsx"
+    first = str(export_dir / "2024-01-01.xlsx")
+    pd.testing.assert_frame_equal(
+        result[result["source"] == first].drop(columns="source"),
+        read_excel(first),
+    )
+
+    assert report["files"] == 4
+    assert report["succeeded"] == 4
+    assert report["failed"] == 0
+    assert report["rows"] == 12
+    assert report["files_per_second"] > 0
+    assert report["rows_per_second"] > 0
+    assert report["errors"] == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_excel_many_collects_errors(export_dir: Path, workers: int):
+    """测试单个文件失败时跳过并记录错误，不中断整批读取。"""
+    broken = export_dir / "broken.xlsx"
+    broken.write_bytes(b"not an excel file")
+    paths = [
+        str(export_dir / "2024-01-01.xlsx"),
+        str(broken),
+        str(export_dir / "missing.xlsx"),
+        str(export_dir / "2024-01-02.xlsx"),
+    ]
+    report: dict = {}
+    result = read_excel_many(paths, workers=workers, report=report)
+
+    assert result["day"].tolist() == [1, 1, 1, 2, 2, 2]
+    assert report["succeeded"] == 2
+    assert report["failed"] == 2
+    assert [item["path"] for item in report["errors"]] == paths[1:3]
+    assert "FileNotFoundError" in report["errors"][1]["error"]
+
+
+def test_read_excel_many_warns_without_report(export_dir: Path):
+    """测试未传入 report 时，失败的文件以警告提示。"""
+    paths = [str(export_dir / "2024-01-01.xlsx"), str(export_dir / "missing.xlsx")]
+    with pytest.warns(RuntimeWarning, match="1 个 Excel 文件读取失败"):
+        result = read_excel_many(paths, workers=1)
+    assert len(result) == 3
+
+
+def test_read_excel_many_iterator(export_dir: Path):
+    """测试迭代器模式按输入顺序产出 (路径, DataFrame)。"""
+    paths = [str(export_dir / f"2024-01-0{day}.xlsx") for day in (3, 1, 2)]
+    report: dict = {}
+    frames = read_excel_many(paths, workers=2, as_iterator=True, report=report)
+
+    assert report["files"] == 3
+    items = list(frames)
+    assert [path for path, _ in items] == paths
+    assert [int(df["day"].iloc[0]) for _, df in items] == [3, 1, 2]
+    assert report["rows"] == 9
+
+
+def test_read_excel_many_invalid(export_dir: Path):
+    """测试无匹配文件与无效参数。"""
+    with pytest.raises(FileNotFoundError, match="没有匹配的文件"):
+        read_excel_many(str(export_dir / "*.xls"))
+    with pytest.raises(ValueError, match="workers"):
+        read_excel_many(str(export_dir / "*.xlsx"), workers=0)
+    assert read_excel_many([]).empty
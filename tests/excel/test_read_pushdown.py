@@ -0,0 +1,90 @@
+"""Excel 列选择与行过滤读取测试。"""
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import read_excel
+
+
+@pytest.fixture
+def sample_file(tmp_path: Path) -> Path:
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "name": ["a", "b", "c", "d", "e"],
+            "amount": [10.5, None, 30.0, 40.25, 50.0],
+            "date": pd.date_range("2024-01-01", periods=5),
+            "flag": [True, False, True, False, True],
+        }
+    )
+    df.to_excel(test_file, index=False)
+    return test_file
+
+
+def test_read_excel_usecols_matches_full_read(sample_file: Path):
+    """测试列选择的结果与完整读取后选列一致（含 dtype），列按文件顺序排列。"""
+    full = read_excel(str(sample_file))
+
+    expected = full[["id", "date"]]
+    pd.testing.assert_frame_equal(
+        read_excel(str(sample_file), usecols=["date", "id"]), expected
+    )
+    pd.testing.assert_frame_equal(
+        read_excel(str(sample_file), usecols=[0, 3]), expected
+    )
+    pd.testing.assert_frame_equal(
+        read_excel(str(sample_file), usecols="B:C,E"), full[["name", "amount", "flag"]]
+    )
+
+
+def test_read_excel_filters(sample_file: Path):
+    """测试行过滤：多个条件为“且”，过滤列不必被选中，行索引重新编号。"""
+    df = read_excel(
+        str(sample_file),
+        usecols=["name"],
+        filters=[("id", ">=", 2), ("name", "in", {"b", "c", "e"})],
+    )
+    assert list(df.columns) == ["name"]
+    assert df["name"].tolist() == ["b", "c", "e"]
+    assert list(df.index) == [0, 1, 2]
+
+
+def test_read_excel_filters_blank_and_type_mismatch(sample_file: Path):
+    """测试空单元格与无法比较的类型视为不满足条件。"""
+    df = read_excel(str(sample_file), filters=[("amount", "!=", 30.0)])
+    assert df["id"].tolist() == [1, 4, 5]
+
+    df = read_excel(str(sample_file), filters=[("name", ">", 1)])
+    assert df.empty
+    assert list(df.columns) == ["id", "name", "amount", "date", "flag"]
+
+
+def test_read_excel_pushdown_keeps_blank_rows(tmp_path: Path):
+    """测试只选列时中间空行保留、末尾空行丢弃，与完整读取一致。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"A": [1, None, 3, None], "B": ["x", None, None, "y"]})
+    df.to_excel(test_file, index=False)
+
+    full = read_excel(str(test_file))
+    pd.testing.assert_frame_equal(
+        read_excel(str(test_file), usecols=["A"]), full[["A"]]
+    )
+
+
+def test_read_excel_pushdown_invalid_args(sample_file: Path, tmp_path: Path):
+    """测试列不存在、运算符无效与不支持的文件格式。"""
+    with pytest.raises(ValueError, match="列不存在"):
+        read_excel(str(sample_file), usecols=["missing"])
+    with pytest.raises(ValueError, match="列不存在"):
+        read_excel(str(sample_file), filters=[("missing", "==", 1)])
+    with pytest.raises(ValueError, match="不支持的过滤运算符"):
+        read_excel(str(sample_file), filters=[("id", "~", 1)])
+    with pytest.raises(ValueError, match="工作表"):
+        read_excel(str(sample_file), sheet_name="NonExistentSheet", usecols=["id"])
+
+    xls_file = tmp_path / "test.xls"
+    xls_file.write_bytes(b"")
+    with pytest.raises(ValueError, match="仅支持 xlsx"):
+        read_excel(str(xls_file), usecols=["id"])
@@ -0,0 +1,96 @@
+"""read_excel 单元格区域（cell_range）读取测试。"""
+
+import datetime
+
+import pytest
+import pandas as pd
+from openpyxl import Workbook
+from pathlib import Path
+
+from unifiles.excel import read_excel
+
+
+@pytest.fixture
+def template_file(tmp_path: Path) -> Path:
+    """标题与备注环绕数据块（B3:D9），数据块之后还有大量只带格式的空行。"""
+    test_file = tmp_path / "template.xlsx"
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet["A1"] = "月度报表"
+    worksheet.append(["name", "value", "date"])
+    worksheet.move_range("A2:C2", rows=1, cols=1)
+    for row in range(4, 10):
+        if row == 7:
+            continue
+        worksheet.cell(row, 2, f"item {row}")
+        worksheet.cell(row, 3, row * 1.5)
+        worksheet.cell(row, 4, datetime.datetime(2024, 1, row))
+    worksheet["F5"] = "备注"
+    worksheet["B12"] = "制表人"
+    for row in range(13, 2000):
+        worksheet.cell(row, 2).number_format = "0.00"
+    workbook.save(test_file)
+    return test_file
+
+
+def test_read_excel_cell_range(template_file: Path):
+    """测试读取固定区域：与 pandas 的 header/usecols/nrows 组合结果一致。"""
+    result = read_excel(str(template_file), cell_range="B3:D9")
+    expected = pd.read_excel(template_file, header=2, usecols="B:D", nrows=6)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["value"].isna().tolist() == [False] * 3 + [True] + [False] * 2
+
+
+def test_read_excel_cell_range_open_ended(template_file: Path):
+    """测试整列区域与整行区域。"""
+    columns = read_excel(str(template_file), cell_range="B:D")
+    # 区域的第一行（第 1 行）在 B:D 中为空，列名均为 Unnamed
+    assert list(columns.columns) == ["Unnamed: 0", "Unnamed: 1", "Unnamed: 2"]
+    assert columns.iloc[1].tolist() == ["name", "value", "date"]
+    assert columns.iloc[-1, 0] == "制表人"
+
+    rows = read_excel(str(template_file), cell_range="3:9")
+    assert list(rows.columns) == [
+        "Unnamed: 0",
+        "name",
+        "value",
+        "date",
+        "Unnamed: 4",
+        "Unnamed: 5",
+    ]
+    assert rows["Unnamed: 5"].iloc[1] == "备注"
+    assert len(rows) == 6
+
+
+def test_read_excel_cell_range_with_usecols_and_filters(template_file: Path):
+    """测试区域与列选择、行过滤组合：列字母指工作表中的列，列名相对于区域。"""
+    result = read_excel(
+        str(template_file),
+        cell_range="B3:D9",
+        usecols="C:D",
+        filters=[("value", ">", 7)],
+    )
+    assert list(result.columns) == ["value", "date"]
+    assert result["value"].tolist() == [7.5, 9.0, 12.0, 13.5]
+
+    result = read_excel(str(template_file), cell_range="B3:D9", usecols=[0, "date"])
+    assert list(result.columns) == ["name", "date"]
+
+
+def test_read_excel_cell_range_invalid(template_file: Path, tmp_path: Path):
+    """测试无效区域、区域外的列（列字母与列索引）与不支持的文件格式。"""
+    with pytest.raises(ValueError, match="单元格区域无效"):
+        read_excel(str(template_file), cell_range="B2:F")
+    with pytest.raises(ValueError, match="列不在单元格区域内"):
+        read_excel(str(template_file), cell_range="B3:D9", usecols="A")
+    with pytest.raises(ValueError, match="列不在单元格区域内"):
+        read_excel(str(template_file), cell_range="B3:D6", usecols="D:Z")
+    with pytest.raises(ValueError, match="列不在单元格区域内"):
+        read_excel(str(template_file), cell_range="B3:D6", usecols=[0, 3])
+    with pytest.raises(ValueError, match="列不在单元格区域内"):
+        read_excel(str(template_file), cell_range="B3:D6", filters=[(3, "==", 1)])
+
+    xls_file = tmp_path / "test.xls"
+    xls_file.write_bytes(b"")
+    with pytest.raises(ValueError, match="仅支持 xlsx"):
+        read_excel(str(xls_file), cell_range="A1:B2")
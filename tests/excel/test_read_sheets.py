@@ -0,0 +1,69 @@
+"""Excel 多工作表并行读取测试。"""
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import read_excel, read_excel_sheets
+from unifiles.excel._common import pack_frame, unpack_frame
+
+
+@pytest.fixture
+def multi_sheet_file(tmp_path: Path) -> Path:
+    test_file = tmp_path / "test.xlsx"
+    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
+        for i in range(3):
+            pd.DataFrame(
+                {
+                    "name": ["张三", "李四", None] * 4,
+                    "value": range(i, i + 12),
+                    "mixed": [1, "x", True] * 4,
+                    "date": pd.date_range("2024-01-01", periods=12),
+                }
+            ).to_excel(writer, sheet_name=f"Sheet{i + 1}", index=False)
+    return test_file
+
+
+def test_read_excel_sheets_matches_read_excel(multi_sheet_file: Path):
+    """测试并行读取的结果与逐个 read_excel 一致（包括已缓存句柄的情况）。"""
+    read_excel(str(multi_sheet_file))
+
+    frames = read_excel_sheets(str(multi_sheet_file), workers=2)
+    assert list(frames) == ["Sheet1", "Sheet2", "Sheet3"]
+    for name, df in frames.items():
+        pd.testing.assert_frame_equal(df, read_excel(str(multi_sheet_file), name))
+
+
+def test_read_excel_sheets_selection(multi_sheet_file: Path):
+    """测试按名称和索引选择工作表，结果按参数顺序排列。"""
+    frames = read_excel_sheets(str(multi_sheet_file), sheets=[2, "Sheet1"], workers=2)
+    assert list(frames) == ["Sheet3", "Sheet1"]
+
+    frames = read_excel_sheets(str(multi_sheet_file), sheets=["Sheet2"], workers=1)
+    assert frames["Sheet2"]["value"].tolist() == list(range(1, 13))
+
+
+def test_pack_frame_roundtrip():
+    """测试跨进程打包格式可以无损还原，混合类型的 object 列保持原值。"""
+    df = pd.DataFrame(
+        {
+            "s": pd.array(["a", None, "b", "a"], dtype=object),
+            "m": pd.array([1, True, 1.0, "a"], dtype=object),
+            "f": [0.5, None, 2.0, 3.0],
+        },
+        index=[10, 11, 12, 13],
+    )
+    restored = unpack_frame(pack_frame(df))
+    pd.testing.assert_frame_equal(restored, df)
+    assert restored["m"].tolist() == [1, True, 1.0, "a"]
+    assert [type(value) for value in restored["m"]] == [int, bool, float, str]
+
+
+def test_read_excel_sheets_invalid_args(multi_sheet_file: Path):
+    """测试文件不存在、工作表不存在与无效 workers。"""
+    with pytest.raises(FileNotFoundError, match="文件不存在"):
+        read_excel_sheets("nonexistent.xlsx")
+    with pytest.raises(ValueError, match="工作表不存在或无效"):
+        read_excel_sheets(str(multi_sheet_file), sheets=["NonExistentSheet"])
+    with pytest.raises(ValueError, match="workers"):
+        read_excel_sheets(str(multi_sheet_file), workers=0)
@@ -0,0 +1,177 @@
+"""工作簿句柄缓存测试。"""
+
+import os
+import zipfile
+
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from unifiles.excel import (
+    _workbook_cache,
+    excel_to_sqlite,
+    fingerprint_excel,
+    get_column_names,
+    get_excel_info,
+    get_sheet_info,
+    get_sheet_names,
+    read_excel,
+    write_excel,
+)
+
+
+def _open_paths() -> list[str]:
+    """当前进程打开的文件路径。"""
+    fd_dir = Path("/proc/self/fd")
+    paths = []
+    for fd in fd_dir.iterdir():
+        try:
+            paths.append(os.readlink(fd))
+        except OSError:
+            continue
+    return paths
+
+
+@pytest.fixture
+def open_count(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """记录缓存实际打开文件的次数。"""
+    opened: list[str] = []
+    original = pd.ExcelFile
+
+    def counting_excel_file(path: str) -> pd.ExcelFile:
+        opened.append(path)
+        return original(path)
+
+    monkeypatch.setattr(_workbook_cache.pd, "ExcelFile", counting_excel_file)
+    return opened
+
+
+def test_calls_share_one_handle(tmp_path: Path, open_count: list[str]):
+    """测试同一未修改文件的多次调用只解析一次工作簿。"""
+    test_file = tmp_path / "test.xlsx"
+    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
+        pd.DataFrame({"A": [1, 2]}).to_excel(writer, sheet_name="S1", index=False)
+        pd.DataFrame({"B": [3]}).to_excel(writer, sheet_name="S2", index=False)
+
+    read_excel(str(test_file))
+    get_sheet_names(str(test_file))
+    get_column_names(str(test_file), sheet_name="S2")
+    get_sheet_info(str(test_file), sheet_name=1)
+    get_excel_info(str(test_file))
+    get_excel_info(str(test_file), fast=True)
+
+    assert len(open_count) == 1
+
+
+def test_modified_file_is_reloaded(tmp_path: Path, open_count: list[str]):
+    """测试文件修改后缓存失效，读取到新内容。"""
+    test_file = tmp_path / "test.xlsx"
+    pd.DataFrame({"A": [1]}).to_excel(test_file, index=False)
+    assert get_column_names(str(test_file)) == ["A"]
+
+    pd.DataFrame({"B": [1, 2, 3]}).to_excel(test_file, index=False)
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert get_column_names(str(test_file)) == ["B"]
+    assert len(open_count) == 2
+
+
+def test_write_excel_evicts_handle(tmp_path: Path):
+    """测试 write_excel 写入前释放该文件的缓存句柄。"""
+    test_file = tmp_path / "test.xlsx"
+    path = str(test_file.resolve())
+    write_excel(pd.DataFrame({"A": [1]}), str(test_file))
+    read_excel(str(test_file))
+    assert any(key[0] == path for key in _workbook_cache._handles)
+
+    write_excel(pd.DataFrame({"B": [2]}), str(test_file))
+    assert not any(key[0] == path for key in _workbook_cache._handles)
+    assert list(read_excel(str(test_file)).columns) == ["B"]
+
+
+def test_lru_eviction(tmp_path: Path):
+    """测试缓存数量有上限，最久未使用的句柄被关闭。"""
+    files = []
+    for i in range(_workbook_cache.MAX_HANDLES + 2):
+        test_file = tmp_path / f"test{i}.xlsx"
+        pd.DataFrame({"A": [i]}).to_excel(test_file, index=False)
+        files.append(str(test_file))
+
+    first_handle = None
+    for file_path in files:
+        read_excel(file_path)
+        if first_handle is None:
+            first_handle = next(iter(_workbook_cache._handles.values()))
+
+    assert len(_workbook_cache._handles) == _workbook_cache.MAX_HANDLES
+    assert first_handle is not None and first_handle.closed
+
+
+@pytest.mark.skipif(
+    not Path("/proc/self/fd").is_dir(), reason="需要 /proc/self/fd 列出打开的文件"
+)
+def test_files_closed_between_calls(tmp_path: Path):
+    """测试调用返回后缓存不占用文件。"""
+    test_file = tmp_path / "test.xlsx"
+    with pd.ExcelWriter(test_file, engine="openpyxl") as writer:
+        pd.DataFrame({"A": ["x", "y"], "B": [1, 2]}).to_excel(
+            writer, sheet_name="S1", index=False
+        )
+        pd.DataFrame({"C": [3]}).to_excel(writer, sheet_name="S2", index=False)
+    file_path = str(test_file)
+
+    read_excel(file_path)
+    read_excel(file_path, engine="native")
+    read_excel(file_path, usecols=["B"])
+    get_sheet_names(file_path)
+    get_column_names(file_path, sheet_name="S2")
+    get_sheet_info(file_path, sheet_name=1)
+    get_excel_info(file_path)
+    get_excel_info(file_path, fast=True)
+    fingerprint_excel(file_path)
+    excel_to_sqlite(file_path, str(tmp_path / "test.db"), "t")
+
+    assert str(test_file.resolve()) not in _open_paths()
+    # 缓存的解析结果仍可继续使用
+    assert read_excel(file_path)["A"].tolist() == ["x", "y"]
+    assert str(test_file.resolve()) not in _open_paths()
+
+
+def test_shared_strings_resume_after_release(tmp_path: Path):
+    """测试共享字符串表在文件关闭后从上次解析的位置继续解析。"""
+    test_file = tmp_path / "test.xlsx"
+    pd.DataFrame({"A": [1]}).to_excel(test_file, index=False)
+    with zipfile.ZipFile(test_file) as source:
+        parts = {name: source.read(name) for name in source.namelist()}
+    namespace = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    strings = ["A", "B"] + [f"{c}{i}" for i in range(20) for c in "ab"]
+    parts["xl/sharedStrings.xml"] = (
+        f'<sst xmlns="{namespace}">'
+        + "".join(f"<si><t>{text}</t></si>" for text in strings)
+        + "</sst>"
+    ).encode("utf-8")
+    rows = "".join(
+        f'<row r="{r + 1}"><c r="A{r + 1}" t="s"><v>{2 * r}</v></c>'
+        f'<c r="B{r + 1}" t="s"><v>{2 * r + 1}</v></c></row>'
+        for r in range(21)
+    )
+    parts["xl/worksheets/sheet1.xml"] = (
+        f'<worksheet xmlns="{namespace}"><sheetData>{rows}</sheetData></worksheet>'
+    ).encode("utf-8")
+    rels = parts["xl/_rels/workbook.xml.rels"].decode("utf-8")
+    parts["xl/_rels/workbook.xml.rels"] = rels.replace(
+        "</Relationships>",
+        '<Relationship Id="rIdSst" Target="sharedStrings.xml" Type="http://'
+        "schemas.openxmlformats.org/officeDocument/2006/relationships/"
+        'sharedStrings"/></Relationships>',
+    ).encode("utf-8")
+    with zipfile.ZipFile(test_file, "w", zipfile.ZIP_DEFLATED) as target:
+        for name, data in parts.items():
+            target.writestr(name, data)
+
+    head = read_excel(str(test_file), cell_range="A1:B3", engine="native")
+    assert head["B"].tolist() == ["b0", "b1"]
+    result = read_excel(str(test_file), engine="native")
+    assert result["A"].tolist() == [f"a{i}" for i in range(20)]
+    assert result["B"].tolist() == [f"b{i}" for i in range(20)]
@@ -0,0 +1,204 @@
+"""Excel 追加 / 替换工作表测试。"""
+
+import datetime
+import zipfile
+
+import pytest
+import pandas as pd
+from openpyxl import load_workbook
+from pathlib import Path
+
+from unifiles.excel import get_sheet_names, read_excel, write_excel
+
+
+@pytest.fixture
+def workbook_file(tmp_path: Path) -> Path:
+    test_file = tmp_path / "test.xlsx"
+    write_excel(
+        {
+            "One": pd.DataFrame({"A": [1, 2], "B": ["x", "y"]}),
+            "Two": pd.DataFrame({"C": [3.5]}),
+        },
+        str(test_file),
+    )
+    return test_file
+
+
+def _raw_entries(file_path: Path) -> dict[str, tuple[int, int]]:
+    with zipfile.ZipFile(file_path) as archive:
+        return {
+            info.filename: (info.CRC, info.compress_size) for info in archive.infolist()
+        }
+
+
+def test_append_sheet_keeps_other_parts(workbook_file: Path):
+    """测试追加工作表：原有部件按原始字节复制，新工作表数据正确。"""
+    before = _raw_entries(workbook_file)
+    new = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=3),
+            "text": [" 前导空格", "a&b<c>", None],
+            "value": [1.5, None, 3],
+            "time": [datetime.time(1, 2), None, datetime.time(3, 4)],
+            "flag": [True, False, True],
+        }
+    )
+    write_excel(new, str(workbook_file), sheet_name="New", mode="a")
+
+    assert get_sheet_names(str(workbook_file)) == ["One", "Two", "New"]
+    after = _raw_entries(workbook_file)
+    for part in ("xl/worksheets/sheet1.xml", "xl/worksheets/sheet2.xml"):
+        assert after[part] == before[part]
+
+    result = read_excel(str(workbook_file), sheet_name="New")
+    assert result["date"].tolist() == list(pd.date_range("2024-01-01", periods=3))
+    assert result["text"].tolist()[:2] == [" 前导空格", "a&b<c>"]
+    assert result["time"].tolist()[0] == datetime.time(1, 2)
+    assert result["flag"].tolist() == [True, False, True]
+    assert read_excel(str(workbook_file), sheet_name="One")["B"].tolist() == ["x", "y"]
+
+    # openpyxl 可以完整加载修改后的工作簿
+    workbook = load_workbook(workbook_file)
+    assert workbook["New"]["A2"].is_date
+
+
+def test_replace_sheet(workbook_file: Path):
+    """测试替换已有工作表，工作表顺序不变。"""
+    write_excel(
+        pd.DataFrame({"Z": [9]}),
+        str(workbook_file),
+        sheet_name="One",
+        mode="a",
+        if_sheet_exists="replace",
+    )
+    assert get_sheet_names(str(workbook_file)) == ["One", "Two"]
+    assert read_excel(str(workbook_file), sheet_name="One")["Z"].tolist() == [9]
+    assert read_excel(str(workbook_file), sheet_name="Two")["C"].tolist() == [3.5]
+
+
+def test_replace_sheet_drops_calc_chain(workbook_file: Path, tmp_path: Path):
+    """测试替换工作表时删除计算链及其关系与内容类型声明。"""
+    patched = tmp_path / "calc.xlsx"
+    with (
+        zipfile.ZipFile(workbook_file) as source,
+        zipfile.ZipFile(patched, "w") as target,
+    ):
+        for info in source.infolist():
+            data = source.read(info.filename)
+            if info.filename == "xl/_rels/workbook.xml.rels":
+                data = data.replace(
+                    b"</Relationships>",
+                    b'<Relationship Id="rId99" Type="http://schemas.openxmlformats.org'
+                    b'/officeDocument/2006/relationships/calcChain" '
+                    b'Target="calcChain.xml"/></Relationships>',
+                )
+            elif info.filename == "[Content_Types].xml":
+                data = data.replace(
+                    b"</Types>",
+                    b'<Override PartName="/xl/calcChain.xml" ContentType="application/'
+                    b'vnd.openxmlformats-officedocument.spreadsheetml.calcChain+xml"/>'
+                    b"</Types>",
+                )
+            target.writestr(info, data)
+        target.writestr("xl/calcChain.xml", b'<calcChain><c r="A1" i="1"/></calcChain>')
+
+    write_excel(
+        pd.DataFrame({"Z": [9]}),
+        str(patched),
+        sheet_name="One",
+        mode="a",
+        if_sheet_exists="replace",
+    )
+    with zipfile.ZipFile(patched) as archive:
+        assert "xl/calcChain.xml" not in archive.namelist()
+        assert b"calcChain" not in archive.read("xl/_rels/workbook.xml.rels")
+        assert b"calcChain" not in archive.read("[Content_Types].xml")
+    load_workbook(patched)
+
+
+def test_append_sheet_keeps_namespace_prefixes(workbook_file: Path, tmp_path: Path):
+    """测试清单文件按 XML 编辑：保留 mc:Ignorable 引用的命名空间前缀与声明。"""
+    patched = tmp_path / "prefixed.xlsx"
+    with (
+        zipfile.ZipFile(workbook_file) as source,
+        zipfile.ZipFile(patched, "w") as target,
+    ):
+        for info in source.infolist():
+            data = source.read(info.filename)
+            if info.filename == "xl/workbook.xml":
+                data = data.replace(
+                    b"<workbook ",
+                    b'<workbook xmlns:mc="http://schemas.openxmlformats.org/'
+                    b'markup-compatibility/2006" mc:Ignorable="x15" xmlns:x15="'
+                    b'http://schemas.microsoft.com/office/spreadsheetml/2010/11/main" ',
+                    1,
+                )
+            target.writestr(info, data)
+
+    write_excel(pd.DataFrame({"Z": [9]}), str(patched), sheet_name="New", mode="a")
+    with zipfile.ZipFile(patched) as archive:
+        workbook = archive.read("xl/workbook.xml")
+    assert b'mc:Ignorable="x15"' in workbook
+    assert b"xmlns:x15=" in workbook
+    assert get_sheet_names(str(patched)) == ["One", "Two", "New"]
+    assert load_workbook(patched)["New"]["A2"].value == 9
+
+
+@pytest.mark.parametrize("options", [{"mode": "a"}, {"parallel": True}])
+def test_write_excel_formula_strings_match_default(
+    workbook_file: Path, tmp_path: Path, options
+):
+    """测试以 "=" 开头的字符串与默认写入一样写为公式，错误值写为错误单元格。"""
+    df = pd.DataFrame({"value": ["=1+2", "=", "#N/A", "text"]})
+    default_file = tmp_path / "default.xlsx"
+    write_excel(df, str(default_file), sheet_name="New")
+    write_excel(df, str(workbook_file), sheet_name="New", **options)
+
+    expected = [
+        (cell.value, cell.data_type) for cell in load_workbook(default_file)["New"]["A"]
+    ]
+    actual = [
+        (cell.value, cell.data_type)
+        for cell in load_workbook(workbook_file)["New"]["A"]
+    ]
+    assert actual == expected
+    assert expected[1:] == [("=1+2", "f"), ("=", "s"), ("#N/A", "e"), ("text", "s")]
+
+
+def test_append_sheet_invalid(workbook_file: Path, tmp_path: Path):
+    """测试工作表已存在、文件不存在与无效参数。"""
+    df = pd.DataFrame({"A": [1]})
+    with pytest.raises(ValueError, match="工作表已存在"):
+        write_excel(df, str(workbook_file), sheet_name="One", mode="a")
+    with pytest.raises(FileNotFoundError, match="文件不存在"):
+        write_excel(df, str(tmp_path / "missing.xlsx"), mode="a")
+    with pytest.raises(ValueError, match="mode"):
+        write_excel(df, str(workbook_file), mode="x")
+    with pytest.raises(ValueError, match="if_sheet_exists"):
+        write_excel(df, str(workbook_file), mode="a", if_sheet_exists="overlay")
+
+
+def test_append_sheet_invalid_names(workbook_file: Path):
+    """测试追加时校验工作表名称：无效字符、过长、与已有工作表仅大小写不同。"""
+    df = pd.DataFrame({"A": [1]})
+    before = workbook_file.read_bytes()
+    with pytest.raises(ValueError, match="工作表名称无效"):
+        write_excel(df, str(workbook_file), sheet_name="bad/name", mode="a")
+    with pytest.raises(ValueError, match="工作表名称无效"):
+        write_excel(df, str(workbook_file), sheet_name="x" * 32, mode="a")
+    with pytest.raises(ValueError, match="工作表名称重复"):
+        write_excel({"New": df, "NEW": df}, str(workbook_file), mode="a")
+    with pytest.raises(ValueError, match="工作表已存在"):
+        write_excel(df, str(workbook_file), sheet_name="one", mode="a")
+    assert workbook_file.read_bytes() == before
+
+
+def test_replace_sheet_case_insensitive(workbook_file: Path):
+    """测试替换时名称不区分大小写，保留原工作表的名称。"""
+    df = pd.DataFrame({"A": [9]})
+    write_excel(
+        df, str(workbook_file), sheet_name="ONE", mode="a", if_sheet_exists="replace"
+    )
+    assert get_sheet_names(str(workbook_file)) == ["One", "Two"]
+    pd.testing.assert_frame_equal(read_excel(str(workbook_file), "One"), df)
+    load_workbook(workbook_file)
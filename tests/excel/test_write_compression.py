@@ -0,0 +1,91 @@
+"""Excel 写入压缩配置测试。"""
+
+import zipfile
+
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles.excel import read_excel, write_excel, write_excel_rows
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {"id": range(2000), "name": [f"Item {i % 50}" for i in range(2000)]}
+    )
+
+
+def _compress_types(file_path: Path) -> set[int]:
+    with zipfile.ZipFile(file_path) as archive:
+        assert archive.testzip() is None
+        return {info.compress_type for info in archive.infolist()}
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"streaming": True}, {"parallel": True}, {"split_sheets": True}],
+)
+def test_write_excel_compression_profiles(
+    tmp_path: Path, sample_df: pd.DataFrame, options: dict
+):
+    """测试各写入方式都按压缩配置写入，数据不变，文件大小随配置变化。"""
+    sizes = {}
+    for compression in ("store", "fastest", "default", "smallest"):
+        test_file = tmp_path / f"{compression}.xlsx"
+        write_excel(
+            sample_df,
+            str(test_file),
+            sheet_name="Data",
+            compression=compression,
+            **options,
+        )
+        expected = (
+            zipfile.ZIP_STORED if compression == "store" else zipfile.ZIP_DEFLATED
+        )
+        assert _compress_types(test_file) == {expected}
+        sheet = "Data_1" if options.get("split_sheets") else "Data"
+        pd.testing.assert_frame_equal(read_excel(str(test_file), sheet), sample_df)
+        sizes[compression] = test_file.stat().st_size
+
+    assert sizes["store"] > sizes["fastest"] >= sizes["default"] >= sizes["smallest"]
+
+
+def test_write_excel_rows_compression(tmp_path: Path):
+    """测试 write_excel_rows 的压缩配置。"""
+    test_file = tmp_path / "rows.xlsx"
+    write_excel_rows(
+        [(1, "a"), (2, "b")],
+        str(test_file),
+        columns=["id", "name"],
+        compression="store",
+    )
+    assert _compress_types(test_file) == {zipfile.ZIP_STORED}
+    assert read_excel(str(test_file))["name"].tolist() == ["a", "b"]
+
+
+def test_write_excel_append_compression(tmp_path: Path, sample_df: pd.DataFrame):
+    """测试追加模式只按配置压缩新写入的部件，复制的条目保持原样。"""
+    test_file = tmp_path / "append.xlsx"
+    write_excel(sample_df, str(test_file), sheet_name="One")
+    write_excel(
+        sample_df, str(test_file), sheet_name="Two", mode="a", compression="store"
+    )
+    with zipfile.ZipFile(test_file) as archive:
+        types = {info.filename: info.compress_type for info in archive.infolist()}
+    assert types["xl/worksheets/sheet1.xml"] == zipfile.ZIP_DEFLATED
+    assert types["xl/worksheets/sheet2.xml"] == zipfile.ZIP_STORED
+    pd.testing.assert_frame_equal(read_excel(str(test_file), "Two"), sample_df)
+
+
+def test_write_excel_compression_invalid(tmp_path: Path, sample_df: pd.DataFrame):
+    """测试无效的压缩配置与不支持压缩参数的引擎。"""
+    test_file = str(tmp_path / "out.xlsx")
+    with pytest.raises(ValueError, match="compression 必须为"):
+        write_excel(sample_df, test_file, compression="maximum")
+    with pytest.raises(ValueError, match="compression 必须为"):
+        write_excel_rows([(1,)], test_file, compression="maximum")
+    with pytest.raises(ValueError, match="不支持 compression"):
+        write_excel(
+            sample_df, str(tmp_path / "out.ods"), engine="odf", compression="store"
+        )
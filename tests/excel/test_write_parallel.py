@@ -0,0 +1,94 @@
+"""Excel 并行写入测试。"""
+
+import datetime
+import zipfile
+
+import pytest
+import pandas as pd
+from openpyxl import load_workbook
+from pathlib import Path
+
+from unifiles.excel import get_sheet_names, read_excel, write_excel
+
+
+def _frames() -> dict[str, pd.DataFrame]:
+    return {
+        f"Sheet {i}": pd.DataFrame(
+            {
+                "id": range(i * 10, i * 10 + 5),
+                "value": [0.5, None, 2.25, -1.0, 1e20],
+                "text": ["a", " 前导空格", "a&b<c>", None, "中文"],
+                "date": pd.date_range("2024-01-01", periods=5),
+                "flag": [True, False, True, True, False],
+            }
+        )
+        for i in range(5)
+    }
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_write_matches_default(tmp_path: Path, workers: int):
+    """测试并行写入的结果与默认写入方式读取后一致。"""
+    frames = _frames()
+    expected_file = tmp_path / "expected.xlsx"
+    parallel_file = tmp_path / "parallel.xlsx"
+    write_excel(frames, str(expected_file))
+    write_excel(frames, str(parallel_file), parallel=True, workers=workers)
+
+    assert get_sheet_names(str(parallel_file)) == list(frames)
+    for name in frames:
+        pd.testing.assert_frame_equal(
+            read_excel(str(parallel_file), name), read_excel(str(expected_file), name)
+        )
+
+
+def test_parallel_write_valid_package(tmp_path: Path):
+    """测试生成的文件结构完整，可被 openpyxl 打开，日期带数字格式。"""
+    test_file = tmp_path / "parallel.xlsx"
+    df = pd.DataFrame(
+        {
+            "when": [datetime.datetime(2024, 5, 6, 7, 8, 9)],
+            "day": [datetime.date(2024, 1, 2)],
+        }
+    )
+    write_excel({"A": df, "B": pd.DataFrame()}, str(test_file), parallel=True)
+
+    with zipfile.ZipFile(test_file) as archive:
+        assert archive.testzip() is None
+        assert {"xl/worksheets/sheet1.xml", "xl/worksheets/sheet2.xml"} <= set(
+            archive.namelist()
+        )
+    workbook = load_workbook(test_file)
+    assert workbook.sheetnames == ["A", "B"]
+    cell = workbook["A"]["A2"]
+    assert cell.value == datetime.datetime(2024, 5, 6, 7, 8, 9)
+    assert cell.is_date
+    assert workbook["A"]["B2"].is_date
+
+
+def test_parallel_write_single_dataframe(tmp_path: Path):
+    """测试并行写入单个 DataFrame 时使用 sheet_name。"""
+    test_file = tmp_path / "single.xlsx"
+    df = pd.DataFrame({"A": [1, 2, 3]})
+    write_excel(df, str(test_file), sheet_name="Data", parallel=True)
+    pd.testing.assert_frame_equal(read_excel(str(test_file), "Data"), df)
+
+
+def test_parallel_write_invalid(tmp_path: Path):
+    """测试并行写入的参数校验。"""
+    df = pd.DataFrame({"A": [1]})
+    test_file = str(tmp_path / "out.xlsx")
+    with pytest.raises(ValueError, match="仅支持 xlsx"):
+        write_excel(df, str(tmp_path / "out.ods"), parallel=True)
+    with pytest.raises(ValueError, match="split_sheets"):
+        write_excel(df, test_file, parallel=True, split_sheets=True)
+    with pytest.raises(ValueError, match="workers"):
+        write_excel(df, test_file, parallel=True, workers=0)
+    with pytest.raises(ValueError, match="不支持 xlsxwriter 引擎"):
+        write_excel(df, test_file, parallel=True, engine="xlsxwriter")
+    with pytest.raises(ValueError, match="工作表名称无效"):
+        write_excel({"a/b": df}, test_file, parallel=True)
+    with pytest.raises(ValueError, match="工作表名称重复"):
+        write_excel({"Data": df, "DATA": df}, test_file, parallel=True)
+    assert not Path(test_file).exists()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,178 @@
+"""Excel 流式写入测试。"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+from unifiles.excel import (
+    get_sheet_names,
+    read_excel,
+    read_excel_chunks,
+    write_excel,
+    write_excel_rows,
+)
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "int": [1, 2, None],
+            "str": ["a", None, "c"],
+            "date": [pd.Timestamp("2024-01-01"), pd.NaT, pd.Timestamp("2024-01-02")],
+            "bool": [True, False, True],
+            "float": [1.5, np.nan, 2.0],
+        }
+    )
+
+
+def test_write_excel_streaming_matches_default(tmp_path: Path, sample_df):
+    """测试流式写入与默认写入读回的数据一致（缺失值写为空单元格）。"""
+    default_file = tmp_path / "default.xlsx"
+    streaming_file = tmp_path / "streaming.xlsx"
+    write_excel(sample_df, str(default_file))
+    write_excel(sample_df, str(streaming_file), streaming=True)
+
+    pd.testing.assert_frame_equal(
+        read_excel(str(streaming_file)), read_excel(str(default_file))
+    )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"streaming": True}, {"parallel": True, "workers": 2}, {"mode": "a"}],
+)
+def test_write_excel_infinity_matches_default(tmp_path: Path, options):
+    """测试各写入方式对 ±inf 的处理与默认写入一致（写为文本 "inf" / "-inf"）。"""
+    df = pd.DataFrame(
+        {"float": [np.inf, -np.inf, 1.5], "object": [np.inf, "x", -np.inf]}
+    )
+    default_file = tmp_path / "default.xlsx"
+    test_file = tmp_path / "test.xlsx"
+    write_excel(df, str(default_file))
+    write_excel(pd.DataFrame({"A": [1]}), str(test_file), sheet_name="Other")
+    write_excel({"Sheet1": df, "Sheet2": df}, str(test_file), **options)
+
+    expected = read_excel(str(default_file))
+    assert expected["float"].tolist() == [np.inf, -np.inf, 1.5]
+    pd.testing.assert_frame_equal(read_excel(str(test_file), "Sheet1"), expected)
+
+
+@pytest.mark.parametrize(
+    "options", [{"streaming": True}, {"parallel": True}, {"mode": "a"}]
+)
+def test_write_excel_single_object_column(tmp_path: Path, options):
+    """测试只有一个 object 列的 DataFrame（转换时可能得到只读数组）。"""
+    df = pd.DataFrame({"text": ["a", None, np.inf]})
+    test_file = tmp_path / "test.xlsx"
+    write_excel(pd.DataFrame({"A": [1]}), str(test_file), sheet_name="Other")
+    write_excel(df, str(test_file), **options)
+    assert read_excel(str(test_file), "Sheet1")["text"].tolist()[::2] == ["a", "inf"]
+
+
+def test_write_excel_rows_infinity(tmp_path: Path):
+    """测试流式写入行数据时 ±inf 写为文本 "inf" / "-inf"。"""
+    test_file = tmp_path / "test.xlsx"
+    write_excel_rows(
+        [[np.inf, "x"], [float("-inf"), None]], str(test_file), columns=["A", "B"]
+    )
+    assert read_excel(str(test_file))["A"].tolist() == [np.inf, -np.inf]
+
+
+def test_write_excel_streaming_multiple_sheets(tmp_path: Path, sample_df):
+    """测试流式写入多个工作表。"""
+    test_file = tmp_path / "test.xlsx"
+    write_excel(
+        {"A": sample_df, "B": sample_df.head(1)}, str(test_file), streaming=True
+    )
+
+    assert len(read_excel(str(test_file), sheet_name="A")) == 3
+    assert len(read_excel(str(test_file), sheet_name="B")) == 1
+
+
+def test_write_excel_rows_sequences_and_dicts(tmp_path: Path):
+    """测试写入生成器产出的序列与字典。"""
+    test_file = tmp_path / "test.xlsx"
+    write_excel_rows(
+        ((i, f"Item {i}") for i in range(5)), str(test_file), columns=["id", "name"]
+    )
+    df = read_excel(str(test_file))
+    assert list(df.columns) == ["id", "name"]
+    assert df["id"].tolist() == list(range(5))
+
+    write_excel_rows(
+        [{"a": 1, "b": "x"}, {"b": "y", "a": 2}, {"a": 3}], str(test_file), "Data"
+    )
+    df = read_excel(str(test_file), sheet_name="Data")
+    assert df["a"].tolist() == [1, 2, 3]
+    assert df["b"].tolist()[:2] == ["x", "y"]
+
+
+def test_write_excel_rows_dataframe_chunks(tmp_path: Path, sample_df):
+    """测试边读边写：写入 read_excel_chunks 的分块，结果与原文件一致。"""
+    source = tmp_path / "source.xlsx"
+    target = tmp_path / "target.xlsx"
+    write_excel(sample_df, str(source))
+
+    write_excel_rows(read_excel_chunks(str(source), chunksize=2), str(target))
+    pd.testing.assert_frame_equal(read_excel(str(target)), read_excel(str(source)))
+
+
+def test_write_excel_rows_invalid_data(tmp_path: Path):
+    """测试无效的数据格式。"""
+    test_file = tmp_path / "test.xlsx"
+    with pytest.raises(ValueError, match="数据格式无效"):
+        write_excel_rows("abc", str(test_file))
+    with pytest.raises(ValueError, match="行数据格式无效"):
+        write_excel_rows([1, 2], str(test_file))
+
+
+def test_write_excel_split_sheets(tmp_path: Path):
+    """测试超过单个工作表上限时依次写入编号工作表，每个工作表都带表头。"""
+    test_file = tmp_path / "split.xlsx"
+    df = pd.DataFrame({"id": range(10), "name": [f"Item {i}" for i in range(10)]})
+    write_excel(df, str(test_file), "Data", split_sheets=True, max_rows_per_sheet=4)
+
+    assert get_sheet_names(str(test_file)) == ["Data_1", "Data_2", "Data_3", "Data_4"]
+    parts = [read_excel(str(test_file), sheet_name=f"Data_{i}") for i in range(1, 5)]
+    assert [len(part) for part in parts] == [3, 3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), df)
+
+    write_excel({"A": df.head(0)}, str(test_file), split_sheets=True)
+    assert get_sheet_names(str(test_file)) == ["A_1"]
+    assert list(read_excel(str(test_file)).columns) == ["id", "name"]
+
+
+def test_write_excel_rows_split_sheets(tmp_path: Path):
+    """测试行迭代器拆分写入：字典行重复表头，序列行不写表头。"""
+    test_file = tmp_path / "split.xlsx"
+    rows = ({"id": i, "value": i * 1.5} for i in range(7))
+    write_excel_rows(
+        rows, str(test_file), "Data", split_sheets=True, max_rows_per_sheet=3
+    )
+    assert get_sheet_names(str(test_file)) == ["Data_1", "Data_2", "Data_3", "Data_4"]
+    last = read_excel(str(test_file), sheet_name="Data_4")
+    assert last.to_dict("records") == [{"id": 6, "value": 9.0}]
+
+    write_excel_rows(
+        ((i,) for i in range(5)),
+        str(test_file),
+        split_sheets=True,
+        max_rows_per_sheet=2,
+    )
+    assert get_sheet_names(str(test_file)) == ["Sheet1_1", "Sheet1_2", "Sheet1_3"]
+
+
+def test_write_excel_row_limit(tmp_path: Path):
+    """测试超过 Excel 行数上限时在写入前报错，以及无效的拆分参数。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame({"A": np.zeros(1_048_576, dtype=np.int8)})
+    with pytest.raises(ValueError, match="split_sheets=True"):
+        write_excel(df, str(test_file), streaming=True)
+    assert not test_file.exists()
+
+    with pytest.raises(ValueError, match="max_rows_per_sheet"):
+        write_excel(df.head(), str(test_file), split_sheets=True, max_rows_per_sheet=1)
+    with pytest.raises(ValueError, match="max_rows_per_sheet"):
+        write_excel_rows([[1]], str(test_file), max_rows_per_sheet=2_000_000)
@@ -0,0 +1,180 @@
+"""磁盘缓存测试。"""
+
+import datetime
+import os
+import pickle
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from unifiles import clear_cache, configure_cache, read_excel, write_excel
+from unifiles import cache
+from unifiles.excel import read as excel_read
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path):
+    directory = tmp_path / "cache"
+    configure_cache(cache_dir=str(directory), max_size=cache.DEFAULT_MAX_SIZE)
+    yield directory
+    configure_cache(cache_dir="", max_size=cache.DEFAULT_MAX_SIZE)
+
+
+def _entries(directory: Path) -> list[Path]:
+    return sorted(directory.glob("*/*.npz"))
+
+
+def test_read_excel_cache_hit_skips_parsing(
+    tmp_path: Path, cache_dir: Path, monkeypatch
+):
+    """测试缓存命中时不再解析工作簿，结果与直接读取一致。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame(
+        {
+            "A": [1, 2, None],
+            "B": ["x", None, "z"],
+            "C": pd.date_range("2024", periods=3),
+        }
+    )
+    write_excel(df, str(test_file))
+
+    expected = read_excel(str(test_file))
+    pd.testing.assert_frame_equal(read_excel(str(test_file), cache=True), expected)
+    assert len(_entries(cache_dir)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("缓存命中时不应解析工作簿")
+
+    monkeypatch.setattr(excel_read, "cached_excel_file", fail)
+    pd.testing.assert_frame_equal(read_excel(str(test_file), cache=True), expected)
+
+
+def test_read_excel_cache_invalidated_on_change(tmp_path: Path, cache_dir: Path):
+    """测试源文件变化后不会命中旧的缓存条目。"""
+    test_file = tmp_path / "test.xlsx"
+    write_excel(pd.DataFrame({"A": [1]}), str(test_file))
+    assert read_excel(str(test_file), cache=True)["A"].tolist() == [1]
+
+    write_excel(pd.DataFrame({"A": [2, 3]}), str(test_file))
+    assert read_excel(str(test_file), cache=True)["A"].tolist() == [2, 3]
+    assert len(_entries(cache_dir)) == 2
+
+
+def test_read_excel_cache_keyed_by_library_versions(
+    tmp_path: Path, cache_dir: Path, monkeypatch
+):
+    """测试升级 pandas 或 openpyxl 后不会命中旧版本写入的缓存条目。"""
+    test_file = tmp_path / "test.xlsx"
+    write_excel(pd.DataFrame({"A": [1]}), str(test_file))
+    read_excel(str(test_file), cache=True)
+
+    monkeypatch.setattr(excel_read.pd, "__version__", "0.0.0")
+    read_excel(str(test_file), cache=True)
+    monkeypatch.setattr(excel_read.openpyxl, "__version__", "0.0.0")
+    read_excel(str(test_file), cache=True)
+    assert len(_entries(cache_dir)) == 3
+
+
+def test_read_excel_cache_mixed_columns(tmp_path: Path, cache_dir: Path, monkeypatch):
+    """测试含混合类型列、数字列名的工作表经缓存还原后与直接读取一致。"""
+    test_file = tmp_path / "test.xlsx"
+    df = pd.DataFrame(
+        {
+            "mixed": [1, "x", datetime.datetime(2024, 1, 2, 3, 4), None],
+            2024: [datetime.time(8, 30), 1.5, True, "y"],
+            "empty": [None, None, None, None],
+        }
+    )
+    write_excel(df, str(test_file))
+
+    expected = read_excel(str(test_file))
+    pd.testing.assert_frame_equal(read_excel(str(test_file), cache=True), expected)
+    assert len(_entries(cache_dir)) == 1
+    monkeypatch.setattr(excel_read, "cached_excel_file", None)
+    result = read_excel(str(test_file), cache=True)
+    pd.testing.assert_frame_equal(result, expected)
+    assert [type(value) for value in result["mixed"]] == [
+        type(value) for value in expected["mixed"]
+    ]
+
+
+class _Payload:
+    """反序列化时创建标记文件的对象。"""
+
+    def __init__(self, marker: Path) -> None:
+        self.marker = marker
+
+    def __reduce__(self):
+        return (self.marker.touch, ())
+
+
+def test_cache_entries_never_unpickled(tmp_path: Path, cache_dir: Path):
+    """测试缓存条目不使用 pickle：被替换为 pickle 数据的条目不会执行其中的代码。"""
+    test_file = tmp_path / "test.xlsx"
+    write_excel(pd.DataFrame({"A": [1, 2]}), str(test_file))
+    read_excel(str(test_file), cache=True)
+    (entry,) = _entries(cache_dir)
+    assert entry.parent.stat().st_mode & 0o777 == 0o700
+
+    marker = tmp_path / "executed"
+    entry.write_bytes(pickle.dumps(_Payload(marker)))
+    assert read_excel(str(test_file), cache=True)["A"].tolist() == [1, 2]
+    assert not marker.exists()
+
+
+def test_configure_cache_keeps_unspecified_options(tmp_path: Path, monkeypatch):
+    """测试 configure_cache 只修改传入的参数，空字符串恢复默认目录。"""
+    monkeypatch.delenv("UNIFILES_CACHE_DIR", raising=False)
+    configure_cache(cache_dir=str(tmp_path / "custom"))
+    configure_cache(max_size=1024)
+    assert cache.get_cache_dir() == tmp_path / "custom"
+    configure_cache(cache_dir="")
+    assert cache.get_cache_dir() == Path.home() / ".cache" / "unifiles"
+
+
+def test_content_hashes_bounded(tmp_path: Path, monkeypatch):
+    """测试进程内记住的内容哈希数量有上限。"""
+    monkeypatch.setattr(cache, "MAX_CONTENT_HASHES", 2)
+    monkeypatch.setattr(cache, "_content_hashes", cache.OrderedDict())
+    for i in range(4):
+        source = tmp_path / f"{i}.txt"
+        source.write_text(str(i))
+        cache.cache_key(str(source))
+    assert len(cache._content_hashes) == 2
+
+
+def test_cache_lru_eviction(tmp_path: Path, cache_dir: Path):
+    """测试超过大小上限时淘汰最久未使用的条目。"""
+    files = []
+    for i in range(3):
+        test_file = tmp_path / f"test{i}.xlsx"
+        write_excel(pd.DataFrame({"A": range(i, i + 50)}), str(test_file))
+        files.append(test_file)
+
+    read_excel(str(files[0]), cache=True)
+    (first,) = _entries(cache_dir)
+    read_excel(str(files[1]), cache=True)
+    (second,) = set(_entries(cache_dir)) - {first}
+    os.utime(first, (100, 100))
+    os.utime(second, (200, 200))
+    # 再次访问第一个条目，使第二个条目成为最久未使用
+    read_excel(str(files[0]), cache=True)
+
+    configure_cache(cache_dir=str(cache_dir), max_size=second.stat().st_size * 2)
+    read_excel(str(files[2]), cache=True)
+    remaining = _entries(cache_dir)
+    assert len(remaining) == 2
+    assert first in remaining
+    assert second not in remaining
+
+
+def test_clear_cache(tmp_path: Path, cache_dir: Path):
+    """测试清空缓存与无效的大小上限。"""
+    test_file = tmp_path / "test.xlsx"
+    write_excel(pd.DataFrame({"A": [1]}), str(test_file))
+    read_excel(str(test_file), cache=True)
+
+    clear_cache()
+    assert _entries(cache_dir) == []
+    with pytest.raises(ValueError, match="max_size"):
+        configure_cache(max_size=-1)
@@ -1,12 +1,15 @@
 """PDF 模块测试用例。"""
 
 import pytest
+import pandas as pd
 from pathlib import Path
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import TextStringObject
 from pypdf.generic import DictionaryObject, ArrayObject, NumberObject
+from pypdf.generic import DecodedStreamObject, NameObject
 
-from unifiles.pdf import extract_text, extract_tables
+from unifiles import cache, configure_cache, pdf
+from unifiles.pdf import extract_pdf, extract_text, extract_tables, iter_pdf_pages
 from unifiles.exceptions import FileReadError
 
 
@@ -29,6 +32,64 @@ def _create_simple_pdf(tmp_path: Path, filename: str, content: str) -> Path:
     return pdf_path
 
 
+def _create_text_pdf(tmp_path: Path, filename: str, pages: int) -> Path:
+    """创建每页带一行文本（"Page N text"）的 PDF 文件。"""
+    pdf_path = tmp_path / filename
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    for number in range(1, pages + 1):
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 72 720 Td (Page {number} text) Tj ET".encode())
+        page.replace_contents(stream)
+
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+    return pdf_path
+
+
+def _create_table_pdf(tmp_path: Path, filename: str, pages: int) -> Path:
+    """创建每页带标题和一个两列表格的 PDF 文件。"""
+    pdf_path = tmp_path / filename
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    rows = [("Name", "Age"), ("Alice", "30"), ("Bob", "25")]
+    for number in range(1, pages + 1):
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        cells = " ".join(
+            f"1 0 0 1 72 {700 - 20 * row} Tm ({left}) Tj "
+            f"1 0 0 1 300 {700 - 20 * row} Tm ({right}) Tj"
+            for row, (left, right) in enumerate(rows)
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(
+            f"BT /F1 12 Tf 1 0 0 1 72 740 Tm (Title {number}) Tj {cells} ET".encode()
+        )
+        page.replace_contents(stream)
+
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+    return pdf_path
+
+
 def test_extract_text_success(tmp_path: Path):
     """测试成功提取文本。"""
     # 创建一个简单的 PDF（使用 pypdf 创建空白页，然后手动添加文本对象比较复杂）
@@ -108,6 +169,211 @@ def test_extract_text_invalid_pdf(tmp_path: Path):
         extract_text(str(test_file))
 
 
+@pytest.mark.parametrize("workers", [2, 3])
+def test_extract_text_workers(tmp_path: Path, workers: int):
+    """测试多进程提取的结果与逐页提取完全相同。"""
+    pdf_path = _create_text_pdf(tmp_path, "text.pdf", 7)
+
+    serial = extract_text(str(pdf_path))
+    assert serial == "\n".join(f"Page {i} text" for i in range(1, 8))
+    assert extract_text(str(pdf_path), workers=workers) == serial
+    assert extract_text(
+        str(pdf_path), page_range=(2, 6), workers=workers
+    ) == extract_text(str(pdf_path), page_range=(2, 6))
+
+
+def test_extract_text_workers_validation(tmp_path: Path):
+    """测试 workers 与页码范围的校验。"""
+    pdf_path = _create_text_pdf(tmp_path, "text.pdf", 2)
+
+    with pytest.raises(ValueError, match="workers"):
+        extract_text(str(pdf_path), workers=0)
+    with pytest.raises(ValueError, match="页码范围无效"):
+        extract_text(str(pdf_path), page_range=(1, 5), workers=2)
+    # 只有一页时在当前进程中提取
+    assert extract_text(str(pdf_path), page_range=(2, 2), workers=4) == "Page 2 text"
+
+
+def test_iter_pdf_pages(tmp_path: Path):
+    """测试逐页产出 (页码, 文本)，结果与 extract_text 一致。"""
+    pdf_path = _create_text_pdf(tmp_path, "text.pdf", 5)
+
+    pages = list(iter_pdf_pages(str(pdf_path)))
+    assert pages == [(i, f"Page {i} text") for i in range(1, 6)]
+    assert "\n".join(text for _, text in pages) == extract_text(str(pdf_path))
+    assert list(iter_pdf_pages(str(pdf_path), page_range=(2, 3))) == [
+        (2, "Page 2 text"),
+        (3, "Page 3 text"),
+    ]
+
+    # 提前停止迭代
+    iterator = iter_pdf_pages(str(pdf_path))
+    assert next(iterator) == (1, "Page 1 text")
+    iterator.close()
+
+
+def test_iter_pdf_pages_errors(tmp_path: Path):
+    """测试文件不存在时立即报错，页码范围与文件内容的错误在迭代时抛出。"""
+    with pytest.raises(FileNotFoundError, match="文件不存在"):
+        iter_pdf_pages("nonexistent.pdf")
+
+    pdf_path = _create_text_pdf(tmp_path, "text.pdf", 2)
+    iterator = iter_pdf_pages(str(pdf_path), page_range=(2, 5))
+    with pytest.raises(ValueError, match="页码范围无效"):
+        next(iterator)
+
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("这不是 PDF 文件")
+    with pytest.raises(FileReadError):
+        list(iter_pdf_pages(str(test_file)))
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path):
+    directory = tmp_path / "cache"
+    configure_cache(cache_dir=str(directory), max_size=cache.DEFAULT_MAX_SIZE)
+    yield directory
+    configure_cache(cache_dir="", max_size=cache.DEFAULT_MAX_SIZE)
+
+
+@pytest.fixture
+def page_calls(monkeypatch) -> list[tuple[str, str]]:
+    """记录实际由 pypdf 提取的页面（提取方式, 页面文本）。"""
+    calls: list[tuple[str, str]] = []
+    original = pdf._page_text
+
+    def counting(page, mode):
+        text = original(page, mode)
+        calls.append((mode, text.strip()))
+        return text
+
+    monkeypatch.setattr(pdf, "_page_text", counting)
+    return calls
+
+
+def test_extract_text_cache_reuses_pages(
+    tmp_path: Path, cache_dir: Path, page_calls: list
+):
+    """测试缓存命中的页面不再提取，部分页码范围只提取缺失的页面。"""
+    pdf_path = _create_text_pdf(tmp_path, "text.pdf", 5)
+    expected = extract_text(str(pdf_path))
+    page_calls.clear()
+
+    assert extract_text(str(pdf_path), page_range=(2, 3), cache=True) == (
+        "Page 2 text\nPage 3 text"
+    )
+    assert len(page_calls) == 2
+    page_calls.clear()
+
+    assert extract_text(str(pdf_path), cache=True) == expected
+    assert [text for _, text in page_calls] == [
+        "Page 1 text",
+        "Page 4 text",
+        "Page 5 text",
+    ]
+    page_calls.clear()
+
+    assert extract_text(str(pdf_path), cache=True) == expected
+    assert page_calls == []
+    # 多进程提取同样读取缓存
+    assert extract_text(str(pdf_path), workers=2, cache=True) == expected
+
+
+def test_pdf_cache_keyed_by_mode_and_content(
+    tmp_path: Path, cache_dir: Path, page_calls: list
+):
+    """测试文本与表格的缓存互不影响，文件变化后重新提取。"""
+    pdf_path = _create_text_pdf(tmp_path, "text.pdf", 2)
+    extract_text(str(pdf_path), cache=True)
+    page_calls.clear()
+
+    assert extract_tables(str(pdf_path), cache=True) == []
+    assert [mode for mode, _ in page_calls] == ["layout", "layout"]
+    page_calls.clear()
+    extract_tables(str(pdf_path), cache=True)
+    assert page_calls == []
+
+    _create_text_pdf(tmp_path, "text.pdf", 3)
+    assert extract_text(str(pdf_path), cache=True).endswith("Page 3 text")
+    assert len(page_calls) == 3
+
+
+def test_pdf_cache_size_limit(tmp_path: Path, cache_dir: Path):
+    """测试页面缓存受总大小上限约束。"""
+    configure_cache(cache_dir=str(cache_dir), max_size=0)
+    pdf_path = _create_text_pdf(tmp_path, "text.pdf", 3)
+
+    assert extract_text(str(pdf_path), cache=True).startswith("Page 1 text")
+    assert list(cache_dir.glob("*/*.npz")) == []
+
+
+def test_extract_pdf_matches_separate_calls(tmp_path: Path, page_calls: list):
+    """测试 text_mode="plain" 时结果与分别调用 extract_text、extract_tables 相同。"""
+    pdf_path = _create_table_pdf(tmp_path, "table.pdf", 3)
+    text = extract_text(str(pdf_path), page_range=(2, 3))
+    tables = extract_tables(str(pdf_path), page_range=(2, 3))
+    page_calls.clear()
+
+    result = extract_pdf(str(pdf_path), page_range=(2, 3), text_mode="plain")
+    assert result["text"] == text
+    assert len(result["tables"]) == len(tables) == 2
+    for actual, expected in zip(result["tables"], tables):
+        pd.testing.assert_frame_equal(actual, expected)
+    # 每页依次完成普通模式与布局模式的提取
+    assert [mode for mode, _ in page_calls] == ["text", "layout"] * 2
+
+    assert extract_pdf(str(pdf_path), tables=False, text_mode="plain") == {
+        "text": extract_text(str(pdf_path))
+    }
+    assert list(extract_pdf(str(pdf_path), text=False)) == ["tables"]
+
+
+def test_extract_pdf_layout_text_single_pass(tmp_path: Path, page_calls: list):
+    """测试默认的 text_mode="layout" 时文本与表格取自同一次布局提取。"""
+    pdf_path = _create_table_pdf(tmp_path, "table.pdf", 2)
+    page_calls.clear()
+
+    result = extract_pdf(str(pdf_path))
+    assert [mode for mode, _ in page_calls] == ["layout", "layout"]
+    assert "Title 1" in result["text"] and "Title 2" in result["text"]
+    assert len(result["tables"]) == 2
+    assert list(result["tables"][0].columns) == ["Name", "Age"]
+
+    parallel = extract_pdf(str(pdf_path), workers=2)
+    assert parallel["text"] == result["text"]
+    for actual, expected in zip(parallel["tables"], result["tables"]):
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_extract_pdf_shares_page_cache(
+    tmp_path: Path, cache_dir: Path, page_calls: list
+):
+    """测试与 extract_text、extract_tables 共用每页的缓存条目。"""
+    pdf_path = _create_table_pdf(tmp_path, "table.pdf", 2)
+    extract_text(str(pdf_path), cache=True)
+    page_calls.clear()
+
+    result = extract_pdf(str(pdf_path), cache=True, text_mode="plain")
+    assert [mode for mode, _ in page_calls] == ["layout", "layout"]
+    page_calls.clear()
+    extract_tables(str(pdf_path), cache=True)
+    assert page_calls == []
+    assert result["text"] == extract_text(str(pdf_path))
+
+
+def test_extract_pdf_validation(tmp_path: Path):
+    """测试参数校验。"""
+    pdf_path = _create_table_pdf(tmp_path, "table.pdf", 1)
+    with pytest.raises(FileNotFoundError, match="文件不存在"):
+        extract_pdf("nonexistent.pdf")
+    with pytest.raises(ValueError, match="至少需要一个"):
+        extract_pdf(str(pdf_path), text=False, tables=False)
+    with pytest.raises(ValueError, match="text_mode"):
+        extract_pdf(str(pdf_path), text_mode="raw")
+    with pytest.raises(ValueError, match="页码范围无效"):
+        extract_pdf(str(pdf_path), page_range=(1, 2))
+
+
 def test_extract_tables_success(tmp_path: Path):
     """测试基础表格提取。"""
     # 创建包含表格的 PDF（使用简单的文本布局）
@@ -178,3 +444,135 @@ def test_extract_tables_page_range_validation(tmp_path: Path):
 
     with pytest.raises(ValueError, match="页码范围无效"):
         extract_tables(str(pdf_path), page_range=(2, 1))
+
+
+def _create_grid_pdf(tmp_path: Path, filename: str, cells: list[str]) -> Path:
+    """创建单页 PDF，cells 为 "x y 文本" 形式的文本片段。
+
+    每个片段一个 Tj 操作；文本以 "[" 开头时按 TJ 数组原样写入。
+    """
+    pdf_path = tmp_path / filename
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    page = writer.add_blank_page(width=612, height=792)
+    page[NameObject("/Resources")] = DictionaryObject(
+        {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+    )
+    operations = " ".join(
+        (
+            f"1 0 0 1 {x} {y} Tm {text} TJ"
+            if text.startswith("[")
+            else f"1 0 0 1 {x} {y} Tm ({text}) Tj"
+        )
+        for x, y, text in (cell.split(" ", 2) for cell in cells)
+    )
+    stream = DecodedStreamObject()
+    stream.set_data(f"BT /F1 12 Tf {operations} ET".encode())
+    page.replace_contents(stream)
+
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+    return pdf_path
+
+
+def test_extract_tables_coordinates_matches_layout(tmp_path: Path):
+    """测试坐标引擎对简单表格的结果与布局引擎相同。"""
+    pdf_path = _create_table_pdf(tmp_path, "table.pdf", 2)
+    tables = extract_tables(str(pdf_path), engine="coordinates")
+    expected = extract_tables(str(pdf_path))
+    assert len(tables) == len(expected) == 2
+    for actual, table in zip(tables, expected):
+        pd.testing.assert_frame_equal(actual, table)
+
+    blank_path = tmp_path / "blank.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=612, height=792)
+    with open(blank_path, "wb") as f:
+        writer.write(f)
+    assert extract_tables(str(blank_path), engine="coordinates") == []
+
+
+def test_extract_tables_coordinates_alignment(tmp_path: Path):
+    """测试坐标引擎按位置对齐列：空单元格、由多个片段组成的单元格、右对齐的数字。"""
+    pdf_path = _create_grid_pdf(
+        tmp_path,
+        "grid.pdf",
+        [
+            "72 740 Report",
+            "72 700 Name",
+            "200 700 Dept",
+            "392 700 Age",
+            "72 680 Alice",
+            "400 680 30",
+            "72 660 Bob",
+            "93 660 Smith",
+            "200 660 R&D",
+            "394 660 100",
+        ],
+    )
+    table = extract_tables(str(pdf_path), engine="coordinates")[0]
+    assert list(table.columns) == ["Name", "Dept", "Age"]
+    assert table["Name"].tolist() == ["Alice", "Bob Smith"]
+    assert table["Dept"].isna().tolist() == [True, False]
+    assert table["Age"].tolist() == ["30", "100"]
+
+
+def test_page_runs_splits_merged_line(tmp_path: Path):
+    """测试同一行中被 pypdf 合并的文本按各个 Tj/TJ 操作切回，并保留各自的坐标。"""
+    pdf_path = _create_grid_pdf(
+        tmp_path,
+        "runs.pdf",
+        [
+            "72 700 Name",
+            "200 700 [(Al) -20 (ice)]",
+            "300 700 [(R) -2000 (D)]",
+            "400 700 30",
+        ],
+    )
+    page = PdfReader(str(pdf_path)).pages[0]
+    runs = pdf._page_runs(page)
+    assert [(x, y, text) for x, y, _, text in runs] == [
+        (72.0, 700.0, "Name"),
+        (200.0, 700.0, "Alice"),
+        (300.0, 700.0, "R D"),
+        (400.0, 700.0, "30"),
+    ]
+    assert all(size == 12.0 for _, _, size, _ in runs)
+
+
+def test_extract_tables_coordinates_cache(tmp_path: Path, cache_dir: Path, monkeypatch):
+    """测试坐标引擎缓存每页的文本片段，并可在 extract_pdf 中使用。"""
+    pdf_path = _create_table_pdf(tmp_path, "table.pdf", 2)
+    calls: list[int] = []
+    page_runs = pdf._page_runs
+
+    def record(page):
+        calls.append(1)
+        return page_runs(page)
+
+    monkeypatch.setattr(pdf, "_page_runs", record)
+    tables = extract_tables(str(pdf_path), cache=True, engine="coordinates")
+    assert len(calls) == 2
+
+    result = extract_pdf(
+        str(pdf_path), cache=True, text_mode="plain", engine="coordinates"
+    )
+    assert len(calls) == 2
+    assert result["text"] == extract_text(str(pdf_path))
+    for actual, expected in zip(result["tables"], tables):
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_extract_tables_engine_validation(tmp_path: Path):
+    """测试无效的表格识别引擎。"""
+    pdf_path = _create_table_pdf(tmp_path, "table.pdf", 1)
+    with pytest.raises(ValueError, match="engine"):
+        extract_tables(str(pdf_path), engine="pdfplumber")
+    with pytest.raises(ValueError, match="engine"):
+        extract_pdf(str(pdf_path), engine="pdfplumber")
@@ -3,15 +3,29 @@
 验证各模块的性能指标是否符合要求。
 """
 
+import os
 import time
+import tracemalloc
 import pytest
 import pandas as pd
 import sqlite3
 from pathlib import Path
 from docx import Document
 from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
 
-from unifiles import read_excel, write_excel, read_docx, query, extract_text
+from unifiles import (
+    configure_cache,
+    excel_to_sqlite,
+    extract_pdf,
+    extract_tables,
+    extract_text,
+    query,
+    read_docx,
+    read_excel,
+    write_docx,
+    write_excel,
+)
 
 
 def test_excel_read_performance(tmp_path: Path):
@@ -36,6 +50,215 @@ def test_excel_read_performance(tmp_path: Path):
     assert elapsed_time < 1.0, f"Excel 读取耗时 {elapsed_time:.2f} 秒，超过 1 秒限制"
 
 
+@pytest.mark.slow
+def test_excel_streaming_write_benchmark(tmp_path: Path):
+    """对比默认写入与流式写入的耗时和峰值内存（2 万行，运行较慢）。"""
+    rows = 20_000
+    df = pd.DataFrame(
+        {
+            "A": range(rows),
+            "B": [f"Item {i}" for i in range(rows)],
+            "C": [i * 1.5 for i in range(rows)],
+        }
+    )
+
+    results = {}
+    for streaming in (False, True):
+        output = tmp_path / f"streaming_{streaming}.xlsx"
+        tracemalloc.start()
+        start_time = time.time()
+        write_excel(df, str(output), streaming=streaming)
+        elapsed_time = time.time() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[streaming] = (elapsed_time, peak)
+        print(
+            f"streaming={streaming}: {elapsed_time:.2f} 秒, "
+            f"峰值内存 {peak / 1024 / 1024:.1f} MB"
+        )
+
+    assert len(read_excel(str(tmp_path / "streaming_True.xlsx"))) == rows
+    # 流式写入不为每个单元格保留对象，峰值内存应明显低于默认写入
+    assert results[True][1] < results[False][1] / 2
+
+
+@pytest.mark.slow
+def test_excel_native_engine_benchmark(tmp_path: Path):
+    """对比 openpyxl 引擎与原生引擎读取大工作表的耗时（5 万行，运行较慢）。"""
+    rows = 50_000
+    excel_file = tmp_path / "large.xlsx"
+    df = pd.DataFrame(
+        {
+            "A": range(rows),
+            "B": [f"Item {i % 1000}" for i in range(rows)],
+            "C": [i * 1.5 for i in range(rows)],
+            "D": pd.date_range("2024-01-01", periods=rows, freq="min"),
+        }
+    )
+    write_excel(df, str(excel_file), streaming=True)
+
+    timings = {}
+    results = {}
+    for engine in ("openpyxl", "native"):
+        start_time = time.time()
+        results[engine] = read_excel(str(excel_file), engine=engine)
+        timings[engine] = time.time() - start_time
+        print(f"engine={engine}: {timings[engine]:.2f} 秒")
+
+    pd.testing.assert_frame_equal(results["native"], results["openpyxl"])
+    assert timings["native"] < timings["openpyxl"]
+
+
+@pytest.mark.slow
+def test_excel_compact_dtypes_benchmark(tmp_path: Path):
+    """对比 compact=True 前后 DataFrame 的内存占用（5 万行低基数字符串，运行较慢）。"""
+    rows = 50_000
+    excel_file = tmp_path / "status.xlsx"
+    df = pd.DataFrame(
+        {
+            "id": range(rows),
+            "status": [("open", "closed", "pending")[i % 3] for i in range(rows)],
+            "region": [f"Region {i % 12}" for i in range(rows)],
+            "score": [i % 100 for i in range(rows)],
+        }
+    )
+    write_excel(df, str(excel_file), streaming=True)
+
+    default = read_excel(str(excel_file), engine="native")
+    compact = read_excel(str(excel_file), engine="native", compact=True)
+    before = default.memory_usage(deep=True).sum()
+    after = compact.memory_usage(deep=True).sum()
+    print(
+        f"compact=False: {before / 1024 / 1024:.1f} MB, "
+        f"compact=True: {after / 1024 / 1024:.1f} MB"
+    )
+
+    assert compact["status"].dtype == "category"
+    assert compact.astype(object).equals(default.astype(object))
+    assert after < before / 4
+
+
+@pytest.mark.slow
+def test_excel_to_sqlite_benchmark(tmp_path: Path):
+    """对比 read_excel + to_sql 与 excel_to_sqlite 的峰值内存（5 万行，运行较慢）。"""
+    rows = 50_000
+    excel_file = tmp_path / "orders.xlsx"
+    df = pd.DataFrame(
+        {
+            "id": range(rows),
+            "customer": [f"Customer {i % 500}" for i in range(rows)],
+            "amount": [i * 1.5 for i in range(rows)],
+        }
+    )
+    write_excel(df, str(excel_file), streaming=True)
+
+    peaks = {}
+    for loader in ("pandas", "excel_to_sqlite"):
+        db_path = tmp_path / f"{loader}.db"
+        tracemalloc.start()
+        start_time = time.time()
+        if loader == "pandas":
+            with sqlite3.connect(db_path) as conn:
+                read_excel(str(excel_file)).to_sql("orders", conn, index=False)
+            conn.close()
+        else:
+            excel_to_sqlite(str(excel_file), str(db_path), "orders")
+        elapsed_time = time.time() - start_time
+        _, peaks[loader] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{loader}: {elapsed_time:.2f} 秒, "
+            f"峰值内存 {peaks[loader] / 1024 / 1024:.1f} MB"
+        )
+
+    result = query(
+        str(tmp_path / "excel_to_sqlite.db"), "SELECT COUNT(*) AS n FROM orders"
+    )
+    assert result["n"][0] == rows
+    assert peaks["excel_to_sqlite"] < peaks["pandas"] / 2
+
+
+@pytest.mark.slow
+def test_excel_parallel_write_benchmark(tmp_path: Path):
+    """对比并行写入时单个与多个工作进程的耗时（8 个工作表 × 1 万行，运行较慢）。
+
+    两次写入使用相同的写入方式，只改变 workers，因此只衡量多进程带来的收益。
+    """
+    workers = min(8, os.cpu_count() or 1)
+    if workers < 2:
+        pytest.skip("需要至少 2 个 CPU 核")
+    rows = 10_000
+    frames = {
+        f"Region {i}": pd.DataFrame(
+            {
+                "id": range(rows),
+                "name": [f"Item {j}" for j in range(rows)],
+                "amount": [j * 1.5 for j in range(rows)],
+            }
+        )
+        for i in range(8)
+    }
+
+    timings = {}
+    for count in (1, workers):
+        output = tmp_path / f"workers_{count}.xlsx"
+        start_time = time.time()
+        write_excel(frames, str(output), parallel=True, workers=count)
+        timings[count] = time.time() - start_time
+        print(f"workers={count}: {timings[count]:.2f} 秒")
+
+    for name in ("Region 0", "Region 7"):
+        pd.testing.assert_frame_equal(
+            read_excel(str(tmp_path / f"workers_{workers}.xlsx"), name),
+            read_excel(str(tmp_path / "workers_1.xlsx"), name),
+        )
+    assert timings[workers] < timings[1]
+
+
+@pytest.mark.slow
+def test_zip_compression_profiles_benchmark(tmp_path: Path):
+    """对比各压缩配置下 xlsx/docx 的写入耗时与文件大小（运行较慢）。"""
+    rows = 50_000
+    df = pd.DataFrame(
+        {
+            "id": range(rows),
+            "name": [f"Item {i % 1000}" for i in range(rows)],
+            "amount": [i * 1.5 for i in range(rows)],
+        }
+    )
+    content = "\n".join(f"第 {i} 段：统一的文件操作库。" for i in range(5000))
+
+    sizes = {}
+    timings = {}
+    for compression in ("store", "fastest", "default", "smallest"):
+        for kind in ("xlsx", "docx"):
+            output = tmp_path / f"{compression}.{kind}"
+            # 取 3 次中的最短耗时，减少偶然波动
+            elapsed_times = []
+            for _ in range(3):
+                start_time = time.time()
+                if kind == "xlsx":
+                    write_excel(
+                        df, str(output), streaming=True, compression=compression
+                    )
+                else:
+                    write_docx(content, str(output), compression=compression)
+                elapsed_times.append(time.time() - start_time)
+            timings[compression, kind] = min(elapsed_times)
+            sizes[compression, kind] = output.stat().st_size
+            print(
+                f"{kind} compression={compression}: "
+                f"{timings[compression, kind]:.2f} 秒, "
+                f"{sizes[compression, kind] / 1024:.0f} KB"
+            )
+
+    for kind in ("xlsx", "docx"):
+        assert sizes["store", kind] > sizes["fastest", kind]
+        assert sizes["smallest", kind] <= sizes["fastest", kind]
+    # 耗时主要花在生成 XML 上，压缩级别的差异在波动范围内，这里只报告耗时；
+    # "fastest" 的压缩工作量由 tests/word 中的测试检查
+
+
 def test_pdf_text_extraction_performance(tmp_path: Path):
     """测试 PDF 文本提取性能（10页 < 2秒）。"""
     # 创建包含 10 页的 PDF
@@ -57,6 +280,147 @@ def test_pdf_text_extraction_performance(tmp_path: Path):
     assert elapsed_time < 2.0, f"PDF 文本提取耗时 {elapsed_time:.2f} 秒，超过 2 秒限制"
 
 
+def _write_text_pdf(pdf_file: Path, pages: int) -> None:
+    """生成每页 50 行文本的 PDF。"""
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    for number in range(pages):
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        lines = " ".join(
+            f"1 0 0 1 72 {760 - 14 * line} Tm (Page {number} line {line}) Tj"
+            for line in range(50)
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 10 Tf {lines} ET".encode())
+        page.replace_contents(stream)
+    with open(pdf_file, "wb") as f:
+        writer.write(f)
+
+
+@pytest.mark.slow
+def test_pdf_parallel_text_extraction_benchmark(tmp_path: Path):
+    """对比逐页提取与多进程提取 PDF 文本的耗时（300 页，运行较慢）。"""
+    pdf_file = tmp_path / "report.pdf"
+    _write_text_pdf(pdf_file, 300)
+
+    workers = os.cpu_count() or 1
+    results = {}
+    timings = {}
+    for count in (1, workers):
+        start_time = time.time()
+        results[count] = extract_text(str(pdf_file), workers=count)
+        timings[count] = time.time() - start_time
+        print(f"workers={count}: {timings[count]:.2f} 秒")
+
+    assert results[workers] == results[1]
+    if workers >= 4:
+        assert timings[workers] < timings[1] / 2
+
+
+@pytest.mark.slow
+def test_pdf_page_cache_benchmark(tmp_path: Path):
+    """对比不使用缓存、缓存部分页面与全部命中时提取 PDF 文本的耗时（300 页）。"""
+    pdf_file = tmp_path / "report.pdf"
+    _write_text_pdf(pdf_file, 300)
+    configure_cache(cache_dir=str(tmp_path / "cache"))
+
+    try:
+        timings = {}
+        start_time = time.time()
+        expected = extract_text(str(pdf_file))
+        timings["uncached"] = time.time() - start_time
+        # 先缓存前一半页面，再提取全文（只提取后一半）
+        extract_text(str(pdf_file), page_range=(1, 150), cache=True)
+        for label in ("half cached", "cached"):
+            start_time = time.time()
+            result = extract_text(str(pdf_file), cache=True)
+            timings[label] = time.time() - start_time
+            assert result == expected
+        for label, elapsed_time in timings.items():
+            print(f"{label}: {elapsed_time:.2f} 秒")
+    finally:
+        configure_cache()
+
+    assert timings["cached"] < timings["uncached"] / 5
+    assert timings["half cached"] < timings["uncached"]
+
+
+@pytest.mark.slow
+def test_pdf_combined_extraction_benchmark(tmp_path: Path):
+    """对比分别提取文本与表格、extract_pdf 默认一次遍历的耗时（200 页，运行较慢）。"""
+    pdf_file = tmp_path / "report.pdf"
+    _write_text_pdf(pdf_file, 200)
+
+    timings = {}
+    start_time = time.time()
+    text = extract_text(str(pdf_file))
+    tables = extract_tables(str(pdf_file))
+    timings["separate"] = time.time() - start_time
+    for text_mode in ("layout", "plain"):
+        start_time = time.time()
+        result = extract_pdf(str(pdf_file), text_mode=text_mode)
+        timings[text_mode] = time.time() - start_time
+        assert len(result["tables"]) == len(tables)
+        if text_mode == "plain":
+            assert result["text"] == text
+    for label, elapsed_time in timings.items():
+        print(f"{label}: {elapsed_time:.2f} 秒")
+
+    # 只有默认的 text_mode="layout" 每页只提取一次；"plain" 与分别调用相近，只报告耗时
+    assert timings["layout"] < timings["separate"]
+
+
+@pytest.mark.slow
+def test_pdf_table_engine_benchmark(tmp_path: Path):
+    """报告布局引擎与坐标引擎识别表格的耗时并校验结果一致（100 页，每页 50 行 6 列，运行较慢）。"""
+    pdf_file = tmp_path / "tables.pdf"
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    for number in range(100):
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        cells = " ".join(
+            f"1 0 0 1 {40 + 90 * column} {760 - 14 * row} Tm (R{number}-{row}-{column}) Tj"
+            for row in range(50)
+            for column in range(6)
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 10 Tf {cells} ET".encode())
+        page.replace_contents(stream)
+    with open(pdf_file, "wb") as f:
+        writer.write(f)
+
+    results = {}
+    timings = {}
+    for engine in ("layout", "coordinates"):
+        start_time = time.time()
+        results[engine] = extract_tables(str(pdf_file), engine=engine)
+        timings[engine] = time.time() - start_time
+        print(f"engine={engine}: {timings[engine]:.2f} 秒")
+
+    assert len(results["coordinates"]) == 100
+    for actual, expected in zip(results["coordinates"], results["layout"]):
+        pd.testing.assert_frame_equal(actual, expected)
+    # 坐标引擎依赖的普通模式提取比布局模式慢，这里只报告耗时，不比较快慢
+
+
 def test_word_read_performance(tmp_path: Path):
     """测试 Word 文档读取性能（普通文档 < 0.5秒）。"""
     # 创建 Word 文档
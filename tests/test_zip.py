@@ -0,0 +1,102 @@
+"""zip 条目复制测试。"""
+
+import io
+import zipfile
+
+import pytest
+from pathlib import Path
+
+from unifiles import _zip
+
+
+class _Unseekable(io.RawIOBase):
+    """只能顺序写入的流：ZipFile 写入时会使用数据描述符。"""
+
+    def __init__(self) -> None:
+        self.buffer = io.BytesIO()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self.buffer.write(data)
+
+
+@pytest.fixture
+def source_file(tmp_path: Path) -> Path:
+    source = tmp_path / "source.zip"
+    with zipfile.ZipFile(source, "w") as archive:
+        archive.writestr("stored.txt", b"stored " * 100)
+        archive.writestr(
+            "deflated.xml", b"<a>" * 5000, compress_type=zipfile.ZIP_DEFLATED
+        )
+    # 追加一个带数据描述符的条目
+    stream = _Unseekable()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as archive:
+        with archive.open("descriptor.bin", "w") as entry:
+            entry.write(bytes(range(256)) * 40)
+    descriptor = tmp_path / "descriptor.zip"
+    descriptor.write_bytes(stream.buffer.getvalue())
+    with (
+        zipfile.ZipFile(descriptor) as extra,
+        zipfile.ZipFile(source, "a") as archive,
+    ):
+        info = extra.getinfo("descriptor.bin")
+        assert info.flag_bits & 0x08
+        with open(descriptor, "rb") as raw:
+            _zip.copy_raw(extra, raw, info, archive)
+    return source
+
+
+def _copy_all(source_file: Path, target_file: Path) -> None:
+    with (
+        zipfile.ZipFile(source_file) as source,
+        open(source_file, "rb") as raw_source,
+        zipfile.ZipFile(
+            target_file, "w", zipfile.ZIP_DEFLATED, compresslevel=9
+        ) as target,
+    ):
+        target.writestr("new.txt", b"written before the copies")
+        for info in source.infolist():
+            _zip.copy_raw(source, raw_source, info, target)
+        target.writestr("last.txt", b"written after the copies")
+
+
+def test_copy_raw_keeps_compressed_bytes(source_file: Path, tmp_path: Path):
+    """测试按原始字节复制：内容、压缩方式与压缩后大小不变，数据描述符被去除。"""
+    target_file = tmp_path / "target.zip"
+    _copy_all(source_file, target_file)
+
+    with zipfile.ZipFile(source_file) as source, zipfile.ZipFile(target_file) as target:
+        assert target.testzip() is None
+        assert target.namelist() == [
+            "new.txt",
+            "stored.txt",
+            "deflated.xml",
+            "descriptor.bin",
+            "last.txt",
+        ]
+        for info in source.infolist():
+            copied = target.getinfo(info.filename)
+            assert target.read(copied) == source.read(info)
+            assert copied.compress_type == info.compress_type
+            assert copied.compress_size == info.compress_size
+            assert not copied.flag_bits & 0x08
+
+
+def test_copy_raw_falls_back_to_public_api(
+    source_file: Path, tmp_path: Path, monkeypatch
+):
+    """测试 ZipFile 缺少所需的内部属性时解压后重新写入，结果相同。"""
+    monkeypatch.setattr(
+        _zip, "_RAW_COPY_ATTRIBUTES", (*_zip._RAW_COPY_ATTRIBUTES, "_missing")
+    )
+    target_file = tmp_path / "target.zip"
+    _copy_all(source_file, target_file)
+
+    with zipfile.ZipFile(source_file) as source, zipfile.ZipFile(target_file) as target:
+        assert target.testzip() is None
+        for info in source.infolist():
+            copied = target.getinfo(info.filename)
+            assert target.read(copied) == source.read(info)
+            assert copied.compress_type == info.compress_type
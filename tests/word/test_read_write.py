@@ -1,11 +1,13 @@
 """read_docx 和 write_docx 测试。"""
 
+import zipfile
+import zlib
 from pathlib import Path
 
 import pytest
 from docx import Document
 
-from unifiles.word import read_docx, write_docx
+from unifiles.word import extract_text_docx, read_docx, write_docx
 from unifiles.exceptions import FileReadError
 
 
@@ -131,3 +133,44 @@ def test_write_docx_multiline_content(tmp_path: Path):
     result = read_docx(str(test_file))
     lines = result.split("\n")
     assert len(lines) >= 3
+
+
+@pytest.mark.parametrize(
+    "compression, compress_type",
+    [("store", zipfile.ZIP_STORED), ("fastest", zipfile.ZIP_DEFLATED)],
+)
+def test_write_docx_compression(tmp_path: Path, compression: str, compress_type: int):
+    """测试按压缩配置写入，文档内容不变。"""
+    test_file = tmp_path / "output.docx"
+    write_docx("压缩配置测试", str(test_file), title="标题", compression=compression)
+
+    with zipfile.ZipFile(test_file) as archive:
+        assert archive.testzip() is None
+        assert {info.compress_type for info in archive.infolist()} == {compress_type}
+    assert "压缩配置测试" in extract_text_docx(str(test_file))
+
+    with pytest.raises(ValueError, match="compression"):
+        write_docx("内容", str(test_file), compression="maximum")
+
+
+def test_write_docx_fastest_compresses_once(tmp_path: Path, monkeypatch):
+    """测试 "fastest" 每个部件只按级别 1 压缩一次，压缩工作量不多于默认配置。"""
+    levels: list[int] = []
+    compressobj = zlib.compressobj
+
+    def record(level=-1, *args):
+        levels.append(level)
+        return compressobj(level, *args)
+
+    monkeypatch.setattr(zlib, "compressobj", record)
+    default_file = tmp_path / "default.docx"
+    write_docx("压缩配置测试", str(default_file))
+    default_levels = list(levels)
+    levels.clear()
+    fastest_file = tmp_path / "fastest.docx"
+    write_docx("压缩配置测试", str(fastest_file), compression="fastest")
+
+    with zipfile.ZipFile(fastest_file) as archive:
+        assert len(levels) == len(archive.infolist())
+    assert set(levels) == {1}
+    assert len(levels) <= len(default_levels)